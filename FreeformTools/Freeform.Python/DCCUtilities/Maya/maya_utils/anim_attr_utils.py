@@ -18,6 +18,7 @@ If not, see <https://www.gnu.org/licenses/>.
 '''
 
 import pymel.core as pm
+import maya.cmds as cmds
 
 import v1_math
 
@@ -78,6 +79,27 @@ def set_attr_key(obj, attr_name, a_value):
         pm.setKeyframe(obj, at=attr_name, v=a_value)
 
 
+def sample_attributes(attr_list, start_frame, end_frame):
+    '''
+    Get the value of each attribute on every frame of a time range, evaluating at each time instead of
+    playing back the scene
+
+    Args:
+        attr_list (list<Attribute>): The attributes to sample
+        start_frame (int): First frame to sample
+        end_frame (int): Last frame to sample
+
+    Returns:
+        dictionary<Attribute, list<float>>. Value of each attribute for every frame
+    '''
+    sample_dict = {}
+    for attr in attr_list:
+        attr_name = attr.name()
+        sample_dict[attr] = [cmds.getAttr(attr_name, time=x) for x in range(start_frame, end_frame+1)]
+
+    return sample_dict
+
+
 def find_first_keyframe(obj):
     '''
     Find the first keyed frame on the given object
@@ -164,6 +186,157 @@ def get_angle_from_euler(x, y, z):
     return v1_math.rotation.angle_of_quaternion_degree(quat[0], quat[1], quat[2], quat[3])
 
 
+class AnimLayerState(object):
+    '''
+    Snapshot of the animation layer tree and every layer's lock, solo and mute state, taken in one pass.  Changes are
+    made through set_state(), which only edits a layer when its flags differ from the cached state, and end() restores
+    the snapshot as a diff of only the layers that changed.
+
+    Use session() as a context manager to share one state across a whole export or bake, nested sessions re-use the
+    outermost state so layers are only restored once it ends.  While a session is active get_all_anim_layers() reads
+    from the snapshot instead of walking the layer tree.  Layer flags changed outside of set_state() during a session
+    won't be seen by it
+
+    Attributes:
+        root_layer (PyNode): The root animation layer, None if the scene has no animation layers
+        layer_list (list<PyNode>): Every layer in get_all_anim_layers() order, root first
+        children_dict (dictionary): Child layers of each layer
+        state_dict (dictionary): Current (lock, solo, mute) of each layer
+        solo_keys_fixed (boolean): Whether baking.fix_solo_keyframe_layers() has run during the session
+    '''
+    _active_state = None
+
+    @staticmethod
+    def get_active():
+        '''
+        Get the state of the active session, refreshed if layers were added to the scene since it was taken
+
+        Returns:
+            AnimLayerState. The active state, or None if there's no active session
+        '''
+        active_state = AnimLayerState._active_state
+        if active_state and len(cmds.ls(type='animLayer')) != len(active_state.layer_list):
+            active_state.snapshot()
+        return active_state
+
+    @staticmethod
+    def session():
+        '''
+        Get the state to use as a context manager, the active state if there is one or a new state
+
+        Returns:
+            AnimLayerState. The state for the session
+        '''
+        active_state = AnimLayerState.get_active()
+        return active_state if active_state else AnimLayerState()
+
+    def __init__(self):
+        self.root_layer = None
+        self.layer_list = []
+        self.children_dict = {}
+        self.state_dict = {}
+        self.initial_state_dict = {}
+        self.solo_keys_fixed = False
+        self.edit_count = 0
+        self._depth = 0
+        self.snapshot()
+
+    def __enter__(self):
+        return self.begin()
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.end()
+
+    def snapshot(self):
+        '''
+        Walk the layer tree and read every layer's flags.  Layers already in the snapshot keep their cached and initial
+        state, so the snapshot can be refreshed during a session without losing what needs restoring
+        '''
+        self.root_layer = pm.animLayer(query=True, root=True)
+        self.layer_list = []
+        self.children_dict = {}
+        if self.root_layer:
+            self.root_layer = pm.PyNode(self.root_layer)
+            self.layer_list.append(self.root_layer)
+            self._add_children(self.root_layer)
+
+        for anim_layer in self.layer_list:
+            if anim_layer not in self.state_dict:
+                layer_name = anim_layer.name()
+                layer_state = (cmds.getAttr(layer_name + '.lock'), cmds.getAttr(layer_name + '.solo'), cmds.getAttr(layer_name + '.mute'))
+                self.state_dict[anim_layer] = layer_state
+                self.initial_state_dict[anim_layer] = layer_state
+
+    def _add_children(self, anim_layer):
+        # Matches the order of get_children_anim_layers(), all children of a layer before any grandchildren
+        child_list = pm.animLayer(anim_layer, q=True, c=True) or []
+        self.children_dict[anim_layer] = child_list
+        self.layer_list.extend(child_list)
+        for child in child_list:
+            self._add_children(child)
+
+    def begin(self):
+        '''
+        Start or join the session for this state
+
+        Returns:
+            AnimLayerState. This state
+        '''
+        if self._depth == 0:
+            AnimLayerState._active_state = self
+        self._depth += 1
+        return self
+
+    def end(self):
+        '''
+        Leave the session, restoring every changed layer when the outermost session ends
+        '''
+        self._depth = max(self._depth - 1, 0)
+        if self._depth == 0:
+            if AnimLayerState._active_state is self:
+                AnimLayerState._active_state = None
+            self.restore()
+
+    def get_layers(self, include_root = True):
+        return list(self.layer_list) if include_root else self.layer_list[1:]
+
+    def set_state(self, anim_layer, lock = None, solo = None, mute = None):
+        '''
+        Set layer flags, only editing the layer if a flag differs from its cached state
+
+        Args:
+            anim_layer (PyNode): The animation layer to set
+            lock (boolean): Lock value to set, None leaves it as is
+            solo (boolean): Solo value to set, None leaves it as is
+            mute (boolean): Mute value to set, None leaves it as is
+
+        Returns:
+            boolean. Whether the layer was edited
+        '''
+        current_state = self.state_dict.get(anim_layer)
+        if current_state is None:
+            current_state = (pm.animLayer(anim_layer, q=True, lock=True), pm.animLayer(anim_layer, q=True, solo=True), 
+                             pm.animLayer(anim_layer, q=True, mute=True))
+            self.initial_state_dict[anim_layer] = current_state
+
+        new_state = tuple(current if value is None else bool(value) for current, value in zip(current_state, (lock, solo, mute)))
+        self.state_dict[anim_layer] = new_state
+        edit_dict = {flag: value for flag, value, current in zip(('lock', 'solo', 'mute'), new_state, current_state) if value != current}
+        if edit_dict:
+            pm.animLayer(anim_layer, e=True, **edit_dict)
+            self.edit_count += 1
+
+        return bool(edit_dict)
+
+    def restore(self):
+        '''
+        Set every layer back to its snapshot state, only editing layers that changed
+        '''
+        for anim_layer, layer_state in self.initial_state_dict.items():
+            if pm.objExists(anim_layer):
+                self.set_state(anim_layer, *layer_state)
+
+
 def set_mute_on_parent_anim_layer(obj, value):
     '''
     Set lock and mute of the parent animation layer for the given object
@@ -172,22 +345,32 @@ def set_mute_on_parent_anim_layer(obj, value):
         obj (PyNode): Object to query anim layers from
         value (bool): Value to set mute and lock to
     '''
+    layer_state = AnimLayerState.get_active()
+
     pm.select(obj)
     parentLayers = pm.animLayer(query=True, afl=True)
-    root_layer = pm.animLayer(query=True, root=True)
+    root_layer = layer_state.root_layer if layer_state else pm.animLayer(query=True, root=True)
     if(parentLayers != None and len(parentLayers) > 0):
         for layer in parentLayers:
             if (layer == root_layer):
                 continue
-            pm.animLayer(layer, edit=True, mute=value, lock=value)
+            if layer_state:
+                layer_state.set_state(layer, lock=value, mute=value)
+            else:
+                pm.animLayer(layer, edit=True, mute=value, lock=value)
 
     pm.select( clear=True )
 
 
 def get_all_anim_layers(include_root = True):
     '''
-    Get all animation layers in the scene by starting with the root and recursively adding children
+    Get all animation layers in the scene by starting with the root and recursively adding children.  Reads
+    from the snapshot if an AnimLayerState session is active
     '''
+    layer_state = AnimLayerState.get_active()
+    if layer_state:
+        return layer_state.get_layers(include_root)
+
     root_layer = pm.animLayer(query=True, root=True)
     anim_layer_list = []
     if root_layer:
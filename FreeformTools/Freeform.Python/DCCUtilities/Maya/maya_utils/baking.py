@@ -526,7 +526,14 @@ def remove_sub_frames(obj_list):
 def fix_solo_keyframe_layers():
     '''
     Find all animation layers with a single keyframe and place a second keyframe 1 frame after the first for all objects in the layer.
+    Only runs once per anim_attr_utils.AnimLayerState session, since after the first run no layer has a single keyframe
     '''
+    layer_state = anim_attr_utils.AnimLayerState.get_active()
+    if layer_state:
+        if layer_state.solo_keys_fixed:
+            return
+        layer_state.solo_keys_fixed = True
+
     for anim_layer in pm.ls(type='animLayer'):
         anim_curve_list = pm.animLayer(anim_layer, query=True, animCurves=True)
 		# Ignore anim layers with no animation
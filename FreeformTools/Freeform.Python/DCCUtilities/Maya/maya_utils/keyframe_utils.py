@@ -18,6 +18,7 @@ If not, see <https://www.gnu.org/licenses/>.
 '''
 
 import pymel.core as pm
+import maya.cmds as cmds
 
 import v1_shared
 
@@ -69,6 +70,55 @@ def get_selected_keyframe_attributes():
     return attr_list
 
 
+def set_keys_bulk(attribute, frame_list, value_list):
+    '''
+    Key an attribute for every frame in frame_list with one bulk write instead of one setKeyframe per frame.  Like
+    pm.bakeResults with preserveOutsideKeys, existing keys inside the frame range are replaced and keys outside it are kept.
+
+    Args:
+        attribute (Attribute): The attribute to key
+        frame_list (list<float>): Frame for each key, in ascending order
+        value_list (list<float>): Value for each key in scene units
+    '''
+    if not frame_list:
+        return
+
+    time_range = (frame_list[0], frame_list[-1])
+    key_count = pm.keyframe(attribute, q=True, keyframeCount=True)
+    outside_count = key_count - pm.keyframe(attribute, q=True, keyframeCount=True, time=time_range) if key_count else 0
+    if key_count:
+        pm.cutKey(attribute, time=time_range, clear=True)
+
+    # Create the curve through setKeyframe so the key lands on the correct animation layer
+    pm.setKeyframe(attribute, t=frame_list[0], v=value_list[0])
+    anim_curve = get_first_or_default(pm.keyframe(attribute, q=True, name=True))
+
+    if outside_count:
+        # keyTimeValue is indexed by key order, so with keys kept outside the range new keys are merged in one at a time
+        merge_keys(attribute, frame_list[1:], value_list[1:])
+    else:
+        key_time_value_list = [x for key_pair in zip(frame_list, value_list) for x in key_pair]
+        cmds.setAttr("{0}.ktv[0:{1}]".format(anim_curve, len(frame_list) - 1), *key_time_value_list)
+
+        in_tangent = get_first_or_default(pm.keyTangent(q=True, g=True, itt=True))
+        out_tangent = get_first_or_default(pm.keyTangent(q=True, g=True, ott=True))
+        pm.keyTangent(anim_curve, time=time_range, itt=in_tangent, ott=out_tangent)
+
+def merge_keys(attribute, frame_list, value_list):
+    '''
+    Add keys to an attribute one setKeyframe at a time, keeping existing keys.  Slower than writing keyTimeValue, but
+    keys can be inserted between existing keys and the edit is undoable.  New keys use the global tangents
+
+    Args:
+        attribute (Attribute): The attribute to key
+        frame_list (list<float>): Frame for each key, in ascending order
+        value_list (list<float>): Value for each key in scene units
+    '''
+    attribute_name = str(attribute)
+    for frame, value in zip(frame_list, value_list):
+        cmds.setKeyframe(attribute_name, time=frame, value=value)
+
+
 def move_keyframes(obj_list, frames):
     pm.keyframe(obj_list, e=True, r=True, o='over', tc=frames)
 
@@ -18,9 +18,13 @@ If not, see <https://www.gnu.org/licenses/>.
 '''
 
 import pymel.core as pm
+import maya.cmds as cmds
 import maya.api.OpenMaya as OpenMaya
 
+import time
+
 import v1_core
+import v1_math
 
 import metadata
 
@@ -33,6 +37,7 @@ from maya_utils import baking
 
 
 TRANSFORM_ATTRS = ['tx', 'ty', 'tz', 'rx', 'ry', 'rz', 'sx', 'sy', 'sz']
+TRANSFORM_LONG_ATTRS = ['translateX', 'translateY', 'translateZ', 'rotateX', 'rotateY', 'rotateZ', 'scaleX', 'scaleY', 'scaleZ']
 
 
 def convert_scene_units(value):
@@ -112,37 +117,107 @@ def zero_node(obj, connection_filter_list):
         obj (PyNode): Maya scene object to zero out
         connection_filter_list (list<type>): List of connection types coming into attributes to ignore
     '''
-    locked_attrs = unlock_transforms(obj)
-    
-    tr_zero_value_list = [0,0,0,0,0,0]
-    control_property = metadata.meta_property_utils.get_property(obj, ControlProperty)
-    
-    if control_property:
-        zero_translate = control_property.get('zero_translate', 'double3')
-        zero_rotate = control_property.get('zero_rotate', 'double3')
-        tr_zero_value_list = [zero_translate.x, zero_translate.y, zero_translate.z, zero_rotate.x, zero_rotate.y, zero_rotate.z]
+    zero_nodes([obj], connection_filter_list)
 
-    for attr_name, attr_zero_value in zip(TRANSFORM_ATTRS[:6], tr_zero_value_list): # translate/rotate
-        attr = getattr(obj, attr_name)
-        connection_set = set(attr.connections()) - set(attr.connections(type=connection_filter_list))
+def zero_nodes(obj_list, connection_filter_list, key = False):
+    '''
+    Zero out a list of maya scene nodes in one pass, ignoring any attributes with a connection type that matches 
+    one passed into connection_filter_list
 
-        if not connection_set:
-            attr.set(attr_zero_value)
+    Args:
+        obj_list (list<PyNode>): Maya scene objects to zero out
+        connection_filter_list (list<type>): List of connection types coming into attributes to ignore
+        key (boolean): Whether or not to key every zeroed attribute
 
-    for attr_name in TRANSFORM_ATTRS[6:]: # scale
-        attr = getattr(obj, attr_name)
-        connection_set = set(attr.connections()) - set(attr.connections(type=connection_filter_list))
+    Returns:
+        (int). Number of attributes zeroed
+    '''
+    plug_value_list, locked_plug_list = get_zero_plug_values(obj_list, connection_filter_list)
+    return set_plug_values(plug_value_list, locked_plug_list, key)
 
-        if not connection_set:
-            attr.set(1)
+def get_zero_plug_values(obj_list, connection_filter_list):
+    '''
+    Gather the zero value for every transform and keyable custom attribute on a list of maya scene nodes.  Transform
+    zero values come from a ControlProperty if the node has one.  Attributes connected to anything that isn't one of
+    the connection_filter_list types are skipped, as are custom attributes with any connection
+
+    Args:
+        obj_list (list<PyNode>): Maya scene objects to zero out
+        connection_filter_list (list<type>): List of connection types coming into attributes to ignore
+
+    Returns:
+        (list<tuple>, list<str>). (plug name, value) for every attribute to zero, and the locked transform plugs
+            that need to be unlocked to set them
+    '''
+    plug_value_list = []
+    locked_plug_list = []
+    for obj in obj_list:
+        obj_name = obj.longName()
+
+        tr_zero_value_list = [0,0,0,0,0,0]
+        control_property = metadata.meta_property_utils.get_property(obj, ControlProperty)
+        if control_property:
+            zero_translate = control_property.get('zero_translate', 'double3')
+            zero_rotate = control_property.get('zero_rotate', 'double3')
+            tr_zero_value_list = [zero_translate.x, zero_translate.y, zero_translate.z, zero_rotate.x, zero_rotate.y, zero_rotate.z]
+
+        # listConnections returns pairs of [this node's plug, connected node]
+        connection_list = cmds.listConnections(obj_name, connections=True) or []
+        filtered_node_set = set(cmds.ls(connection_list[1::2], type=connection_filter_list) or [])
+        connected_attr_set = set()
+        driven_attr_set = set()
+        for plug, connected_node in zip(connection_list[::2], connection_list[1::2]):
+            attr_name = plug.split('.', 1)[-1]
+            connected_attr_set.add(attr_name)
+            if connected_node not in filtered_node_set:
+                driven_attr_set.add(attr_name)
+
+        locked_attr_set = set(cmds.listAttr(obj_name, locked=True) or [])
+        for attr_name, attr_zero_value in zip(TRANSFORM_LONG_ATTRS, tr_zero_value_list + [1,1,1]):
+            # a connection to the compound attribute blocks all of it's channels
+            if attr_name not in driven_attr_set and attr_name[:-1] not in driven_attr_set:
+                plug_value_list.append(("{0}.{1}".format(obj_name, attr_name), attr_zero_value))
+            if attr_name in locked_attr_set:
+                locked_plug_list.append("{0}.{1}".format(obj_name, attr_name))
+
+        for attr_name in cmds.listAttr(obj_name, ud=True, k=True) or []:
+            if attr_name not in connected_attr_set:
+                plug_value_list.append(("{0}.{1}".format(obj_name, attr_name), 0))
+
+    return plug_value_list, locked_plug_list
+
+def set_plug_values(plug_value_list, locked_plug_list = None, key = False):
+    '''
+    Set a list of attribute values in one pass by plug name, unlocking and relocking any locked plugs around the set.
+    Compound attributes can be set with a list or tuple value
+
+    Args:
+        plug_value_list (list<tuple>): (plug name, value) for every attribute to set
+        locked_plug_list (list<str>): Locked plugs to unlock while setting values
+        key (boolean): Whether or not to key every set attribute on the current frame, all keys are set with
+            one setKeyframe call
 
-    custom_attr_list = [pm.PyNode("{0}.{1}".format(obj, x)) for x in pm.listAttr(obj, ud=True, k=True)]
-    for custom_attr in custom_attr_list:
-        if not custom_attr.connections():
-            custom_attr.set(0)
+    Returns:
+        (int). Number of attributes set
+    '''
+    locked_plug_list = locked_plug_list if locked_plug_list else []
+    for plug in locked_plug_list:
+        cmds.setAttr(plug, lock=False)
 
-    for attr in locked_attrs:
-        attr.lock()
+    try:
+        for plug, value in plug_value_list:
+            if isinstance(value, (list, tuple)):
+                cmds.setAttr(plug, *value)
+            else:
+                cmds.setAttr(plug, value)
+
+        if key and plug_value_list:
+            cmds.setKeyframe([x for x, y in plug_value_list])
+    finally:
+        for plug in locked_plug_list:
+            cmds.setAttr(plug, lock=True)
+
+    return len(plug_value_list)
 
 def get_distance(obj_start, obj_end):
     '''
@@ -192,7 +267,7 @@ def get_local_rotation(obj_start, obj_end):
 
 def get_world_space_position_at_time(obj, frame):
     '''
-    Uses pm.getAttr to get the .worldMatrix of an object at a time frame, and returns the translate portion of it
+    Uses cmds.getAttr to get the .worldMatrix of an object at a time frame, and returns the translate portion of it
 
     Args:
         obj (PyNode): The object to get translate from
@@ -201,9 +276,28 @@ def get_world_space_position_at_time(obj, frame):
     Returns:
         list<float>: List of world space translate objects
     '''
-    matrix = pm.getAttr((obj+'.worldMatrix'), t=frame )
-    return_vector = pm.dt.Vector([convert_scene_units(matrix.translate.x), convert_scene_units(matrix.translate.y), convert_scene_units(matrix.translate.z)])
-    return return_vector
+    matrix = v1_math.retarget.from_list(cmds.getAttr("{0}.worldMatrix".format(obj), time=frame))
+    return pm.dt.Vector([convert_scene_units(x) for x in v1_math.retarget.get_translation(matrix)])
+
+def sample_world_matrices(obj_list, frame_list, attr_name = 'worldMatrix'):
+    '''
+    Read a matrix attribute from every object for every frame in a single pass over the frame range
+
+    Args:
+        obj_list (list<PyNode>): Maya scene transforms to sample
+        frame_list (list<float>): Frames to sample on
+        attr_name (str): Name of the matrix attribute to read, ie. 'worldMatrix' or 'parentMatrix'
+
+    Returns:
+        dictionary. For each object the list of 4x4 matrices, one per frame in frame_list
+    '''
+    plug_list = [(obj, "{0}.{1}".format(obj.longName(), attr_name)) for obj in obj_list]
+    matrix_dict = {obj: [] for obj in obj_list}
+    for frame in frame_list:
+        for obj, plug in plug_list:
+            matrix_dict[obj].append(v1_math.retarget.from_list(cmds.getAttr(plug, time=frame)))
+
+    return matrix_dict
 
 
 def force_align(driver, object):
@@ -378,23 +472,82 @@ def swap_animation_curves(source_node, dest_node, axis, single_direction):
             getattr(source_anim_dupe, connecting_attr) >> mirror_attr
 
 
-def world_space_mirror(source_node, dest_node, axis, single_direction):
+def world_space_mirror(source_node, dest_node, axis, single_direction, frame_list = None):
     '''
-    Swaps the world space transform values between two objects, using pm.xform
+    Swaps the world space transform values between two objects, mirrored across the given axis
 
     Args:
         source_node (PyNode): Maya scene transform object, if single_direction this won't be modified
         dest_node (PyNode): Maya scene transform object
         axis (string): String name for the axis to flip, 'x', 'y', or 'z'
         single_direction (bool): Whether to apply the swap to one object or both
+        frame_list (list<float>): Frames to mirror and key, if None only the pose on the current frame is mirrored
     '''
+    world_space_mirror_list([(source_node, dest_node)], axis, single_direction, frame_list)
 
-    node_translate, node_rotate = get_world_space_mirror_transform(dest_node, axis)
-    mirror_translate, mirror_rotate = get_world_space_mirror_transform(source_node, axis)
+def world_space_mirror_list(mirror_pair_list, axis, single_direction, frame_list = None):
+    '''
+    Swaps the world space transform values between pairs of objects, mirrored across the given axis.  World and parent
+    matrices of every object are sampled for every frame in one pass before anything is changed, the mirrored local
+    transforms are solved with v1_math.mirror.solve_mirror() and each channel is written once, so pairs can't pick up
+    each other's mirrored values
 
-    pm.xform(dest_node, ws = True, t = mirror_translate, ro = mirror_rotate)
+    Args:
+        mirror_pair_list (list<tuple<PyNode, PyNode>>): (source, dest) transforms, if single_direction source won't be modified
+        axis (string): String name for the axis to flip, 'x', 'y', or 'z'
+        single_direction (bool): Whether to apply the swap to one object or both
+        frame_list (list<float>): Frames to mirror and key, if None only the pose on the current frame is mirrored
+    '''
+    from maya_utils import keyframe_utils
+
+    mirror_time = time.perf_counter()
+    set_pose = frame_list is None
+    frame_list = [pm.currentTime(q=True)] if set_pose else frame_list
+
+    # (object to set, object whose mirrored pose it gets)
+    target_list = [(dest_node, source_node) for source_node, dest_node in mirror_pair_list]
     if not single_direction:
-        pm.xform(source_node, ws = True, t = node_translate, ro = node_rotate)
+        target_list += [(source_node, dest_node) for source_node, dest_node in mirror_pair_list]
+    # Solve parents before children so children are solved in their parent's mirrored space
+    target_list.sort(key = lambda x: len(x[0].longName().split('|')))
+    target_index_dict = {x[0]: i for i, x in enumerate(target_list)}
+
+    obj_list = list(set([x for target_pair in target_list for x in target_pair]))
+    world_dict = sample_world_matrices(obj_list, frame_list)
+    parent_dict = sample_world_matrices([x[0] for x in target_list], frame_list, 'parentMatrix')
+
+    control_list = []
+    for target_node, source_node in target_list:
+        target_name = target_node.longName()
+        # Nearest mirrored ancestor, so controls under offset groups are still solved in the mirrored space above them
+        parent_index = get_first_or_default([target_index_dict[x] for x in target_node.getAllParents() if x in target_index_dict])
+        control_list.append({'source_world': world_dict[source_node], 'world': world_dict[target_node], 'parent_world': parent_dict[target_node],
+                             'parent_index': parent_index,
+                             'rotate_axis': get_first_or_default(cmds.getAttr(target_name + '.rotateAxis')),
+                             'rotate_order': cmds.getAttr(target_name + '.rotateOrder')})
+
+    result_list = v1_math.mirror.solve_mirror(control_list, axis)
+
+    plug_value_list = []
+    for (target_node, source_node), result in zip(target_list, result_list):
+        target_name = target_node.longName()
+        locked_attr_list = cmds.listAttr(target_name, locked=True) or []
+        for attr_name in ['translate', 'rotate']:
+            value_list = result[attr_name]
+            if attr_name == 'translate':
+                # World matrices are in internal units, convert to match the scene units values are set in
+                value_list = [[convert_scene_units(x) for x in y] for y in value_list]
+            for i, axis_name in enumerate('XYZ'):
+                if attr_name + axis_name in locked_attr_list:
+                    continue
+                if set_pose:
+                    plug_value_list.append(("{0}.{1}{2}".format(target_name, attr_name, axis_name), value_list[0][i]))
+                else:
+                    keyframe_utils.set_keys_bulk(getattr(target_node, attr_name + axis_name), frame_list, [x[i] for x in value_list])
+
+    set_plug_values(plug_value_list)
+    v1_core.v1_logging.get_logger().debug("World Space Mirrored {0} Objects over {1} Frames in {2} Seconds".format(len(target_list), len(frame_list), 
+                                                                                                                 time.perf_counter() - mirror_time))
 
 
 def get_world_space_mirror_transform(obj, axis):
@@ -408,22 +561,11 @@ def get_world_space_mirror_transform(obj, axis):
     Returns:
         (Vector, Vector): Translate vector, Rotate vector
     '''
-    temp_t = pm.xform(obj, ws=True, q=True, t=True)
-    temp_r = pm.xform(obj, ws=True, q=True, ro=True)
+    obj_name = obj.longName()
+    matrix = v1_math.mirror.mirror_matrix(v1_math.retarget.from_list(cmds.getAttr(obj_name + '.worldMatrix')), axis)
 
-    mirror_axis_list = v1_shared.shared_utils.get_mirror_attributes(axis)
-
-    t_vector = pm.dt.Vector(temp_t)
-    r_vector = pm.dt.Vector(temp_r)
-    for axis in mirror_axis_list:
-        replace_char = ''
-        if 't' in axis:
-            vector = t_vector
-        elif 'r' in axis:
-            vector = r_vector
-        
-        attr_value = getattr(vector, axis[-1]) * -1
-        setattr(vector, axis[-1], attr_value)
+    t_vector = pm.dt.Vector([convert_scene_units(x) for x in v1_math.retarget.get_translation(matrix)])
+    r_vector = pm.dt.Vector(v1_math.retarget.matrix_to_euler(v1_math.retarget.get_rotation(matrix), cmds.getAttr(obj_name + '.rotateOrder')))
 
     return t_vector, r_vector
 
@@ -19,10 +19,13 @@ If not, see <https://www.gnu.org/licenses/>.
 
 from re import I
 import pymel.core as pm
+import maya.cmds as cmds
 import maya.OpenMaya
 
+import concurrent.futures
 import os
 import sys
+import time
 import hashlib
 from pathlib import Path
 
@@ -31,6 +34,7 @@ import v1_shared
 
 from v1_shared.decorators import csharp_error_catcher
 from v1_shared.shared_utils import get_first_or_default, get_index_or_default, get_last_or_default
+from v1_plan import path_plan
 
 from metadata import meta_network_utils, meta_property_utils
 from metadata.network_registry import Network_Registry, Property_Registry
@@ -136,85 +140,129 @@ def remove_empty_namespaces():
         if not ns.listNodes():
             ns.remove()
 
-def clean_scene():
+# Node types clean_scene checks, and the plug that must have a connection for the node to be kept.  None means any
+# connection keeps the node
+CLEANUP_CONNECTION_DICT = {'controller': 'controllerObject', 'groupId': None, 'timeEditorTracks': None, 'nodeGraphEditorInfo': None,
+                           'reference': None, 'displayLayer': 'drawInfo', 'renderLayer': False}
+
+def clean_scene(dry_run = False, delete_unused_shaders = True):
     '''
-    Clean up a maya scene of orphaned and unused objects
+    Clean up a maya scene of orphaned and unused objects.  Every candidate node is found with one typed ls and one
+    listConnections query, and all orphans are deleted with a single delete call.  Orphaned nodes are controller
+    tags with no control, groupId, timeEditorTracks, nodeGraphEditorInfo and unlocked reference nodes with no 
+    connections, display layers with no members, and every render layer other than the default
+
+    Args:
+        dry_run (boolean): If True only report what would be deleted, leave the scene unchanged
+        delete_unused_shaders (boolean): Whether or not to run Hypershade's Delete Unused Nodes
+
+    Returns:
+        (dictionary). Names of the nodes deleted, or that would be deleted, keyed by node type, plus 'namespace'
     '''
-    # Delete orphaned controller tags
-    controller_tags = [x for x in pm.ls(type='controller') if x.exists() and not x.controllerObject.listConnections()]
-    if controller_tags:
-        pm.delete(controller_tags)
-        v1_core.v1_logging.get_logger().info("Scene Cleanup Deleted Controller Tags : \n{0}".format(controller_tags))
+    clean_start = time.perf_counter()
+    type_node_list = cmds.ls(type=list(CLEANUP_CONNECTION_DICT.keys()), showType=True) or []
+    # showType returns [name, type, name, type...]
+    node_type_dict = dict(zip(type_node_list[::2], type_node_list[1::2]))
+    protected_set = set(cmds.ls(list(node_type_dict.keys()), readOnly=True) or []) | set(['defaultRenderLayer', 'defaultLayer'])
+    node_list = [x for x in node_type_dict.keys() if x not in protected_set]
+
+    # listConnections returns pairs of [this node's plug, connected node]
+    connection_list = (cmds.listConnections(node_list, connections=True) or []) if node_list else []
+    connected_plug_set = set(x.split('[')[0] for x in connection_list[::2])
+    connected_node_set = set(x.split('.')[0] for x in connection_list[::2])
+
+    reference_list = [x for x in node_list if node_type_dict[x] == 'reference']
+    locked_reference_set = set(x for x, is_locked in zip(reference_list, cmds.lockNode(reference_list, q=True, lock=True) or []) if is_locked) if reference_list else set()
+
+    cleanup_dict = {x : [] for x in CLEANUP_CONNECTION_DICT.keys()}
+    for node in node_list:
+        node_type = node_type_dict[node]
+        keep_plug = CLEANUP_CONNECTION_DICT[node_type]
+        if keep_plug is None:
+            is_orphan = node not in connected_node_set
+        elif keep_plug:
+            is_orphan = "{0}.{1}".format(node, keep_plug) not in connected_plug_set
+        else:
+            is_orphan = True
+
+        if is_orphan and node not in locked_reference_set:
+            cleanup_dict[node_type].append(node)
+    query_time = time.perf_counter() - clean_start
+
+    delete_start = time.perf_counter()
+    delete_list = [x for node_list in cleanup_dict.values() for x in node_list]
+    if delete_list and not dry_run:
+        cmds.delete(delete_list)
+    delete_time = time.perf_counter() - delete_start
 
-    # Delete unused shader nodes
+    namespace_start = time.perf_counter()
+    cleanup_dict['namespace'] = delete_empty_namespaces(dry_run)
+    namespace_time = time.perf_counter() - namespace_start
+
+    shader_start = time.perf_counter()
+    if delete_unused_shaders and not dry_run:
+        delete_unused_nodes()
+    shader_time = time.perf_counter() - shader_start
+
+    count_string = ", ".join(["{0}: {1}".format(x, len(y)) for x, y in cleanup_dict.items() if y])
+    v1_core.v1_logging.get_logger().info("Scene Cleanup {0}{1}".format("Dry Run " if dry_run else "", count_string if count_string else "Found Nothing"))
+    for node_type, node_list in [(x, y) for x, y in cleanup_dict.items() if y]:
+        v1_core.v1_logging.get_logger().debug("Scene Cleanup {0} : \n{1}".format(node_type, node_list))
+    v1_core.v1_logging.get_logger().info("Scene Cleanup Completed in {0} Seconds - Query {1}, Delete {2}, Namespaces {3}, Unused Nodes {4}".format(
+        time.perf_counter() - clean_start, query_time, delete_time, namespace_time, shader_time))
+
+    return cleanup_dict
+
+def delete_unused_nodes():
+    '''
+    Run Hypershade's Delete Unused Nodes
+    '''
+    # Since Maya 2020 an error is thrown when running Delete Unused Nodes if the StandardSurface default shader is unassigned
+    # So if it's unassigned we create a temporary object, assign the default StandardSurface material to it, then delete 
+    # Unused and delete the object
     temp_cube = None
     try:
-        # Since Maya 2020 an error is thrown when running Delete Unused Nodes if the StandardSurface default shader is unassigned
-        # So we create a temporary object, assign the default StandardSurface material to it, then delete Unused and delete the sphere
-        temp_cube = pm.polyCube(name="TEMP_StandardSurface_Assignment")[0]
-        temp_standard_shader = pm.sets( renderable=True, noSurfaceShader=True, empty=True, name="standardSurface1SG" )
-        standard_material = pm.PyNode("standardSurface1")
-        standard_material.outColor >> temp_standard_shader.surfaceShader
-        pm.sets(temp_standard_shader, edit=True, forceElement=temp_cube)
+        if cmds.objExists('standardSurface1') and not cmds.listConnections('standardSurface1.outColor', type='shadingEngine'):
+            temp_cube = cmds.polyCube(name="TEMP_StandardSurface_Assignment")[0]
+            temp_standard_shader = cmds.sets(renderable=True, noSurfaceShader=True, empty=True, name="standardSurface1SG")
+            cmds.connectAttr('standardSurface1.outColor', temp_standard_shader + '.surfaceShader')
+            cmds.sets(temp_cube, edit=True, forceElement=temp_standard_shader)
 
         pm.mel.eval('hyperShadePanelMenuCommand("hyperShadePanel1", "deleteUnusedNodes");')
     except Exception as e:
         v1_core.v1_logging.get_logger().info("Failed To Delete Unused Nodes:")
         v1_core.v1_logging.get_logger().info("{0}".format(e))
-        pass
     finally:
-        if temp_cube:
-            pm.delete(temp_cube)
-
-    # Delete empty namespaces
-    delete_empty_namespaces()
-
-    # Delete empty Display Layers
-    delete_empty_display_layers()
-
-    # Delete RenderLayers that aren't a default layer
-    render_layers = [x for x in pm.ls(type='renderLayer') if x != pm.nt.RenderLayer('defaultRenderLayer')]
-    if render_layers:
-        pm.delete(render_layers)
-        v1_core.v1_logging.get_logger().info("Scene Cleanup Deleted RenderLayers : \n{0}".format(render_layers))
-
-    # Delete orphaned groupId nodes
-    group_id_nodes = [x for x in pm.ls(type='groupId') if not x.listConnections()]
-    if group_id_nodes:
-        pm.delete(group_id_nodes)
-        v1_core.v1_logging.get_logger().info("Scene Cleanup Deleted GroupID Nodes : \n{0}".format(group_id_nodes))
-
-    # Delete orphaned TimeEditor tracks
-    time_editor_tracks = [x for x in pm.ls(type='timeEditorTracks') if not x.listConnections()]
-    if time_editor_tracks:
-        pm.delete(time_editor_tracks)
-        v1_core.v1_logging.get_logger().info("Scene Cleanup Deleted TimeEditorTracks : \n{0}".format(time_editor_tracks))
-
-    # Delete orphaned GraphEditorInfo nodes
-    graph_editor_info = [x for x in pm.ls(type='nodeGraphEditorInfo') if not x.listConnections()]
-    if graph_editor_info:
-        pm.delete(graph_editor_info)
-        v1_core.v1_logging.get_logger().info("Scene Cleanup Deleted GraphEditorInfo : \n{0}".format(graph_editor_info))
-
-    # Delete orphaned and unlocked reference nodes
-    reference_nodes = [x for x in pm.ls(type='reference') if not x.listConnections() and not x.isLocked()]
-    if reference_nodes:
-        pm.delete(reference_nodes)
-        v1_core.v1_logging.get_logger().info("Scene Cleanup Deleted References : \n{0}".format(reference_nodes))
-
-
-def delete_empty_namespaces():
+        if temp_cube and cmds.objExists(temp_cube):
+            cmds.delete(temp_cube)
+
+
+def delete_empty_namespaces(dry_run = False):
     ''' 
-    Remove all empty namespaces from bottom up to remove children namespaces first
-    '''
-    namespace_list = []
-    for ns in pm.listNamespaces( recursive  =True, internal =False):
-        namespace_list.append(ns)
+    Remove all empty namespaces from bottom up to remove children namespaces first.  A namespace is empty if no node
+    in the scene is in it or any of it's child namespaces, found from one ls of the scene
+
+    Args:
+        dry_run (boolean): If True only report the empty namespaces, don't remove them
 
-    # Reverse Iterate through the contents of the list to remove the deepest layers first
-    for ns in reversed(namespace_list):
-        if not pm.namespaceInfo(ns, ls=True):
-            pm.namespace(removeNamespace = ns, mergeNamespaceWithRoot = True)
+    Returns:
+        (list<str>). Every empty namespace
+    '''
+    used_namespace_set = set()
+    for node_name in cmds.ls() or []:
+        namespace = node_name.split('|')[-1].rpartition(':')[0]
+        while namespace and namespace not in used_namespace_set:
+            used_namespace_set.add(namespace)
+            namespace = namespace.rpartition(':')[0]
+
+    namespace_list = cmds.namespaceInfo(':', listOnlyNamespaces=True, recurse=True) or []
+    # Reverse sort so child namespaces are removed before their parents
+    empty_namespace_list = sorted([x for x in namespace_list if x not in used_namespace_set and x not in ['UI', 'shared']], reverse=True)
+    if not dry_run:
+        for namespace in empty_namespace_list:
+            cmds.namespace(removeNamespace = namespace, mergeNamespaceWithRoot = True)
+
+    return empty_namespace_list
 
 def delete_empty_display_layers():
     empty_layer_list = []
@@ -290,53 +338,47 @@ def setup_partial_model_export(partial_model_node):
 
 def fix_full_paths():
     '''
-    Fixes full paths in references and texture maps so they are relative to Data\
+    Fixes full paths in references and texture maps so they are relative to Data.
+    All new paths are found up front with v1_plan.path_plan.get_root_relative_path_dict(), texture paths
+    are then set in one pass and each reference is repathed, and so reloaded, once
+
+    Returns:
+        (dictionary). Number of 'textures' and 'references' changed
     '''
-    nodes = []
+    fix_start = time.perf_counter()
 
-    # Creates a variable named fileNodes and is set to list all of the files
-    fileNodes = pm.ls(type = "file")
-    refNodes = pm.listReferences()
+    file_node_list = cmds.ls(type = "file") or []
+    texture_path_dict = {x : cmds.getAttr(x + ".fileTextureName") for x in file_node_list}
 
-    nodes.extend(fileNodes)
-    nodes.extend(refNodes)
+    # Top level references only, matching pm.listReferences()
+    reference_path_dict = {}
+    for reference_file in cmds.file(q=True, reference=True) or []:
+        reference_node = cmds.referenceQuery(reference_file, referenceNode=True)
+        reference_path_dict[reference_node] = cmds.referenceQuery(reference_node, filename=True, unresolvedName=True, withoutCopyNumber=True)
 
-    # dataPathNodes is a variable set to an empty array
-    dataPathNodes = []
+    new_path_dict = path_plan.get_root_relative_path_dict(list(texture_path_dict.values()) + list(reference_path_dict.values()))
 
-    # looking at a list of nodes within the fileNodes variables
-    for node in nodes:
-        try:
-            # we are getting the fileTextureName from each specific file node and splitting each sub directory in each node
-            fileNameArray = node.fileTextureName.get().replace("\\", "/").split("/")
-        except:
-            fileNameArray = node.unresolvedPath().split("/")
+    texture_count = 0
+    for file_node, texture_path in texture_path_dict.items():
+        new_path = new_path_dict.get(texture_path)
+        if new_path:
+            cmds.setAttr(file_node + ".fileTextureName", new_path, type="string")
+            texture_count += 1
 
-        dataNumb = None
+    # Reference repathing is deferred until all textures are done so each reference only reloads once
+    reload_start = time.perf_counter()
+    reference_count = 0
+    for reference_node, reference_path in reference_path_dict.items():
+        new_path = new_path_dict.get(reference_path)
+        if new_path:
+            cmds.file(new_path, loadReference=reference_node)
+            reference_count += 1
+    reload_time = time.perf_counter() - reload_start
 
-        # look at specific elements inside of the fileName
-        for element in fileNameArray:
-            # element array is lowercased with .lower()
-            # if there is not data found within the elements array skip the file Node
-            if element != "Data":
-                continue
+    v1_core.v1_logging.get_logger().info("Fixed {0} Texture Paths and {1} Reference Paths in {2} Seconds, Reference Reloads took {3} Seconds".format(
+        texture_count, reference_count, time.perf_counter() - fix_start, reload_time))
 
-            dataNumb = fileNameArray.index("Data")
-    
-        if not dataNumb:
-            continue
-
-        if dataNumb <= 0:
-            continue
-          
-        newEndPathArray = fileNameArray[dataNumb:]
-        newEndPath = "/".join(newEndPathArray)
-        newDir = newEndPath
-        
-        try:
-            node.fileTextureName.set(newDir)
-        except:
-            node.replaceWith(newDir)
+    return {'textures': texture_count, 'references': reference_count}
 
 
 def clean_reference_cameras():
@@ -355,40 +397,68 @@ def clean_reference_cameras():
         except:
             continue
 
-def import_file_safe(file_path, fbx_mode = "add", tag_imported = False, keep_scene_time = True, 
-                     load_properties = False, **kwargs):
+IMPORT_HEADER_DICT = {'.ma': (b'//Maya ASCII',), '.fbx': (b'Kaydara FBX Binary', b'; FBX')}
+
+def _probe_import_file(file_path, checksum = False):
     '''
-    Import FBX files or Maya files safely, and with the ability to return import nodes.
-    
-    Note: If an .ma file has plugin attributes from a plugin that the user does not have, the Maya importFile 
-    command will error and fail to return any values.  If this happens we fall back to comparing pre and post
-    import scene object lists to find the imported objects.  
-    EDGE CASE: This method will fail to return objects if the import process parents the imported nodes into
-    existing scene hierarchy
+    Validate a file for import and read its header, and optionally its checksum.  Only reads from disk, so it's safe
+    to run off of Maya's main thread
 
     Args:
         file_path (string): Full path to the file to import
-        fbx_mode (string): Import mode for the FBX (exmerge|add|merge)
-        tag_imported (boolean): Whether or not imported objects should be tagged with where they were imported from
-        keep_scene_time (boolean): Whether or not to keep scene time range or accept imported file
-        load_properties (boolean): Whether or not to load properties that were stored on fbx objects as attributes
-        **kwargs (kwargs): keyword args to pass along to pm.importFile
+        checksum (boolean): Whether or not to read the whole file for its checksum, otherwise only the header is read
+
+    Returns:
+        (dictionary). 'valid' if the file can be imported, the file 'format', the 'version' read from the header
+            and the md5 'checksum' of the file, None if checksum is False
     '''
-    scene_time_tuple = get_scene_times()
-    current_time = pm.currentTime()
-    current_playback = get_playback_rate()
+    probe_dict = {'valid': False, 'format': None, 'version': None, 'checksum': None}
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension not in IMPORT_HEADER_DICT or not os.path.isfile(file_path):
+        return probe_dict
+
+    with open(file_path, 'rb') as import_file:
+        header = import_file.read(64)
+        if not header.startswith(IMPORT_HEADER_DICT[extension]):
+            return probe_dict
+
+        if checksum:
+            file_hash = hashlib.md5(header)
+            for chunk in iter(lambda: import_file.read(1048576), b''):
+                file_hash.update(chunk)
+            probe_dict['checksum'] = file_hash.hexdigest()
+
+    probe_dict['valid'] = True
+    if header.startswith(b'Kaydara FBX Binary'):
+        # Binary FBX stores the version as a little endian uint32 after the 23 byte magic string
+        probe_dict['format'] = 'fbx_binary'
+        probe_dict['version'] = int.from_bytes(header[23:27], 'little')
+    else:
+        probe_dict['format'] = 'fbx_ascii' if extension == '.fbx' else 'maya_ascii'
+        header_line = header.split(b'\n', 1)[0].decode('ascii', 'ignore')
+        probe_dict['version'] = get_index_or_default(header_line.split(), 2)
+
+    return probe_dict
 
+def _import_file(file_path, **kwargs):
+    '''
+    Import a single FBX or Maya file, used by import_files_safe() which handles import settings and scene state
+
+    Args:
+        file_path (string): Full path to the file to import
+        **kwargs (kwargs): keyword args to pass along to pm.importFile
+
+    Returns:
+        (list<PyNode>). The imported nodes, or None if they weren't returned
+    '''
     import_return = None
-    pre_import_list = pm.ls(assemblies = True)
-    current_import_mode = fbx_wrapper.FBXImportMode(q=True)
+    pre_import_list = set(pm.ls(assemblies = True))
     try:
         filename, extension = os.path.splitext(file_path)
         if extension.lower() == '.ma':
             import_return = pm.importFile(file_path, **kwargs)
         elif extension.lower() == '.fbx':
             fbx_file_path = file_path.replace('\\', '\\\\')
-
-            fbx_wrapper.FBXImportMode(v = fbx_mode)
             fbx_wrapper.FBXImport(f = fbx_file_path)
     except:
         if ".ai_translator" in v1_core.exceptions.get_exception_message():
@@ -396,25 +466,81 @@ def import_file_safe(file_path, fbx_mode = "add", tag_imported = False, keep_sce
         else:
             exception_info = sys.exc_info()
             v1_core.exceptions.except_hook(exception_info[0], exception_info[1], exception_info[2]) 
-    finally:
-        fbx_wrapper.FBXImportMode(v = current_import_mode)
-        set_playback_rate(current_playback)
-        if (keep_scene_time):
-            set_scene_times(scene_time_tuple)
-            pm.currentTime(current_time)
 
     # Gather new scene objects from import if import method didn't
-    if not import_return and kwargs['returnNewNodes'] == True:
-        post_import_list = pm.ls(assemblies = True)
-        import_parent_list = [x for x in post_import_list if x not in pre_import_list]
+    if not import_return and kwargs.get('returnNewNodes') == True:
+        import_parent_list = [x for x in pm.ls(assemblies = True) if x not in pre_import_list]
 
         import_return = import_parent_list
         for import_parent in import_parent_list:
             import_return = import_return + import_parent.listRelatives(ad=True)
 
+    return import_return
+
+def import_files_safe(file_path_list, fbx_mode = "add", tag_imported = False, keep_scene_time = True, 
+                      load_properties = False, **kwargs):
+    '''
+    Import a list of FBX files or Maya files safely, and with the ability to return import nodes.
+
+    Files are validated, have their headers read and, if they'll be tagged, are checksummed on a thread pool before
+    anything is imported.  FBX import settings and scene time are set once for the whole list, all files import back
+    to back with viewport refresh suspended, then properties are loaded and imports are tagged in one pass over all new nodes.
+    See import_file_safe() for edge cases
+
+    Args:
+        file_path_list (list<string>): Full path to each file to import
+        fbx_mode (string): Import mode for the FBX (exmerge|add|merge)
+        tag_imported (boolean): Whether or not imported objects should be tagged with where they were imported from
+        keep_scene_time (boolean): Whether or not to keep scene time range or accept imported file
+        load_properties (boolean): Whether or not to load properties that were stored on fbx objects as attributes
+        **kwargs (kwargs): keyword args to pass along to pm.importFile
+
+    Returns:
+        (dictionary). Imported nodes for each file path, in import order.  Files that failed validation are left out
+    '''
+    import_start = time.perf_counter()
+    file_path_list = list(dict.fromkeys(file_path_list))
+    if not file_path_list:
+        return {}
+
+    # Maya commands must stay on the main thread, only the file reads are done in parallel
+    with concurrent.futures.ThreadPoolExecutor(max_workers = min(len(file_path_list), os.cpu_count() or 1)) as executor:
+        probe_list = executor.map(_probe_import_file, file_path_list, [tag_imported] * len(file_path_list))
+        probe_dict = dict(zip(file_path_list, probe_list))
+    probe_time = time.perf_counter() - import_start
+
+    import_path_list = []
+    for file_path, file_probe in probe_dict.items():
+        if file_probe['valid']:
+            import_path_list.append(file_path)
+            v1_core.v1_logging.get_logger().debug("import_files_safe - {0} {1} version {2}".format(file_path, file_probe['format'], file_probe['version']))
+        else:
+            v1_core.v1_logging.get_logger().warning("import_files_safe - Skipping {0}, not a valid .ma or .fbx file".format(file_path))
+
+    scene_time_tuple = get_scene_times()
+    current_time = pm.currentTime()
+    current_playback = get_playback_rate()
+    current_import_mode = fbx_wrapper.FBXImportMode(q=True)
+
+    import_dict = {}
+    pm.refresh(su=True)
+    try:
+        fbx_wrapper.FBXImportMode(v = fbx_mode)
+        for file_path in import_path_list:
+            import_dict[file_path] = _import_file(file_path, **kwargs)
+    finally:
+        pm.refresh(su=False)
+        fbx_wrapper.FBXImportMode(v = current_import_mode)
+        set_playback_rate(current_playback)
+        if (keep_scene_time):
+            set_scene_times(scene_time_tuple)
+            pm.currentTime(current_time)
+    import_time = time.perf_counter() - import_start - probe_time
+
     if load_properties:
         import metadata
-        for transform_obj in pm.ls(import_return, type='transform'):
+        all_import_list = [x for import_return in import_dict.values() if import_return for x in import_return]
+        for transform_obj in pm.ls(all_import_list, type='transform'):
             property_dict = metadata.meta_property_utils.load_properties_from_obj(transform_obj)
             for property_type, property_network_list in property_dict.items():
                 for property_network in property_network_list:
@@ -422,18 +548,46 @@ def import_file_safe(file_path, fbx_mode = "add", tag_imported = False, keep_sce
                         property_network.act()
                     metadata.meta_property_utils.load_properties_from_obj(property_network.node)
 
-    if import_return and tag_imported:
-        import_return = [x for x in import_return if pm.objExists(x)]
+    if tag_imported:
         from metadata.network_core import ImportedCore
-        imported_core = Network_Registry().get(ImportedCore)()
-        checksum = hashlib.md5(open(file_path, 'rb').read()).hexdigest()
-        relative_path = v1_shared.file_path_utils.full_path_to_relative(file_path)
-        imported_core.set('import_path', relative_path)
-        imported_core.set('checksum', checksum)
-        imported_core.connect_nodes(import_return)
-        import_return.append(imported_core.node)
+        for file_path, import_return in import_dict.items():
+            if not import_return:
+                continue
+            import_return = [x for x in import_return if pm.objExists(x)]
+            imported_core = Network_Registry().get(ImportedCore)()
+            relative_path = v1_shared.file_path_utils.full_path_to_relative(file_path)
+            imported_core.set('import_path', relative_path)
+            imported_core.set('checksum', probe_dict[file_path]['checksum'])
+            imported_core.connect_nodes(import_return)
+            import_return.append(imported_core.node)
+            import_dict[file_path] = import_return
 
-    return import_return
+    v1_core.v1_logging.get_logger().info("Imported {0} of {1} Files in {2} Seconds, Validation took {3} Seconds and Imports took {4} Seconds".format(
+        len(import_dict), len(file_path_list), time.perf_counter() - import_start, probe_time, import_time))
+
+    return import_dict
+
+def import_file_safe(file_path, fbx_mode = "add", tag_imported = False, keep_scene_time = True, 
+                     load_properties = False, **kwargs):
+    '''
+    Import FBX files or Maya files safely, and with the ability to return import nodes.
+    
+    Note: If an .ma file has plugin attributes from a plugin that the user does not have, the Maya importFile 
+    command will error and fail to return any values.  If this happens we fall back to comparing pre and post
+    import scene object lists to find the imported objects.  
+    EDGE CASE: This method will fail to return objects if the import process parents the imported nodes into
+    existing scene hierarchy
+
+    Args:
+        file_path (string): Full path to the file to import
+        fbx_mode (string): Import mode for the FBX (exmerge|add|merge)
+        tag_imported (boolean): Whether or not imported objects should be tagged with where they were imported from
+        keep_scene_time (boolean): Whether or not to keep scene time range or accept imported file
+        load_properties (boolean): Whether or not to load properties that were stored on fbx objects as attributes
+        **kwargs (kwargs): keyword args to pass along to pm.importFile
+    '''
+    import_dict = import_files_safe([file_path], fbx_mode, tag_imported, keep_scene_time, load_properties, **kwargs)
+    return import_dict.get(file_path)
 
 def export_selected_safe(file_path, **kwargs):
     filename, extension = os.path.splitext(file_path)
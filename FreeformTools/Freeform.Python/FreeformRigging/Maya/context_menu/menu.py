@@ -18,8 +18,10 @@ If not, see <https://www.gnu.org/licenses/>.
 '''
 
 import sys
+import time
 
 import pymel.core as pm
+import maya.cmds as cmds
 
 import v1_core
 import v1_shared
@@ -39,10 +41,35 @@ from v1_core.py_helpers import Singleton
 
 
 def refresh_menu():
+    V1_Context_Menu().clear_cache()
     if V1_Context_Menu().menu == None:
         V1_Context_Menu().create_menu()
         V1_Context_Menu().reset_menu()
 
+
+class MenuItemModel(object):
+    '''
+    Description of a single menu item, independent of the node the menu is built for.  Lists of these are cached
+    by V1_Context_Menu and bound to the node under the cursor when the menu is shown.
+
+    Attributes:
+        key (string): Name other items use to parent to this item, None for the root menu
+        parent_key (string): key of the item to parent this one under, None for the root menu
+        label (string): Label of the menu item
+        command (method): Method to run when the item is clicked, called through logging_wrapper with the bound node 
+            followed by args
+        args (list): Args to pass to command after the node, None for no args
+        menu_kwargs (kwargs): Extra pm.menuItem kwargs, such as rp or subMenu
+    '''
+
+    def __init__(self, label, key = None, parent_key = None, command = None, args = None, **menu_kwargs):
+        self.key = key
+        self.parent_key = parent_key
+        self.label = label
+        self.command = command
+        self.args = args if args is not None else []
+        self.menu_kwargs = menu_kwargs
+
 class V1_Context_Menu(object, metaclass=Singleton):
     '''
     Creates a context sensitive marking menu by gathering the name of the object under the cursor and building a menu based
@@ -53,6 +80,11 @@ class V1_Context_Menu(object, metaclass=Singleton):
         menu (ui.PopupMenu): Base menu that we populate based on the node found
         node (PyNode): Scene pynode that the menu will build for
         menu_dict (dictionary): Dictionary of menu items that get created, keyed by the menu's category
+        model_cache (dictionary): Lists of MenuItemModel keyed by (node type, property types, component type)
+        node_cache (dictionary): Metadata found for each node the menu has been built for, keyed by node
+        component_cache (dictionary): Rig component class objects keyed by component network node
+        graph_signature (tuple): Sorted UUIDs of the network nodes in the scene when the caches were filled, a change
+            in the metadata graph clears the caches
     '''
 
     def __init__(self):
@@ -60,6 +92,10 @@ class V1_Context_Menu(object, metaclass=Singleton):
         self.model_panel = None
         self.menu = None
         self.menu_dict = {}
+        self.model_cache = {}
+        self.node_cache = {}
+        self.component_cache = {}
+        self.graph_signature = None
 
         self.create_menu()
         self.reset_menu()
@@ -81,6 +117,25 @@ class V1_Context_Menu(object, metaclass=Singleton):
         '''
         pm.deleteUI(self.menu)
 
+    def clear_cache(self):
+        '''
+        Clear all cached menu models and node metadata so they're re-built on the next menu
+        '''
+        self.model_cache = {}
+        self.node_cache = {}
+        self.component_cache = {}
+        self.graph_signature = None
+
+    def validate_cache(self):
+        '''
+        Clear caches if network nodes have been created or deleted since they were filled.  Adding or removing properties,
+        characters, or rig components all create or delete network nodes.
+        '''
+        graph_signature = tuple(sorted(cmds.ls(type='network', uuid=True) or []))
+        if graph_signature != self.graph_signature:
+            self.clear_cache()
+            self.graph_signature = graph_signature
+
     def reset_menu(self):
         '''
         Clears out the node, menu_dict, and delets all items from our context menu
@@ -117,88 +172,192 @@ class V1_Context_Menu(object, metaclass=Singleton):
             self.node = sel_node
 
         if self.node:
+            build_start = time.perf_counter()
+            self.validate_cache()
+
             node_simple_name = self.node.name().split('|')[-1]
             #pm.inViewMessage(assistMessage = node_simple_name, position = "topCenter", fade = True, fontSize = 10, fst = 2000, dragKill = False)
             rig_menu = pm.menuItem(label=node_simple_name, parent=self.menu, rp="N")
-            if not metadata.meta_property_utils.get_properties_dict(self.node).get(ControlProperty):
-                # Build our Context Menu if we've found a dag object
-                self.menu_dict['properties'] = self.build_property_menu()
+
+            node_info = self.get_node_info(self.node)
+            component = node_info['component']
+            model_key = (type(self.node), node_info['property_types'], node_info['in_network'], type(component), node_info['is_component_core'])
+            menu_model = self.model_cache.get(model_key)
+            is_cached = menu_model is not None
+            if not is_cached:
+                menu_model = self.build_rig_component_model(node_info) if component else self.build_property_model(node_info)
+                self.model_cache[model_key] = menu_model
+
+            # Build our Context Menu if we've found a dag object
+            item_dict = self.create_from_model(menu_model)
+            if component:
+                component.create_menu(item_dict['rig_commands'], self.node)
+                self.menu_dict['rigging'] = item_dict
             else:
-                self.menu_dict['rigging'] = self.build_rig_component_menu()
+                self.menu_dict['properties'] = item_dict
 
-    def build_rig_component_menu(self):
+            v1_core.v1_logging.get_logger().debug("Context Menu built for {0} ({1}) in {2} Seconds".format(node_simple_name, "cached" if is_cached else "new", 
+                                                                                                       time.perf_counter() - build_start))
+
+    def get_node_info(self, node):
         '''
-        Build the menu for rig component objects.  Queries the rig component object for menu itmes
+        Get the metadata the menu needs for a node, cached until the metadata graph changes
+
+        Args:
+            node (PyNode): Maya scene node the menu is built for
+
+        Returns:
+            (dictionary). 'property_types' frozenset of property types on the node, 'in_network' whether the node is in the 
+                metadata graph, 'component' the rig component class object if the node is a rig control, 'is_component_core'
+                whether the component is a primary ComponentCore
         '''
-        component_network = metadata.meta_network_utils.get_first_network_entry(self.node, RigComponent)
-        component = rigging.rig_base.Component_Base.create_from_network_node(component_network.node)
+        node_info = self.node_cache.get(node)
+        component = node_info['component'] if node_info else None
+        if node_info and (not component or component.network['component'].node.exists()):
+            return node_info
+
+        property_types = frozenset(metadata.meta_property_utils.get_properties_dict(node).keys())
+        node_info = {'property_types': property_types, 'in_network': False, 'component': None, 'is_component_core': False}
+        if ControlProperty in property_types:
+            component_network = metadata.meta_network_utils.get_first_network_entry(node, RigComponent)
+            component = self.component_cache.get(component_network.node)
+            if not component:
+                component = rigging.rig_base.Component_Base.create_from_network_node(component_network.node)
+                self.component_cache[component_network.node] = component
+            node_info['component'] = component
+            node_info['is_component_core'] = type(component_network) == ComponentCore
+        else:
+            node_info['in_network'] = bool(metadata.meta_network_utils.get_network_entries(node))
 
-        character_network = component_network.get_upstream(CharacterCore)
+        self.node_cache[node] = node_info
+        return node_info
 
-        rig_menu = pm.menuItem(label='Rig Commands', parent=self.menu, subMenu=True, rp="S")
-        component.create_menu(rig_menu, self.node)
+    def create_from_model(self, menu_model):
+        '''
+        Create menu items from a list of MenuItemModel, binding each command to the current node
+
+        Args:
+            menu_model (list<MenuItemModel>): Items to create, parents must come before their children
+
+        Returns:
+            (dictionary). Created menu items keyed by their MenuItemModel key
+        '''
+        item_dict = {None: self.menu}
+        for item_model in menu_model:
+            menu_kwargs = dict(item_model.menu_kwargs)
+            if item_model.command:
+                menu_kwargs['command'] = (lambda item_model: lambda _: self.run_model_command(item_model))(item_model)
+            menu_item = pm.menuItem(label=item_model.label, parent=item_dict[item_model.parent_key], **menu_kwargs)
+            if item_model.key:
+                item_dict[item_model.key] = menu_item
+
+        return item_dict
+
+    def run_model_command(self, item_model):
+        '''
+        Run the command for a menu item on the node the menu was built for
 
-        rotate_order_menu = pm.menuItem(label = "Change Rotate Order", subMenu=True, rp="W", parent=self.menu)
+        Args:
+            item_model (MenuItemModel): The clicked menu item
+        '''
+        method, args, kwargs = v1_core.v1_logging.logging_wrapper(item_model.command, "Context Menu", self.node, *item_model.args)
+        return method(*args, **kwargs)
+
+    def build_rig_component_model(self, node_info):
+        '''
+        Build the menu for rig component objects.  Items from the rig component object are added to the 'rig_commands'
+        sub menu when the menu is shown
+
+        Args:
+            node_info (dictionary): Node metadata from get_node_info()
+
+        Returns:
+            (list<MenuItemModel>). Menu items for the rig control
+        '''
+        menu_model = [MenuItemModel('Rig Commands', key='rig_commands', subMenu=True, rp="S"),
+                      MenuItemModel("Change Rotate Order", key='rotate_order', subMenu=True, rp="W")]
         # Order of this list needs to match Maya rotate order dropdown on joints
         for i, rot_order in enumerate(['xyz', 'yzx', 'zxy', 'xzy', 'yxz', 'zyx']):
-            com = (lambda i: lambda _: maya_utils.node_utils.change_rotate_order(self.node, i))(i)
-            pm.menuItem(label=rot_order, parent=rotate_order_menu, command = com)
+            menu_model.append(MenuItemModel(rot_order, parent_key='rotate_order', command=maya_utils.node_utils.change_rotate_order, args=[i]))
 
         #lj_method, lj_args, lj_kwargs = v1_core.v1_logging.logging_wrapper(rigging.file_ops.load_from_json_with_dialog, "Context Menu", character_network)
         #rig_menu = pm.menuItem(label='Load File...', parent=self.menu, rp="W", command = lambda _: lj_method(*lj_args, **lj_kwargs))
 
-        if type(component_network) == ComponentCore:
-            sa_method, sa_args, sa_kwargs = v1_core.v1_logging.logging_wrapper(component.bake_and_remove, "Context Menu", baking_queue = None)
-            rig_menu = pm.menuItem(label='Bake And Remove', parent=self.menu, rp="E", command = lambda _: sa_method(*sa_args, **sa_kwargs))
+        if node_info['is_component_core']:
+            menu_model.append(MenuItemModel('Bake And Remove', command=self.bake_and_remove_component, rp="E"))
+
+        return menu_model
+
+    def bake_and_remove_component(self, node):
+        '''
+        Bake and remove the rig component that the given control belongs to
 
-    def build_property_menu(self):
+        Args:
+            node (PyNode): Rig control the menu was built for
+        '''
+        self.get_node_info(node)['component'].bake_and_remove(baking_queue = None)
+
+    def build_property_model(self, node_info):
         '''
         Build the menu for non-rig objects, if part of a meta network query to metadata.meta_properties to get 
         appropriate menu items.
-        '''
-        if metadata.meta_network_utils.get_network_entries(self.node):
-            current_property_list = metadata.meta_property_utils.get_properties_dict(self.node).keys()
 
-            prop_menu = pm.menuItem(label='Properties', parent=self.menu, subMenu=True, rp="S")
-            self.create_properties(CommonProperty, prop_menu, current_property_list)
-            if type(self.node) == pm.nodetypes.Joint:
-                self.create_properties(JointProperty, prop_menu, current_property_list)
+        Args:
+            node_info (dictionary): Node metadata from get_node_info()
 
-                quick_rig_method, quick_rig_args, quick_rig_kwargs = v1_core.v1_logging.logging_wrapper(rigging.rig_tools.quick_rig_joint, "Context Menu", self.node)
-                quick_rig_menu = pm.menuItem(label='Load Last Preset', parent=self.menu, rp="E", command = lambda _: quick_rig_method(*quick_rig_args, **quick_rig_kwargs))
+        Returns:
+            (list<MenuItemModel>). Menu items for the node
+        '''
+        menu_model = []
+        if node_info['in_network']:
+            current_property_list = node_info['property_types']
 
-                selection = pm.ls(sl=True)
-                tfk_rig_method, tfk_rig_args, tfk_rig_kwargs = v1_core.v1_logging.logging_wrapper(rigging.rig_tools.temporary_rig, "Context Menu", selection[0], selection[-1], FK)
-                quick_rig_menu = pm.menuItem(label='Temporary FK', parent=self.menu, rp="NE", command = lambda _: tfk_rig_method(*tfk_rig_args, **tfk_rig_kwargs))
+            menu_model.append(MenuItemModel('Properties', key='properties', subMenu=True, rp="S"))
+            menu_model.extend(self.create_properties(CommonProperty, 'properties', current_property_list))
+            if type(self.node) == pm.nodetypes.Joint:
+                menu_model.extend(self.create_properties(JointProperty, 'properties', current_property_list))
 
-                tik_rig_method, tik_rig_args, tik_rig_kwargs = v1_core.v1_logging.logging_wrapper(rigging.rig_tools.temporary_rig, "Context Menu", selection[0], selection[-1], IK)
-                quick_rig_menu = pm.menuItem(label='Temporary IK', parent=self.menu, rp="SE", command = lambda _: tik_rig_method(*tik_rig_args, **tik_rig_kwargs))
+                menu_model.append(MenuItemModel('Load Last Preset', command=rigging.rig_tools.quick_rig_joint, rp="E"))
+                menu_model.append(MenuItemModel('Temporary FK', command=self.temporary_rig, args=[FK], rp="NE"))
+                menu_model.append(MenuItemModel('Temporary IK', command=self.temporary_rig, args=[IK], rp="SE"))
             elif type(self.node) == pm.nodetypes.Transform:
-                self.create_properties(ModelProperty, prop_menu, current_property_list)
+                menu_model.extend(self.create_properties(ModelProperty, 'properties', current_property_list))
         else:
-            char_method, char_args, char_kwargs = v1_core.v1_logging.logging_wrapper(freeform_utils.character_utils.characterize_skeleton, "Context Menu", self.node)
-            prop_menu = pm.menuItem(label='Characterize Skeleton', parent=self.menu, rp="S", command = lambda _: char_method(*char_args, **char_kwargs))
+            menu_model.append(MenuItemModel('Characterize Skeleton', command=freeform_utils.character_utils.characterize_skeleton, rp="S"))
+            menu_model.append(MenuItemModel('Characterize...', key='characterize', subMenu=True, rp="W"))
+            menu_model.append(MenuItemModel('UE4 Charaterize', parent_key='characterize', command=rigging.rig_tools.character_setup_from_ue4, rp="W"))
+            menu_model.append(MenuItemModel('3ds Max Characterize', parent_key='characterize', command=freeform_utils.character_utils.characterize_with_zeroing, rp="S"))
 
-            characterize_menu = pm.menuItem(label='Characterize...', parent=self.menu, subMenu=True, rp="W")
+        return menu_model
 
-            ue4_char_method, ue4_char_args, ue4_char_kwargs = v1_core.v1_logging.logging_wrapper(rigging.rig_tools.character_setup_from_ue4, "Context Menu", self.node)
-            prop_menu = pm.menuItem(label='UE4 Charaterize', parent=characterize_menu, rp="W", command = lambda _: ue4_char_method(*ue4_char_args, **ue4_char_kwargs))
-
-            max_method, max_args, max_kwargs = v1_core.v1_logging.logging_wrapper(freeform_utils.character_utils.characterize_with_zeroing, "Context Menu", self.node)
-            prop_menu = pm.menuItem(label='3ds Max Characterize', parent=characterize_menu, rp="S", command = lambda _: max_method(*max_args, **max_kwargs))
+    def temporary_rig(self, node, component_type):
+        '''
+        Build a temporary rig component from the first to the last selected joint
 
+        Args:
+            node (PyNode): Joint the menu was built for
+            component_type (type): Rig component type to build
+        '''
+        selection = pm.ls(sl=True)
+        rigging.rig_tools.temporary_rig(selection[0], selection[-1], component_type)
 
-    def create_properties(self, base_class, prop_menu, current_properties):
+    def create_properties(self, base_class, parent_key, current_properties):
         '''
         Create the menu items queried off of the provided class type
 
         Args:
             base_class (type): meta_propeties type to get menu items from
-            prop_menu (ui.PopupMenu): The parent menu to add items to
+            parent_key (string): MenuItemModel key of the parent menu to add items to
             current_properties (list): List to check against to ensure we don't add menu items twice if there are multiple
                 properties on the object.
+
+        Returns:
+            (list<MenuItemModel>). Menu items to add each property
         '''
+        menu_model = []
         for prop in [x for x in base_class.get_inherited_classes() if x not in current_properties]:
             prop_module_type = v1_shared.shared_utils.get_class_info(str(prop))
-            com = (lambda prop_module_type: lambda _: metadata.meta_property_utils.add_property_by_name(self.node, prop_module_type))(prop_module_type)
-            pm.menuItem(label=prop_module_type[1], parent=prop_menu, command = com)
\ No newline at end of file
+            menu_model.append(MenuItemModel(prop_module_type[1], parent_key=parent_key, command=metadata.meta_property_utils.add_property_by_name, 
+                                            args=[prop_module_type]))
+
+        return menu_model
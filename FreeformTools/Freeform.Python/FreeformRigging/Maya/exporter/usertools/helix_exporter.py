@@ -23,9 +23,11 @@ import Freeform.Rigging.DCCAssetExporter as DCCAssetExporter
 import System.Diagnostics
 
 import pymel.core as pm
+import maya.cmds as cmds
 
 import os
 import sys
+import time
 
 import maya_utils
 import metadata
@@ -39,6 +41,7 @@ from metadata.network_registry import Network_Registry, Property_Registry
 
 import v1_core
 
+from v1_shared.shared_utils import get_first_or_default
 from v1_shared.decorators import csharp_error_catcher
 from maya_utils.decorators import undoable
 
@@ -96,7 +99,11 @@ class HelixExporter(object):
         process (System.Diagnostics.Process): The process for the program calling the UI
         ui (Freeform.Rigging.UE4AssetCreator.DestructionCreator): The C# ui class object
         vm (Freeform.Rigging.UE4AssetCreator.DestructionCreatorVM): The C# view model class object
+        definition_cache (dictionary): Definition node UUID to (signature, DCCAssetExporter.ExportDefinition)
+        asset_cache (dictionary): Asset node UUID to (signature, DCCAssetExporter.ExportAsset)
     '''
+    definition_attributes = ['guid', 'ui_index', 'definition_name', 'start_frame', 'end_frame', 'frame_range', 'use_scene_name', 'folder_path', 'do_export']
+    asset_attributes = ['guid', 'ui_index', 'asset_name', 'asset_type', 'export_path', 'zero_export', 'use_export_path']
 
     @staticmethod
     def export_all():
@@ -105,15 +112,18 @@ class HelixExporter(object):
         '''
         HelixExporter.print_export_started()
 
+        # Share one animation layer state across every export, layers are restored once when all exports finish
         export_definition_list = metadata.meta_network_utils.get_all_network_nodes(ExportDefinition)
-        for definition_node in export_definition_list:
-            new_definition = HelixExporter.create_definition(definition_node,
-                                                                attribute_changed = metadata.meta_property_utils.attribute_changed, 
-                                                                get_scene_name = maya_utils.scene_utils.get_scene_name_csharp)
+        with maya_utils.anim_attr_utils.AnimLayerState.session() as layer_state:
+            for definition_node in export_definition_list:
+                new_definition = HelixExporter.create_definition(definition_node,
+                                                                    attribute_changed = metadata.meta_property_utils.attribute_changed, 
+                                                                    get_scene_name = maya_utils.scene_utils.get_scene_name_csharp)
 
-            for asset_node in definition_node.message.listConnections(type='network'):
-                new_asset = HelixExporter.create_asset(asset_node)
-                new_asset.Export(new_definition)
+                for asset_node in definition_node.message.listConnections(type='network'):
+                    new_asset = HelixExporter.create_asset(asset_node)
+                    new_asset.Export(new_definition)
+        v1_core.v1_logging.get_logger().info("HelixExporter - {0} Animation Layer Edits".format(layer_state.edit_count))
 
         HelixExporter.print_export_finished()
         
@@ -131,7 +141,8 @@ class HelixExporter(object):
                                                         attribute_changed = metadata.meta_property_utils.attribute_changed, 
                                                         get_scene_name = maya_utils.scene_utils.get_scene_name_csharp)
         c_asset = HelixExporter.create_asset(asset_node)
-        c_asset.Export(c_definition)
+        with maya_utils.anim_attr_utils.AnimLayerState.session():
+            c_asset.Export(c_definition)
 
         HelixExporter.print_export_finished()
         
@@ -146,9 +157,10 @@ class HelixExporter(object):
                                                         attribute_changed = metadata.meta_property_utils.attribute_changed, 
                                                         get_scene_name = maya_utils.scene_utils.get_scene_name_csharp)
 
-        for asset_node in definition_node.message.listConnections(type='network'):
-            new_asset = HelixExporter.create_asset(asset_node)
-            new_asset.Export(c_definition)
+        with maya_utils.anim_attr_utils.AnimLayerState.session():
+            for asset_node in definition_node.message.listConnections(type='network'):
+                new_asset = HelixExporter.create_asset(asset_node)
+                new_asset.Export(c_definition)
 
         HelixExporter.print_export_finished()
 
@@ -234,6 +246,9 @@ class HelixExporter(object):
         self.ui = DCCAssetExporter.DCCAssetExporter(self.process)
         self.vm = self.ui.DataContext
 
+        self.definition_cache = {}
+        self.asset_cache = {}
+
         # Load Event Handlers
         self.vm.CloseWindowEventHandler += self.close
         self.vm.AutoSetupHandler += self.auto_setup
@@ -264,6 +279,8 @@ class HelixExporter(object):
         self.vm.SelectedAssetType = "Character Animation"
 
         self.vm.UpdateExporterUI()
+        # Cached UI objects hold on to scene nodes, so they must be cleared before the UI updates on scene open
+        scene_tools.scene_manager.SceneManager.update_method_list.append(self.exporter_clear_cache)
         scene_tools.scene_manager.SceneManager.update_method_list.append(self.vm.UpdateExporterUI)
 
         exporter_category = v1_core.global_settings.GlobalSettings().get_category(v1_core.global_settings.ExporterSettings)
@@ -300,6 +317,7 @@ class HelixExporter(object):
         self.vm.ExportWrapperEndHandler -= self.export_wrapper_end
         self.vm.SaveSettingHandler -= self.save_setting
 
+        scene_tools.scene_manager.SceneManager().remove_method(self.exporter_clear_cache)
         scene_tools.scene_manager.SceneManager().remove_method(self.vm.UpdateExporterUI)
 
 
@@ -313,17 +331,101 @@ class HelixExporter(object):
         scene_tools.scene_manager.SceneManager().run_by_string('UpdateExporterUI')
 
 
+    def exporter_clear_cache(self):
+        '''
+        Clear all cached C# definitions and assets so the next UI update creates them all from the scene
+        '''
+        self.definition_cache = {}
+        self.asset_cache = {}
+
+    @staticmethod
+    def get_node_signature(node, attribute_list):
+        '''
+        Builds a signature of everything the UI reads from an export network node, the node name, the values
+        of the UI attributes and the names and attribute values of all connected export property nodes
+
+        Args:
+            node (nt.Network): Network node for an export definition or asset
+            attribute_list (list<string>): Names of the attributes the UI object is built from
+
+        Returns:
+            (tuple). Hashable signature of the node's current state
+        '''
+        value_list = [getattr(node, x).get() if node.hasAttr(x) else None for x in attribute_list]
+        property_name_list = [x.longName() for x in pm.listConnections(node.affectedBy, type='network')] if node.hasAttr('affectedBy') else []
+
+        property_signature_list = []
+        for property_name in sorted(property_name_list):
+            property_value_list = []
+            for attr_name in cmds.listAttr(property_name, userDefined=True) or []:
+                plug = "{0}.{1}".format(property_name, attr_name)
+                # Skip connection only and compound child attributes that have no value of their own
+                try:
+                    if cmds.getAttr(plug, type=True) != 'message':
+                        property_value_list.append((attr_name, str(cmds.getAttr(plug))))
+                except (RuntimeError, ValueError):
+                    continue
+            property_signature_list.append((property_name, tuple(property_value_list)))
+
+        return (node.longName(), tuple(value_list), tuple(property_signature_list))
+
+    @staticmethod
+    def get_node_uuid(node):
+        '''
+        Get the UUID for a scene node, which is stable through renames and scene reloads
+
+        Args:
+            node (PyNode): Maya scene node
+
+        Returns:
+            (string). UUID of the scene node
+        '''
+        return get_first_or_default(pm.ls(node, uuid=True))
+
+    def get_cached_ui_object(self, node, cache, attribute_list):
+        '''
+        Find the cached C# object for a node if the node hasn't changed since it was created
+
+        Args:
+            node (nt.Network): Network node for an export definition or asset
+            cache (dictionary): The definition_cache or asset_cache to search
+            attribute_list (list<string>): Names of the attributes the UI object is built from
+
+        Returns:
+            (string, tuple, C# object). The node UUID, node signature, and the cached C# object or None if the node changed
+        '''
+        uuid = HelixExporter.get_node_uuid(node)
+        signature = HelixExporter.get_node_signature(node, attribute_list)
+        cached_signature, c_object = cache.get(uuid, (None, None))
+
+        return uuid, signature, c_object if cached_signature == signature else None
+
     @csharp_error_catcher
     def update_from_scene(self, vm, event_args):
         '''
         update_from_scene(self, vm, event_args)
+        Repopulates the UI from the scene.  C# objects are cached by network node UUID and re-used as long as
+        the node signature is unchanged, so only new or changed definitions and assets are created and only
+        their attributes and event handlers get set up
         '''
+        update_start = time.perf_counter()
+        type_list = self.export_property_type_list + [ExportDefinition]
+        network_node_dict = metadata.meta_network_utils.get_all_network_nodes_by_type(type_list)
+
         asset_list = []
         for export_property_type in self.export_property_type_list:
-            asset_list = asset_list + metadata.meta_network_utils.get_all_network_nodes(export_property_type)
+            asset_list = asset_list + network_node_dict[export_property_type]
+
+        asset_cache = {}
+        new_asset_list = []
         for asset_node in asset_list:
-            asset = HelixExporter.create_asset(asset_node, metadata.meta_property_utils.attribute_changed, self.asset_export_toggle)
+            uuid, signature, asset = self.get_cached_ui_object(asset_node, self.asset_cache, HelixExporter.asset_attributes)
+            if not asset:
+                asset = HelixExporter.create_asset(asset_node, metadata.meta_property_utils.attribute_changed, self.asset_export_toggle)
+                new_asset_list.append(asset)
+            asset_cache[uuid] = (signature, asset)
             self.vm.AddExportAsset(asset)
+        reused_asset_count = len(asset_list) - len(new_asset_list)
 
         anim_layer_list = maya_utils.anim_attr_utils.get_all_anim_layers(False)
         for anim_layer in anim_layer_list:
@@ -338,10 +440,11 @@ class HelixExporter(object):
             self.vm.SelectSceneObjects = False
             self.vm.SelectedAsset = asset_list[0]
             self.vm.SelectSceneObjects = True
-            for asset in asset_list:
+            # Cached assets already have their export properties and have been through the upgrade checks
+            for asset in new_asset_list:
                 asset_node = pm.PyNode(asset.NodeName)
                 asset_network = metadata.meta_network_utils.create_from_node(asset_node)
-                remove_anim = asset_network.get("remove_root_animation", "bool")
+                remove_asset_anim = asset_network.get("remove_root_animation", "bool")
                 zero_character = asset_network.get("zero_export", "bool")
                 if zero_character:
                     asset.ZeroExport = False
@@ -350,26 +453,46 @@ class HelixExporter(object):
                         zero_character_network = ZeroCharacterProperty()
                         zero_character_network.connect_node(asset_node)
 
-                if remove_anim:
+                if remove_asset_anim:
+                    remove_anim = True
                     asset_network.set("remove_root_animation", False, "bool")
-                    break
 
                 self.create_export_properties(asset, asset_node)
 
-        export_definition_list = metadata.meta_network_utils.get_all_network_nodes(ExportDefinition)
+            # Upgrade checks can change attributes on new assets, so re-sign them to keep them cached
+            for uuid, (signature, asset) in asset_cache.items():
+                if asset in new_asset_list and pm.objExists(asset.NodeName):
+                    asset_cache[uuid] = (HelixExporter.get_node_signature(pm.PyNode(asset.NodeName), HelixExporter.asset_attributes), asset)
+
+        export_definition_list = network_node_dict[ExportDefinition]
+        definition_cache = {}
+        new_definition_count = 0
         for definition_node in export_definition_list:
-            has_remove_root = metadata.meta_property_utils.get_property(definition_node, RemoveRootAnimationProperty)
+            has_remove_root = metadata.meta_property_utils.get_property(definition_node, RemoveRootAnimationProperty) if remove_anim else True
             if remove_anim and not has_remove_root:
                 remove_root_anim_network = RemoveRootAnimationProperty()
                 remove_root_anim_network.connect_node(definition_node)
 
-            definition = HelixExporter.create_definition(definition_node, metadata.meta_property_utils.attribute_changed, self.set_frame, self.get_frame, 
-                                                            self.get_frame_range, maya_utils.scene_utils.get_scene_name_csharp)
+            uuid, signature, definition = self.get_cached_ui_object(definition_node, self.definition_cache, HelixExporter.definition_attributes)
+            if not definition:
+                definition = HelixExporter.create_definition(definition_node, metadata.meta_property_utils.attribute_changed, self.set_frame, self.get_frame, 
+                                                                self.get_frame_range, maya_utils.scene_utils.get_scene_name_csharp)
+                # Look for anim properties
+                self.create_export_properties(definition, definition_node)
+                new_definition_count += 1
+                # create_definition may add the do_export attribute, so signature after creation
+                signature = HelixExporter.get_node_signature(definition_node, HelixExporter.definition_attributes)
+
+            definition_cache[uuid] = (signature, definition)
             self.vm.AddExportDefinition(definition)
             self.vm.SelectedDefinition = definition
 
-            # Look for anim properties
-            self.create_export_properties(definition, definition_node)
+        # Replacing the caches drops any definitions and assets whose nodes were removed from the scene
+        self.asset_cache = asset_cache
+        self.definition_cache = definition_cache
+
+        v1_core.v1_logging.get_logger().debug("HelixExporter - UI updated in {0} seconds. Definitions: {1} new, {2} re-used. Assets: {3} new, {4} re-used".format(
+            time.perf_counter() - update_start, new_definition_count, len(export_definition_list) - new_definition_count, len(new_asset_list), reused_asset_count))
 
     def create_export_properties(self, c_export_object, scene_node):
         '''
@@ -20,16 +20,21 @@ If not, see <https://www.gnu.org/licenses/>.
 import System
 import System.Diagnostics
 
+import math
+
 import metadata
 import rigging
 
 from metadata.network_core import ComponentCore
 
 import maya_utils.anim_attr_utils
+import maya_utils.keyframe_utils
 import maya_utils.scene_utils
 import pymel.core as pm
+import maya.cmds as cmds
+import maya.api.OpenMaya as OpenMaya
+import v1_math
 from v1_shared.decorators import csharp_error_catcher
-from v1_math.vector import Vector
 
 from v1_shared.shared_utils import get_first_or_default, get_index_or_default, get_last_or_default
 
@@ -59,38 +64,20 @@ class AnimAttributes(object):
         self.target = pm.PyNode(self.target)
         maya_utils.anim_attr_utils.create_float_attr(self.target, 'DistanceCurve')
 
+        frame_list = list(range(self.start_time, self.end_time+1))
+        position_list, rotation_list = self.get_world_samples(self.start_time, self.end_time)
+
         # TRANSLATION
         if(self.use_translation(self.start_time, self.end_time)):
-            if(from_zero == True):
-                pm.setCurrentTime(self.start_time)
-            else:
-                pm.setCurrentTime(self.end_time)
-
-            referencePos = self.target.getTranslation(space='world')
-            for frame in range(self.start_time, self.end_time+1):
-                pm.setCurrentTime(frame)
-                currPos = self.target.getTranslation(space='world')
-
-                dist = currPos.distanceTo(referencePos)
-                if(from_zero == True):
-                    maya_utils.anim_attr_utils.set_attr_key(self.target, 'DistanceCurve', dist)
-                else:
-                    maya_utils.anim_attr_utils.set_attr_key(self.target, 'DistanceCurve', -dist)
-        # ROTATION	
+            reference_position = position_list[0] if from_zero else position_list[-1]
+            distance_list = v1_math.trajectory.distance_curve(position_list, reference_position)
+            value_list = distance_list if from_zero else [-x for x in distance_list]
+        # ROTATION
         else:
-            pm.setCurrentTime(self.end_time)
-            referenceRot = pm.xform(self.target, q=True, ws=True, ro=True)
-
-            for frame in range(self.start_time, self.end_time+1):
-                pm.setCurrentTime(frame)
-                currRot = pm.xform(self.target, q=True, ws=True, ro=True)
+            angle_list = v1_math.trajectory.angle_curve(rotation_list, rotation_list[-1])
+            value_list = [-x for x in angle_list]
 
-                currX = abs(currRot[0] - referenceRot[0])
-                currY = abs(currRot[1] - referenceRot[1])
-                currZ = abs(currRot[2] - referenceRot[2])
-                currAngle = maya_utils.anim_attr_utils.get_angle_from_euler(currX, currY, currZ)
-
-                maya_utils.anim_attr_utils.set_attr_key(self.target, 'DistanceCurve', -currAngle)
+        maya_utils.keyframe_utils.set_keys_bulk(self.target.DistanceCurve, frame_list, value_list)
 
 
     @csharp_error_catcher
@@ -105,22 +92,36 @@ class AnimAttributes(object):
 
         fps = maya_utils.scene_utils.get_scene_fps()
 
-        #handle first keyframe edge case
-        pm.setCurrentTime(self.start_time+1)
-        currPos = self.target.getTranslation(space='world')
+        frame_list = list(range(self.start_time, self.end_time+1))
+        position_list = self.get_world_samples(self.start_time, self.end_time)[0]
+        speed_list = v1_math.trajectory.speed_curve(position_list, fps)
+
+        maya_utils.keyframe_utils.set_keys_bulk(self.target.SpeedCurve, frame_list, speed_list)
+
+    def get_world_samples(self, start_time, end_time):
+        '''
+        Sample the world space translation and rotation of the target across the time range in one pass, evaluating
+        the world matrix at each time instead of stepping the scene's current time
+
+        Args:
+            start_time (int): First frame to sample
+            end_time (int): Last frame to sample
 
-        pm.setCurrentTime(self.start_time)
-        lastPos = self.target.getTranslation(space='world')
-        speed = lastPos.distanceTo(currPos) / (1.0 / fps)
-        maya_utils.anim_attr_utils.set_attr_key(self.target, 'SpeedCurve', speed)
+        Returns:
+            (list<tuple>, list<tuple>). World space (x,y,z) translations and (x,y,z) euler rotations in degrees for each frame
+        '''
+        rotate_order = self.target.rotateOrder.get()
+        world_matrix_attr = self.target.worldMatrix.name()
 
-        for frame in range(self.start_time+1, self.end_time+1):
-            pm.setCurrentTime(frame)
-            currPos = self.target.getTranslation(space='world')
+        position_list = []
+        rotation_list = []
+        for frame in range(start_time, end_time+1):
+            transform_matrix = OpenMaya.MTransformationMatrix(OpenMaya.MMatrix(cmds.getAttr(world_matrix_attr, time=frame)))
+            position_list.append(tuple(transform_matrix.translation(OpenMaya.MSpace.kWorld)))
+            euler_rotation = transform_matrix.rotation().reorder(rotate_order)
+            rotation_list.append((math.degrees(euler_rotation.x), math.degrees(euler_rotation.y), math.degrees(euler_rotation.z)))
 
-            speed = lastPos.distanceTo(currPos) / (1.0 / fps)
-            maya_utils.anim_attr_utils.set_attr_key(self.target, 'SpeedCurve', speed)
-            lastPos = currPos
+        return position_list, rotation_list
 
 
     @csharp_error_catcher
@@ -165,15 +166,9 @@ class AnimAttributes(object):
         Analyze the control object across the export time line to see if it is translating or rotating.  If it moves
         1 full unit assume it's moving, if it rotates 1 degree, assume it's rotating.
         '''
-        pm.currentTime(start_time)
-        start_distance = Vector(pm.xform(self.target, t=True, q=True)).length3D()
-        start_rotate = Vector(pm.xform(self.target, ro=True, q=True)).length3D()
-        for frame in range(start_time, end_time+1):
-            pm.currentTime(frame)
-            current_distance = Vector(pm.xform(self.target, t=True, q=True)).length3D()
-            current_rotate = Vector(pm.xform(self.target, ro=True, q=True)).length3D()
-            if abs(current_distance - start_distance) > 1:
-                return True
-            if abs(current_rotate - start_rotate) > 1:
-                return False
-        return False
\ No newline at end of file
+        target_name = self.target.name()
+        frame_list = range(start_time, end_time+1)
+        translation_list = [get_first_or_default(cmds.getAttr(target_name + ".translate", time=x)) for x in frame_list]
+        rotation_list = [get_first_or_default(cmds.getAttr(target_name + ".rotate", time=x)) for x in frame_list]
+
+        return v1_math.trajectory.is_translating(translation_list, rotation_list)
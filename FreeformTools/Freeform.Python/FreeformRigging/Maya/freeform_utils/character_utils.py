@@ -18,6 +18,7 @@ If not, see <https://www.gnu.org/licenses/>.
 '''
 
 import pymel.core as pm
+import maya.api.OpenMaya as OpenMaya
 
 import System
 import Freeform.Core
@@ -397,6 +398,151 @@ def mirror_center_pose(region_network, axis):
         maya_utils.node_utils.flip_transforms(region_control, v1_shared.shared_utils.get_mirror_attributes(axis))
 
 
+class MirrorIndex(object):
+    '''
+    Lookup of every rig component and control on a character by side, region, and control ordered_index, with
+    reverse lookups from the component and control.  Built once per RigCore network from the metadata graph so finding
+    mirror partners doesn't walk component networks and read the ControlProperty of every candidate control.
+    Indexes are cached by the RigCore guid until clear() is called for the character when rigging is built or removed,
+    and every index is cleared before a scene is opened or a new scene is made.
+
+    Attributes:
+        index_dict (dict<string, MirrorIndex>): Class level cache of built indexes by RigCore guid
+        callback_id_list (list<int>): Scene message callbacks that clear the cache on scene open and new scene
+        component_dict (dict<(string, string), ComponentCore>): First component found by lower case (side, region)
+        component_key_dict (dict<string, (string, string)>): Reverse lookup from component guid to (side, region)
+        control_dict (dict<(string, string, int), PyNode>): Controls of the components in component_dict by 
+            (side, region, ordered_index)
+        control_key_dict (dict<PyNode, (string, string, int)>): Reverse lookup from any control to (side, region, ordered_index)
+        sorted_control_dict (dict<string, list<PyNode>>): Controls of each component sorted by hierarchy, by component guid
+    '''
+    index_dict = {}
+    callback_id_list = []
+
+    @classmethod
+    def get_index(cls, component_network):
+        '''
+        Get the MirrorIndex for the character that the given component belongs to, building it if it doesn't exist
+        or the component is newer than the cached index
+
+        Args:
+            component_network (ComponentCore): Any rig component MetaNode on the character
+
+        Returns:
+            (MirrorIndex). The index for the character
+        '''
+        if not cls.callback_id_list:
+            cls.callback_id_list = [OpenMaya.MSceneMessage.addCallback(x, cls.clear_all) for x in
+                                    [OpenMaya.MSceneMessage.kBeforeOpen, OpenMaya.MSceneMessage.kBeforeNew]]
+
+        rig_network = component_network.get_upstream(RigCore)
+        rig_guid = rig_network.get('guid')
+
+        mirror_index = cls.index_dict.get(rig_guid)
+        # A re-opened file or a second import of the same character has a RigCore with the same guid on another node
+        is_valid = mirror_index and mirror_index.rig_node.exists() and mirror_index.rig_node == rig_network.node
+        if not is_valid or component_network.get('guid') not in mirror_index.component_key_dict:
+            # Drop indexes from characters that have been deleted or left behind by a scene change
+            for guid in [k for k, v in cls.index_dict.items() if not v.rig_node.exists()]:
+                del cls.index_dict[guid]
+
+            mirror_index = cls(rig_network)
+            cls.index_dict[rig_guid] = mirror_index
+
+        return mirror_index
+
+    @classmethod
+    def clear(cls, character_network = None):
+        '''
+        Remove cached indexes so they are re-built on next use
+
+        Args:
+            character_network (CharacterCore): Character to clear the index for, if None all indexes are cleared
+        '''
+        if not character_network:
+            cls.index_dict.clear()
+            return
+
+        rig_network = character_network.get_downstream(RigCore)
+        if rig_network:
+            cls.index_dict.pop(rig_network.get('guid'), None)
+
+    @classmethod
+    def clear_all(cls, *args):
+        '''
+        Remove every cached index, run from scene message callbacks before a scene is opened or a new scene is made
+        '''
+        cls.index_dict.clear()
+
+    def __init__(self, rig_network):
+        self.rig_node = rig_network.node
+        self.component_dict = {}
+        self.component_key_dict = {}
+        self.control_dict = {}
+        self.control_key_dict = {}
+        self.sorted_control_dict = {}
+
+        index_start = time.perf_counter()
+        for component_network in rig_network.get_all_downstream(ComponentCore):
+            component_guid = component_network.get('guid')
+            component_key = (component_network.get('side').lower(), component_network.get('region').lower())
+            self.component_key_dict[component_guid] = component_key
+            is_primary = component_key not in self.component_dict
+            if is_primary:
+                self.component_dict[component_key] = component_network
+
+            control_list = component_network.get_downstream(ControlJoints).get_connections()
+            self.sorted_control_dict[component_guid] = rigging.skeleton.sort_chain_by_hierarchy(control_list)
+            for control in control_list:
+                control_property = metadata.meta_property_utils.get_property(control, ControlProperty)
+                control_key = component_key + (control_property.get('ordered_index') if control_property else None,)
+                self.control_key_dict[control] = control_key
+                if is_primary:
+                    self.control_dict[control_key] = control
+
+        v1_core.v1_logging.get_logger().debug("MirrorIndex built for {0} in {1} Seconds".format(self.rig_node, time.perf_counter() - index_start))
+
+    def get_mirror_component(self, component_network, mirror_dict):
+        '''
+        Find the component on the opposite side of the character from the given component
+
+        Args:
+            component_network (ComponentCore): Rig component MetaNode to find the mirror of
+            mirror_dict (dict<string,string>): String pairs to define how to match sides, such as "left":"right"
+
+        Returns:
+            (ComponentCore). The mirror component MetaNode, or None if there is no match
+        '''
+        side, region = self.component_key_dict[component_network.get('guid')]
+        return self.component_dict.get((get_mirror_from_dict(mirror_dict, side), region))
+
+    def get_mirror_control(self, control_obj, mirror_dict):
+        '''
+        Find the control with the same ordered_index on the opposite side of the character from the given control
+
+        Args:
+            control_obj (PyNode): Maya scene rig control to find the mirror of
+            mirror_dict (dict<string,string>): String pairs to define how to match sides, such as "left":"right"
+
+        Returns:
+            (PyNode). The mirror control, or None if there is no match
+        '''
+        side, region, ordered_index = self.control_key_dict[control_obj]
+        return self.control_dict.get((get_mirror_from_dict(mirror_dict, side), region, ordered_index))
+
+    def get_sorted_controls(self, component_network):
+        '''
+        Get the controls for a component sorted by hierarchy
+
+        Args:
+            component_network (ComponentCore): Rig component MetaNode to get controls from
+
+        Returns:
+            (list<PyNode>). Copy of the list of controls for the component
+        '''
+        return list(self.sorted_control_dict[component_network.get('guid')])
+
+
 def get_mirror_network_from_control(control_obj, mirror_dict):
     component_network = metadata.meta_network_utils.get_first_network_entry(control_obj, ComponentCore)
     mirror_network = get_matching_component(component_network, mirror_dict)
@@ -418,14 +564,19 @@ def mirror_matching_regions(source_network, mirror_network, axis, single_directi
 def mirror_pose_matching_regions(source_network, mirror_network, axis, single_direction):
     source_control_list, mirror_control_list = get_matching_region_controls(source_network, mirror_network)
 
+    world_pair_list = []
     for source_control, mirror_control in zip(source_control_list, mirror_control_list):
         control_property = metadata.meta_property_utils.get_property(source_control, ControlProperty)
         is_world = control_property.get('world_space', 'bool') if control_property else False
         if is_world:
-            maya_utils.node_utils.world_space_mirror(source_control, mirror_control, axis, single_direction)
+            world_pair_list.append((source_control, mirror_control))
         else:
             maya_utils.node_utils.swap_transforms(source_control, mirror_control, axis, single_direction)
 
+    # All world space controls are sampled and mirrored together, after local swaps have moved their parents
+    if world_pair_list:
+        maya_utils.node_utils.world_space_mirror_list(world_pair_list, axis, single_direction)
+
 
 def get_matching_region_controls(source_network, mirror_network):
     source_component_type = v1_shared.shared_utils.get_class_info( source_network.get('component_type') )[0]
@@ -433,21 +584,18 @@ def get_matching_region_controls(source_network, mirror_network):
 
     source_control_list = mirror_control_list = []
     if source_component_type == mirror_component_type:
-        source_control_list = source_network.get_downstream(ControlJoints).get_connections()
-        mirror_control_list = mirror_network.get_downstream(ControlJoints).get_connections()
-                
-        source_control_list = rigging.skeleton.sort_chain_by_hierarchy(source_control_list)
-        mirror_control_list = rigging.skeleton.sort_chain_by_hierarchy(mirror_control_list)
+        source_control_list = MirrorIndex.get_index(source_network).get_sorted_controls(source_network)
+        mirror_control_list = MirrorIndex.get_index(mirror_network).get_sorted_controls(mirror_network)
 
     add_list = []
-    remove_list = []
+    remove_list = set()
     for source_control, mirror_control in zip(source_control_list, mirror_control_list):
         source_addon = get_addon_from_control(source_control)
         mirror_addon = get_addon_from_control(mirror_control)
 
         # For now we don't mirror overdriven controls
         if source_addon or mirror_addon:
-            remove_list.extend([source_control, mirror_control])
+            remove_list.update([source_control, mirror_control])
         ####
         #### LOGIC for sorting out addon controls
         #### TODO: Handling mirroring relative to their parent space
@@ -476,26 +624,16 @@ def get_matching_region_controls(source_network, mirror_network):
 
 
 def get_matching_control(control_obj, mirror_dict):
-    found_match = False
     overdriven_network_entry = metadata.meta_network_utils.get_first_network_entry(control_obj, AddonCore)
 
-    control_property = metadata.meta_property_utils.get_property(control_obj, ControlProperty)
-    control_index = control_property.get('ordered_index')
     component_network = metadata.meta_network_utils.get_first_network_entry(control_obj, ComponentCore)
+    mirror_index = MirrorIndex.get_index(component_network)
+    if control_obj not in mirror_index.control_key_dict:
+        MirrorIndex.clear(component_network.get_upstream(CharacterCore))
+        mirror_index = MirrorIndex.get_index(component_network)
 
-    mirror_network = get_matching_component(component_network, mirror_dict)
-
-    mirror_control = None
-    if mirror_network:
-        mirror_control_network = mirror_network.get_downstream(ControlJoints)
-        mirror_control_list = mirror_control_network.get_connections()
-
-        for check_control in mirror_control_list:
-            mirror_property = metadata.meta_property_utils.get_property(check_control, ControlProperty)
-            if mirror_property.get('ordered_index') == control_index:
-                mirror_control = check_control
-                found_match = True
-                break
+    mirror_control = mirror_index.get_mirror_control(control_obj, mirror_dict)
+    found_match = mirror_control is not None
     
     addon_control = None
     if mirror_control:
@@ -692,20 +830,7 @@ def parse_control_vars(control_var_string):
 
 
 def get_matching_component(component_network, mirror_dict):
-    rig_network = component_network.get_upstream(RigCore)
-    component_list = rig_network.get_all_downstream(ComponentCore)
-
-    side = component_network.get('side').lower()
-    region = component_network.get('region').lower()
-    mirror_side = get_mirror_from_dict(mirror_dict, side)
-
-    mirror_network = None
-    for check_network in component_list:
-        if check_network.get('side').lower() == mirror_side and check_network.get('region').lower() == region:
-            mirror_network = check_network
-            break
-    
-    return mirror_network
+    return MirrorIndex.get_index(component_network).get_mirror_component(component_network, mirror_dict)
 
 
 def get_mirror_from_dict(mirror_dict, side_name):
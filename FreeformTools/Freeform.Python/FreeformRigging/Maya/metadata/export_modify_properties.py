@@ -21,6 +21,7 @@ import Freeform.Rigging.DCCAssetExporter as DCCAssetExporter
 
 import pymel.core as pm
 import math
+import time
 
 import rigging
 import freeform_utils
@@ -36,6 +37,54 @@ from v1_shared.shared_utils import get_first_or_default, get_index_or_default, g
 from v1_shared.decorators import csharp_error_catcher
 
 
+class DerivedCurve(object):
+    '''
+    An export animation curve declared as a formula on other scene channels.  The source channels are sampled
+    over the export range and the formula is run on the values in Python, so no DG network has to be built and
+    baked to create the curve.
+
+    Attributes:
+        target (PyNode): Maya scene object to create the curve attribute on
+        attribute_name (string): Name of the float attribute to key
+        source_attr_list (list<Attribute>): Scene attributes the formula reads
+        formula (method): Takes one value per source attribute for a frame and returns the curve value for that frame
+    '''
+
+    def __init__(self, target, attribute_name, source_attr_list, formula):
+        self.target = target
+        self.attribute_name = attribute_name
+        self.source_attr_list = source_attr_list
+        self.formula = formula
+
+    @staticmethod
+    def key_curves(derived_curve_list, time_range = None):
+        '''
+        Sample every source attribute once and key each derived curve over the time range
+
+        Args:
+            derived_curve_list (list<DerivedCurve>): Curves to key
+            time_range ((int, int)): Start and end frame, defaults to the scene animation range
+        '''
+        if not derived_curve_list:
+            return
+
+        key_start = time.perf_counter()
+        if not time_range:
+            time_range = (pm.playbackOptions(q=True, ast=True), pm.playbackOptions(q=True, aet=True))
+        start_frame, end_frame = int(time_range[0]), int(time_range[1])
+        frame_list = list(range(start_frame, end_frame+1))
+
+        source_attr_list = list(set([x for derived_curve in derived_curve_list for x in derived_curve.source_attr_list]))
+        sample_dict = maya_utils.anim_attr_utils.sample_attributes(source_attr_list, start_frame, end_frame)
+
+        for derived_curve in derived_curve_list:
+            value_list = [derived_curve.formula(*x) for x in zip(*[sample_dict[attr] for attr in derived_curve.source_attr_list])]
+            maya_utils.anim_attr_utils.create_float_attr(derived_curve.target, derived_curve.attribute_name)
+            maya_utils.keyframe_utils.set_keys_bulk(getattr(derived_curve.target, derived_curve.attribute_name), frame_list, value_list)
+
+        v1_core.v1_logging.get_logger().info("Keyed {0} Derived Curves in {1} Seconds".format(len(derived_curve_list), time.perf_counter() - key_start))
+
+
 class ExporterProperty(PropertyNode):
     '''
     
@@ -46,6 +95,16 @@ class ExporterProperty(PropertyNode):
     @classmethod
     def create_c_property(self, property_network, *args, **kwargs):
         return None
+
+    def get_derived_curves(self, **kwargs):
+        '''
+        Get the export curves this property creates from formulas on scene channels.  When this returns curves the
+        exporter keys them together with the curves from other properties in one sampling pass, in place of calling act()
+
+        Returns:
+            (list<DerivedCurve>). The curves this property derives
+        '''
+        return []
     
     @staticmethod
     def get_inherited_classes():
@@ -260,40 +319,30 @@ class RotationCurveProperties(ExporterProperty):
 
             self.connect_node(first_selected)
 
+    def get_derived_curves(self, **kwargs):
+        '''
+        The rotation curve is the absolute percent of one rotation on the target joint axis, abs(rotate / rotate_value).
+        Rotation is divided in radians, matching the unitConversion Maya inserts when the angle is connected to a
+        multiplyDivide node, which is how the curve was originally built
+
+        Returns:
+            (list<DerivedCurve>). The rotation curve on the export root, empty if there is no target joint
+        '''
+        export_root = get_first_or_default(kwargs.get("export_asset_list"))
+        target_obj = self.get_first_connection(pm.nt.Joint)
+        if not target_obj:
+            return []
+
+        value = self.get('rotate_value', 'short')
+        formula = (lambda x: abs(math.radians(x) / value)) if value else (lambda x: 0.0)
+
+        return [DerivedCurve(export_root, self.get('attribute_name'), [getattr(target_obj, self.get('axis'))], formula)]
+
     def act(self, c_asset, event_args, **kwargs):
         export_asset_list = kwargs.get("export_asset_list")
         v1_core.v1_logging.get_logger().info("RotationCurveProperties acting on {0}".format(export_asset_list))
-        export_root = get_first_or_default(export_asset_list)
-
-        target_obj = self.get_first_connection(pm.nt.Joint)
 
-        if target_obj:
-            axis = self.get('axis')
-            value = self.get('rotate_value', 'short')
-            barrel_attr = getattr(target_obj, axis)
-
-            divide_node = pm.shadingNode('multiplyDivide', asUtility=True)
-            divide_node.operation.set(2)
-            barrel_attr >> divide_node.input1X
-            divide_node.input2X.set(value)
-
-            square_power_node = pm.shadingNode('multiplyDivide', asUtility=True)
-            square_power_node.operation.set(3)
-
-            square_root_node = pm.shadingNode('multiplyDivide', asUtility=True)
-            square_root_node.operation.set(3)
-
-            divide_node.outputX >> square_power_node.input1X
-            square_power_node.outputX >> square_root_node.input1X
-            square_power_node.input2X.set(2)
-            square_root_node.input2X.set(0.5)
-
-            maya_utils.anim_attr_utils.create_float_attr(export_root, self.get('attribute_name'))
-            root_barrel_attr_name = "." + self.get('attribute_name')
-            square_root_node.outputX >> getattr(export_root, self.get('attribute_name'))
-            
-            maya_utils.baking.bake_objects([export_root], False, False, False, use_settings = False, custom_attrs = [root_barrel_attr_name], simulation=False)
-            pm.delete([divide_node, square_power_node, square_root_node])
+        DerivedCurve.key_curves(self.get_derived_curves(**kwargs))
 
 
 class RemoveRootAnimationProperty(ExporterProperty):
@@ -35,6 +35,7 @@ import v1_shared
 from metadata.meta_properties import PropertyNode, ExportStageEnum, ExportProperty, PartialModelProperty
 from metadata.joint_properties import RemoveAnimationProperty
 from metadata.network_core import DependentNode, Core, ImportedCore, CharacterCore
+from metadata.export_modify_properties import ExporterProperty, DerivedCurve
 from metadata import meta_network_utils
 from metadata import meta_property_utils
 from rigging.settings_binding import Binding_Sets
@@ -205,7 +206,18 @@ class ExportAssetProperty(PropertyNode):
         priority_list = list(run_property_dict.keys())
         priority_list.sort(reverse=True)
         for priority in priority_list:
+            # Properties that declare derived curves are keyed together so source channels are only sampled once
+            derived_curve_list = []
+            act_list = []
             for prop_object in run_property_dict.get(priority):
+                prop_curve_list = prop_object.get_derived_curves(**kwargs) if hasattr(prop_object, 'get_derived_curves') else []
+                if prop_curve_list:
+                    derived_curve_list.extend(prop_curve_list)
+                else:
+                    act_list.append(prop_object)
+
+            DerivedCurve.key_curves(derived_curve_list)
+            for prop_object in act_list:
                 prop_object.act(c_asset, event_args, **kwargs)
 
     def export(self, c_asset, event_args):
@@ -541,74 +553,68 @@ class CharacterAnimationAsset(ExportAssetProperty):
         
         autokey_state = pm.autoKeyframe(q=True, state=True)
         pm.autoKeyframe(state=False)
-        # Get animation layers lock, solo, and mute states to reset to user settings after export runs
-        anim_layer_list = maya_utils.anim_attr_utils.get_all_anim_layers()
-        layer_state_dict = {}
-        for anim_layer in anim_layer_list:
-            lock_state = pm.animLayer(anim_layer, q=True, lock=True)
-            solo_state = pm.animLayer(anim_layer, q=True, solo=True)
-            mute_state = pm.animLayer(anim_layer, q=True, mute=True)
-            layer_state_dict[anim_layer] = (lock_state, solo_state, mute_state)
-        if anim_layer_list:
-            pm.animLayer(anim_layer_list[0], e=True, lock=False)
-            pm.animLayer(anim_layer_list[0], e=True, solo=False)
 
         start_time = pm.playbackOptions(q = True, ast = True)
         end_time = pm.playbackOptions(q = True, aet = True)
 
-        asset_node = pm.PyNode(event_args.Asset.NodeName)
-        definition_node = pm.PyNode(event_args.Definition.NodeName)
-        definition_network = meta_network_utils.create_from_node(definition_node)
-
-        export_layer_list = definition_network.get_connections(pm.nt.AnimLayer)
-        for anim_layer in anim_layer_list[1:]:
-            mute_layer = anim_layer not in export_layer_list
-            pm.animLayer(anim_layer, e=True, mute=mute_layer)
-
-        bake_start_time, bake_end_time = self.set_bake_frame_range(definition_node)
-
-        export_namespace = config_manager.get(v1_core.global_settings.ConfigKey.EXPORTER.value).get("ExportNamespace")
-        if export_namespace and not pm.namespace(exists = export_namespace):
-            pm.namespace(add = export_namespace)
-
-        try:
-            export_root = None
-            skele_root = self.get_root_joint()
-            if skele_root:
-                asset_namespace = skele_root.namespace()
-                if not asset_namespace and not export_namespace:
-                    raise NamespaceError
-
-                export_skele = self.setup_export_skeleton(skele_root, export_namespace)
-                export_root = rigging.skeleton.get_root_joint( get_first_or_default(export_skele) )
-                mocap_root = rigging.skeleton.get_mocap_root(export_root)
-                self.bake_export_skeleton(export_skele, True)
+        export_root = None
+        export_namespace = None
+        with maya_utils.anim_attr_utils.AnimLayerState.session() as layer_state:
+            try:
+                # Animation layer lock, solo, and mute states are reset to user settings when the outermost layer session
+                # ends, so when exporting many assets layers are only changed where they differ between assets
+                anim_layer_list = layer_state.get_layers()
+                if anim_layer_list:
+                    layer_state.set_state(anim_layer_list[0], lock=False, solo=False)
+
+                asset_node = pm.PyNode(event_args.Asset.NodeName)
+                definition_node = pm.PyNode(event_args.Definition.NodeName)
+                definition_network = meta_network_utils.create_from_node(definition_node)
+
+                export_layer_list = definition_network.get_connections(pm.nt.AnimLayer)
+                for anim_layer in anim_layer_list[1:]:
+                    mute_layer = anim_layer not in export_layer_list
+                    layer_state.set_state(anim_layer, mute=mute_layer)
+
+                bake_start_time, bake_end_time = self.set_bake_frame_range(definition_node)
+
+                export_namespace = config_manager.get(v1_core.global_settings.ConfigKey.EXPORTER.value).get("ExportNamespace")
+                if export_namespace and not pm.namespace(exists = export_namespace):
+                    pm.namespace(add = export_namespace)
+
+                skele_root = self.get_root_joint()
+                if skele_root:
+                    asset_namespace = skele_root.namespace()
+                    if not asset_namespace and not export_namespace:
+                        raise NamespaceError
+
+                    export_skele = self.setup_export_skeleton(skele_root, export_namespace)
+                    export_root = rigging.skeleton.get_root_joint( get_first_or_default(export_skele) )
+                    mocap_root = rigging.skeleton.get_mocap_root(export_root)
+                    self.bake_export_skeleton(export_skele, True)
                 
-                export_start_time, export_end_time = self.set_export_frame_range(definition_node)
-                self.pre_export(asset_namespace, export_skele, export_start_time, export_namespace)
+                    export_start_time, export_end_time = self.set_export_frame_range(definition_node)
+                    self.pre_export(asset_namespace, export_skele, export_start_time, export_namespace)
 
-                self.run_properties(c_asset, event_args, ExportStageEnum.During.value, [asset_node, definition_node], export_asset_list = [export_root, mocap_root])
+                    self.run_properties(c_asset, event_args, ExportStageEnum.During.value, [asset_node, definition_node], export_asset_list = [export_root, mocap_root])
 
-                export_path = c_asset.GetExportPath(event_args.Definition, str(pm.sceneName()), True)
-                self.fbx_export(export_path, export_root)
+                    export_path = c_asset.GetExportPath(event_args.Definition, str(pm.sceneName()), True)
+                    self.fbx_export(export_path, export_root)
 
-                self.run_properties(c_asset, event_args, ExportStageEnum.Post.value, [asset_node, definition_node], export_asset_list = [export_root, mocap_root])
-                v1_core.v1_logging.get_logger().info("Exporter - File Exported to {0}".format(export_path))
+                    self.run_properties(c_asset, event_args, ExportStageEnum.Post.value, [asset_node, definition_node], export_asset_list = [export_root, mocap_root])
+                    v1_core.v1_logging.get_logger().info("Exporter - File Exported to {0}".format(export_path))
 
-        except Exception as e:
-            exception_info = sys.exc_info()
-            v1_core.exceptions.except_hook(exception_info[0], exception_info[1], exception_info[2])
-        finally:
-            pm.playbackOptions(ast = start_time, min = start_time, aet = end_time, max = end_time)
-            pm.delete(export_root)
-            if export_namespace:
-                pm.delete(pm.namespaceInfo(export_namespace, ls=True))
-                pm.namespace(removeNamespace = export_namespace)
-            pm.autoKeyframe(state=autokey_state)
-            for anim_layer in anim_layer_list:
-                state_list = layer_state_dict[anim_layer]
-                pm.animLayer(anim_layer, e=True, lock=state_list[0], solo=state_list[1], mute=state_list[2])
-            v1_core.v1_logging.get_logger().info("Exporter - Finished in {0} seconds".format(time.perf_counter() - export_start))
+            except Exception as e:
+                exception_info = sys.exc_info()
+                v1_core.exceptions.except_hook(exception_info[0], exception_info[1], exception_info[2])
+            finally:
+                pm.playbackOptions(ast = start_time, min = start_time, aet = end_time, max = end_time)
+                pm.delete(export_root)
+                if export_namespace:
+                    pm.delete(pm.namespaceInfo(export_namespace, ls=True))
+                    pm.namespace(removeNamespace = export_namespace)
+                pm.autoKeyframe(state=autokey_state)
+                v1_core.v1_logging.get_logger().info("Exporter - Finished in {0} seconds".format(time.perf_counter() - export_start))
 
 
     def set_bake_frame_range(self, definition_node):
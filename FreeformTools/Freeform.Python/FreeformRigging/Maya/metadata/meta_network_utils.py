@@ -180,6 +180,31 @@ def get_all_network_nodes(node_type):
     return [x for x in pm.ls(type='network') if v1_shared.shared_utils.get_class_info( x.meta_type.get() )[-1] == type_name]
 
 
+def get_all_network_nodes_by_type(node_type_list):
+    '''
+    Get all network nodes for several types with a single scene query, instead of one full scene search per type
+
+    Args:
+        node_type_list (list<type>): Types of MetaNode to get
+
+    Returns:
+        (dictionary<type, list<PyNode>>). Dictionary of each requested type to all scene network nodes of that type
+    '''
+    type_name_dict = {}
+    for node_type in node_type_list:
+        module_name, type_name = v1_shared.shared_utils.get_class_info( str(node_type) )
+        type_name_dict[type_name] = node_type
+
+    return_dict = {x : [] for x in node_type_list}
+    for network_node in pm.ls(type='network'):
+        if network_node.hasAttr('meta_type'):
+            node_type = type_name_dict.get(v1_shared.shared_utils.get_class_info( network_node.meta_type.get() )[-1])
+            if node_type:
+                return_dict[node_type].append(network_node)
+
+    return return_dict
+
+
 def get_network_chain(network_node, delete_list):
     '''
     Recursive. Finds all network nodes connected downstream from the given network node
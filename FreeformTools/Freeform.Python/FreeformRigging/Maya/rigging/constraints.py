@@ -1,7 +1,9 @@
 import pymel.core as pm
+import maya.cmds as cmds
 
 import sys
 import math
+import time
 
 import metadata
 
@@ -9,6 +11,7 @@ from metadata.meta_properties import ControlProperty
 
 import v1_core
 import v1_shared
+import v1_math
 import maya_utils
 
 from maya_utils.decorators import undoable
@@ -43,37 +46,52 @@ def aim_constraint(object_space, target, up_object, roll_object = None, **kwargs
 
     return pm.aimConstraint(object_space, target, aim=aim_vector, u=up_vector, wuo=up_object, wu=object_up_vector, wut='objectrotation', **kwargs)
 
-@undoable
-def particle_constraint(target, goal_weight, goal_smooth, start_offset):
-    user_scene_time = maya_utils.scene_utils.get_scene_times()
-    start_frame = user_scene_time[0] - abs(start_offset)
-
-    lico_particle = pm.particle(name="lico_particle_dynamic", c=1, p=[0,0,0])[1]
-
-    temp_locator_a = pm.spaceLocator(n="temp_locator_a", p=[0,0,0])
-    temp_locator_b = pm.spaceLocator(n="temp_locator_b", p=[0,0,0])
-    temp_locator_correction = pm.spaceLocator(n="temp_locator_orient_correction", p=[0,0,0])
+def particle_constraint(target, goal_weight, goal_smooth, start_offset, frame_range = None):
+    '''
+    Solve a particle following the target as its goal over the scene time range.  The goal is sampled from the
+    target's world position, starting start_offset frames before the scene start to give the particle time to settle,
+    and solved with v1_math.dynamics.solve_goal() instead of playing back a Maya particle simulation.
 
-    pm.pointConstraint(target, temp_locator_correction, mo=False)
-    pm.delete( pm.pointConstraint(temp_locator_correction, lico_particle.getParent(), offset=[0,0,2], mo=False) )
+    Args:
+        target (PyNode): Maya scene object to follow
+        goal_weight (float): 0 to 1 strength of the pull toward the target
+        goal_smooth (float): Softening of the goal weight, higher values give a looser follow
+        start_offset (int): Number of frames before the scene start to begin the solve
+        frame_range (tuple<int, int>): Start and end frame to solve, defaults to the scene time range
+
+    Returns:
+        (list<int>, list<tuple>). Frames in the time range and the world space (x,y,z) particle position for each
+    '''
+    if frame_range:
+        start_frame, end_frame = int(frame_range[0]), int(frame_range[1])
+    else:
+        user_scene_time = maya_utils.scene_utils.get_scene_times()
+        start_frame = int(user_scene_time[0])
+        end_frame = int(user_scene_time[2])
+    solve_start_frame = start_frame - int(abs(start_offset))
 
-    pm.goal(lico_particle, w=0.5, utr=0, g=temp_locator_correction)
-    lico_particle.worldCentroid >> temp_locator_a.translate
+    world_matrix_attr = target.worldMatrix.name()
+    goal_list = [tuple(get_world_translation(world_matrix_attr, x)) for x in range(solve_start_frame, end_frame+1)]
 
-    dynamic_scene_time = (start_frame, start_frame, user_scene_time[2], user_scene_time[3])
-    maya_utils.scene_utils.set_scene_times(dynamic_scene_time)
+    solve_start = time.perf_counter()
+    position_list = v1_math.dynamics.solve_goal(goal_list, goal_weight, goal_smooth)
+    v1_core.v1_logging.get_logger().debug("Particle constraint solved {0} frames in {1} Seconds".format(len(goal_list), time.perf_counter() - solve_start))
 
-    lico_particle.goalWeight[0].set(goal_weight)
-    lico_particle.goalSmoothness.set(goal_smooth)
-    lico_particle.startFrame.set(start_frame)
+    pre_roll = start_frame - solve_start_frame
+    return list(range(start_frame, end_frame+1)), position_list[pre_roll:]
 
-    delete_constraint = pm.parentConstraint(temp_locator_a, temp_locator_b, mo=False)
-    maya_utils.baking.bake_objects([temp_locator_b], True, True, True, simulation = True)
-    pm.delete(delete_constraint)
+def get_world_translation(world_matrix_attr, frame):
+    '''
+    Get the world space translation of an object at a frame without changing the current time
 
-    maya_utils.scene_utils.set_scene_times(user_scene_time)
+    Args:
+        world_matrix_attr (string): Name of the worldMatrix attribute of the object
+        frame (float): Frame to evaluate
 
-    return [lico_particle, temp_locator_a, temp_locator_b, temp_locator_correction]
+    Returns:
+        (list<float>). World space (x,y,z) translation
+    '''
+    return cmds.getAttr(world_matrix_attr, time=frame)[12:15]
 
 @undoable
 def apply_particle_constraint(goal_weight, goal_smooth, start_offset, target=None):
@@ -81,12 +99,31 @@ def apply_particle_constraint(goal_weight, goal_smooth, start_offset, target=Non
         target = get_first_or_default(pm.ls(sl=True))
 
     if target:
-        lico_particle, temp_locator_a, temp_locator_b, temp_locator_correction = particle_constraint(target, goal_weight, goal_smooth, start_offset)
-
-        delete_constraint = pm.pointConstraint(temp_locator_b, target, mo=True)
-        maya_utils.baking.bake_objects([target], True, True, True)
-        pm.delete(delete_constraint)
-        pm.delete([lico_particle.getParent(), temp_locator_a, temp_locator_b, temp_locator_correction])
+        # Key the same frames the constraint bake did with the user's bake settings.  The particle is solved on every
+        # frame and sampled down to the bake frames.  Smart bake has no effect, the baked particle had a key on every
+        # frame, and keys outside the range are kept like preserveOutsideKeys
+        bake_settings = v1_core.global_settings.GlobalSettings().get_category(v1_core.global_settings.BakeSettings)
+        bake_range = maya_utils.baking.get_bake_time_range([target], bake_settings)
+        frame_list, position_list = particle_constraint(target, goal_weight, goal_smooth, start_offset, bake_range)
+        sample_by = max(int(bake_settings.sample_by), 1)
+        frame_list, position_list = frame_list[::sample_by], position_list[::sample_by]
+
+        # Hold the offset between the target and the particle on the current frame, matching a maintain offset constraint
+        current_frame = pm.currentTime(q=True)
+        offset_index = frame_list.index(current_frame) if current_frame in frame_list else 0
+        world_matrix_attr = target.worldMatrix.name()
+        parent_inverse_attr = target.parentInverseMatrix.name()
+        offset = pm.dt.Vector(get_world_translation(world_matrix_attr, frame_list[offset_index])) - pm.dt.Vector(position_list[offset_index])
+
+        # Move the target's local translation by the world space difference to the particle, in its parent's space
+        value_list = []
+        for frame, position in zip(frame_list, position_list):
+            world_delta = pm.dt.Vector(position) + offset - pm.dt.Vector(get_world_translation(world_matrix_attr, frame))
+            local_delta = world_delta * pm.dt.Matrix(cmds.getAttr(parent_inverse_attr, time=frame))
+            value_list.append(pm.dt.Vector(get_first_or_default(cmds.getAttr(target.translate.name(), time=frame))) + local_delta)
+
+        for i, attr in enumerate([target.tx, target.ty, target.tz]):
+            maya_utils.keyframe_utils.set_keys_bulk(attr, frame_list, [x[i] for x in value_list])
     else:
         v1_shared.usertools.message_dialogue.open_dialogue("Please Select Something to apply the constraint to", "Nothing Selected")
 
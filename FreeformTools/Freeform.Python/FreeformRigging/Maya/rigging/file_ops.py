@@ -27,6 +27,7 @@ import time
 
 import v1_core
 import v1_shared
+from v1_plan import rig_plan
 
 import metadata
 from metadata.network_core import AddonCore, CharacterCore, ComponentCore, JointsCore
@@ -424,10 +425,18 @@ def load_settings_from_json(character_grp, file_path, binding_list = Binding_Set
         joints_network = character_network.get_downstream(JointsCore) if character_network else None
         target_namespace = character_grp.namespace()      
 
+        # Resolve every joint and parent name in the file with one scene query
+        resolve_name_list = list(load_skeleton_data.keys()) + [x.get('parent') for x in load_skeleton_data.values() if x.get('parent')]
+        name_dict = get_scene_name_dict(target_namespace, resolve_name_list)
+
+        binding_type_list = [Binding_Registry().get(x.type_name) for x in binding_list]
         if binding_list != Binding_Sets.PROPERTIES.value:
+            xform_binding_list = Binding_Sets.TRANSFORMS.value + Binding_Sets.BIND_POSE.value
+            xform_binding_list = [x for x in xform_binding_list if Binding_Registry().get(x.type_name) in binding_type_list]
+            xform_load_list = []
             for jnt_name, data in load_skeleton_data.items():
                 # Create any missing joints, parented to world so we know to fill them in next
-                if load_joint_list == None and not pm.objExists(target_namespace + jnt_name):
+                if load_joint_list == None and jnt_name not in name_dict:
                     v1_core.v1_logging.get_logger().info("Creating Joint - {0}".format(jnt_name))
                     pm.select(None) # Clear selection before making joints so no auto-parenting happens
                     new_jnt = pm.joint(name = target_namespace + jnt_name)
@@ -438,26 +447,28 @@ def load_settings_from_json(character_grp, file_path, binding_list = Binding_Set
                     Bind_Rotate().load_data(data, new_jnt)
 
                     joints_network.connect_node(new_jnt)
-                # Load Xform Bindings onto existing joints
-                elif pm.objExists(target_namespace + jnt_name):
-                    jnt = get_first_or_default(pm.ls(target_namespace + jnt_name, type='joint'), default = pm.PyNode(target_namespace + jnt_name))
-                    target_parent_name = target_namespace + data['parent']
-                    target_parent = pm.PyNode(target_parent_name) if pm.objExists(target_parent_name) else None
+                    name_dict[jnt_name] = new_jnt
+                # Gather Xform Bindings for existing joints
+                elif jnt_name in name_dict:
+                    jnt = name_dict[jnt_name]
+                    target_parent = name_dict.get(data['parent'])
                     if load_joint_list != None:
                         jnt = jnt if jnt in load_joint_list else None
                     if jnt and jnt.getParent() != None and (jnt.getParent() == target_parent or jnt.getParent() == character_grp):
-                        xform_binding_list = Binding_Sets.TRANSFORMS.value + Binding_Sets.BIND_POSE.value
-                        binding_type_list = [Binding_Registry().get(x.type_name) for x in binding_list]
-                        xform_binding_list = [x for x in xform_binding_list if Binding_Registry().get(x.type_name) in binding_type_list]
-                        for xform_binding in xform_binding_list:
-                            xform_binding.load_data(data, jnt, target_namespace)
+                        xform_load_list.append((data, jnt))
+
+            # Load each Xform Binding onto all gathered joints at once
+            for xform_binding in xform_binding_list:
+                xform_binding.load_data_list(xform_load_list)
+
+        unresolved_list = [x for x in load_skeleton_data.keys() if x not in name_dict]
+        if unresolved_list:
+            v1_core.v1_logging.get_logger().info("Settings file joints not found in scene - {0}".format(", ".join(unresolved_list)))
     
         load_property_jnt = None
         # Load Properties
         for jnt_name, data in load_skeleton_data.items():
-            load_property_jnt = pm.PyNode(target_namespace + jnt_name) if pm.objExists(target_namespace + jnt_name) else None
-            joint_list = pm.ls(target_namespace + jnt_name, type='joint')
-            load_property_jnt = get_first_or_default(joint_list, default = load_property_jnt)
+            load_property_jnt = name_dict.get(jnt_name)
         
             # If the joint from the settings file exists in the skeleton
             if load_property_jnt:
@@ -466,7 +477,6 @@ def load_settings_from_json(character_grp, file_path, binding_list = Binding_Set
                     for joint_binding in Binding_Sets.NEW_JOINT.value:
                         joint_binding.load_data(data, load_property_jnt, target_namespace)
 
-                binding_type_list = [Binding_Registry().get(x.type_name) for x in binding_list]
                 if Properties_Binding in binding_type_list:
                     Properties_Binding().load_data(data, load_property_jnt) 
 
@@ -490,6 +500,30 @@ def load_settings_from_json(character_grp, file_path, binding_list = Binding_Set
         pm.autoKeyframe(state=autokey_state)
         v1_shared.usertools.message_dialogue.set_dialogue_display(initial_dialogue_display)
 
+def get_scene_name_dict(namespace, name_list):
+    '''
+    Resolve a list of namespace-less node names to scene objects with a single pm.ls query.  Where a name matches
+    multiple objects a joint is preferred
+
+    Args:
+        namespace (str): Namespace to look for the names in
+        name_list (list<str>): Node names without namespace
+
+    Returns:
+        (dictionary<str, PyNode>). Scene object for each name that exists in the scene
+    '''
+    name_dict = {}
+    # pm.ls with an empty list returns every node in the scene
+    if not name_list:
+        return name_dict
+
+    for node in pm.ls([namespace + x for x in set(name_list)]):
+        short_name = node.name().split('|')[-1].replace(namespace, '', 1)
+        if short_name not in name_dict or (type(node) == pm.nt.Joint and type(name_dict[short_name]) != pm.nt.Joint):
+            name_dict[short_name] = node
+
+    return name_dict
+
 def save_to_json_with_dialog(character_network):
     '''
     Saves a rig configuration file out to json.  Finds all rig components on a character and saves their applied
@@ -577,13 +611,21 @@ def load_from_json(character_network, file_path, side_filter = [], region_filter
 
     load_settings_data = v1_core.json_utils.read_json(file_path)
 
-    rigging_data = load_settings_data['rigging']
-    addon_data = load_settings_data['addons']
+    # Plan the whole file before touching the scene, so regions, registered types and addon dependencies are
+    # resolved once up front instead of per component
+    plan = rig_plan.RigBuildPlan(load_settings_data, side_filter, region_filter)
 
     joint_core_network = character_network.get_downstream(JointsCore)
     target_skeleton_dict = skeleton.get_skeleton_dict( get_first_or_default(joint_core_network.get_connections()) )
+    skeleton_regions = set((side, region) for side, region_dict in target_skeleton_dict.items() for region in region_dict.keys())
+
+    component_types = {x.type_name : component_registry.Component_Registry().get(x.type_name) for x in plan.component_list}
+    addon_types = {x.type_name : component_registry.Addon_Registry().get(x.type_name) for x in plan.addon_list}
+    for error in plan.validate(skeleton_regions, [x for x, y in component_types.items() if y], [x for x, y in addon_types.items() if y]):
+        v1_core.v1_logging.get_logger().debug("Rig file plan - {0}".format(error))
 
-    control_holder_list, imported_nodes = rig_base.Component_Base.import_control_shapes(character_network.group)
+    import_count = rig_base.ControlShapeLibrary.import_count
+    control_holder_list = rig_base.Component_Base.import_control_shapes(character_network.group)
 
     skeleton.zero_character(get_first_or_default(joint_core_network.get_connections()), ignore_rigged = False)
     rig_base.Component_Base.zero_all_overdrivers(character_network)
@@ -596,19 +638,15 @@ def load_from_json(character_network, file_path, side_filter = [], region_filter
     set_control_var_dict = {}
     create_time = time.perf_counter()
     created_rigging = {}
-    side_iteritems = [(x,y) for x,y in rigging_data.items() if x in side_filter] if side_filter else rigging_data.items()
-    for side, region_dict in side_iteritems:
+    for side in set(x.side for x in plan.component_list):
         created_rigging.setdefault(side, {})
-        region_iteritems = [(x,y) for x,y in region_dict.items() if x in region_filter] if region_filter else region_dict.items()
-        for region, component_dict in region_iteritems:
-            component_type = component_registry.Component_Registry().get(component_dict['type'])
-            # component_type = getattr(sys.modules[component_dict['module']], component_dict['type'])
-            side_data = target_skeleton_dict.get(side)
-            region_data = side_data.get(region) if side_data else None
-            if region_data:
-                component, did_exist = component_type.rig_from_json(side, region, target_skeleton_dict, component_dict, control_holder_list)
-                set_control_var_dict[component.set_control_vars] = component_dict.get('control_vars')
-                created_rigging[side][region] = (component, did_exist)
+    for step in plan.component_list:
+        component_type = component_types.get(step.type_name)
+        if component_type and (step.side, step.region) in skeleton_regions:
+            component_dict = dict(step.data)
+            component, did_exist = component_type.rig_from_json(step.side, step.region, target_skeleton_dict, component_dict, control_holder_list)
+            set_control_var_dict[component.set_control_vars] = component_dict.get('control_vars')
+            created_rigging[step.side][step.region] = (component, did_exist)
     v1_core.v1_logging.get_logger().info("Rigging Created in {0} Seconds".format(time.perf_counter() - create_time))
 
     queue_time = time.perf_counter()
@@ -627,27 +665,13 @@ def load_from_json(character_network, file_path, side_filter = [], region_filter
 
     # Build Overdrivers
     addon_time = time.perf_counter()
-    side_addon_iteritems = [(x,y) for x,y in addon_data.items() if x in side_filter] if side_filter else addon_data.items()
-    for side, region_dict in side_addon_iteritems:
-        region_addon_iteritems = [(x,y) for x,y in region_dict.items() if x in region_filter] if region_filter else region_dict.items()
-        for region, component_type_dict in region_addon_iteritems:
-            for addon, addon_component_dict in component_type_dict.items():
-                created_side = created_rigging.get(side)
-                created_region = created_side.get(region) if created_side else None
-                component, did_exist = created_region if created_region else (None, False)
-                target_data = rig_base.ControlInfo.parse_string(addon_component_dict['target_data'])
-                # Continue if the overdriver is attached to a skeleton joint or scene object
-                # Otherwise make sure that the rig controls were created before trying to attach to them
-                if target_data.control_type == "skeleton" or target_data.control_type == "object":
-                    target_region = True
-                else:
-                    target_side = created_rigging.get(target_data.side)
-                    target_region = target_side.get(target_data.region) if target_side else None
-
-                if component and not did_exist and target_region:
-                    addon_component_type = component_registry.Addon_Registry().get(addon_component_dict['type'])
-                    # addon_component_type = getattr(sys.modules[addon_component_dict['module']], addon_component_dict['type'])
-                    addon_component = addon_component_type.rig_from_json(component, addon_component_dict, created_rigging)
+    built_regions = set((side, region) for side, region_dict in created_rigging.items() for region in region_dict.keys())
+    for step in plan.addon_list:
+        component, did_exist = created_rigging.get(step.side, {}).get(step.region, (None, False))
+        addon_component_type = addon_types.get(step.type_name)
+        # Only attach to newly built components, and make sure every rig control the addon targets was created
+        if component and not did_exist and addon_component_type and not plan.get_missing_dependencies(step, built_regions):
+            addon_component = addon_component_type.rig_from_json(component, dict(step.data), created_rigging)
     v1_core.v1_logging.get_logger().info("Addons Created in {0} Seconds".format(time.perf_counter() - addon_time))
 
     queue_time = time.perf_counter()
@@ -655,7 +679,7 @@ def load_from_json(character_network, file_path, side_filter = [], region_filter
     v1_core.v1_logging.get_logger().info("Batching Queue Completed in {0} Seconds".format(time.perf_counter() - queue_time))
 
     bake_settings.restore_bake_settings(user_bake_settings)
-    pm.delete([x for x in imported_nodes if x.exists()])
+    v1_core.v1_logging.get_logger().debug("Control shape files imported - {0}".format(rig_base.ControlShapeLibrary.import_count - import_count))
     v1_core.v1_logging.get_logger().info("Rigging Completed in {0} Seconds".format(time.perf_counter() - start_time))
 
     maya_utils.scene_utils.set_current_frame()
@@ -18,11 +18,14 @@ If not, see <https://www.gnu.org/licenses/>.
 '''
 
 import pymel.core as pm
+import maya.api.OpenMaya as OpenMaya
+import maya.cmds as cmds
 
 from abc import ABCMeta, abstractmethod
 import os
 import sys
 import time
+import types
 import inspect
 
 import metadata
@@ -121,6 +124,165 @@ class ControlInfo(object):
 
         return control_info
 
+class ControlShapeLibrary(object):
+    '''
+    Session level cache of the shapes in each character's Control_Shapes file.  Each file is imported once, the
+    curve and mesh shape data is read out and the imported nodes are deleted, then new control shapes are built
+    from the cached data with undoable Maya commands.  An entry is re-read when its file's modified time changes
+
+    Attributes:
+        entry_dict (dictionary<str, dictionary>): Cache entries keyed by control shape file path, each holding the
+            file 'mtime' and the read-only 'shape_dict' of shape data keyed by control info string
+        import_count (int): Number of times a control shape file was imported
+        hit_count (int): Number of requests returned from the cache
+        shape_attribute_list (list<str>): Draw override and display attributes copied from each cached shape
+    '''
+    entry_dict = {}
+    import_count = 0
+    hit_count = 0
+    shape_attribute_list = ['overrideEnabled', 'overrideDisplayType', 'overrideShading', 'overrideVisibility', 'overrideRGBColors', 
+                            'overrideColor', 'overrideColorR', 'overrideColorG', 'overrideColorB', 'alwaysDrawOnTop', 'lineWidth',
+                            'dispCV', 'castsShadows', 'receiveShadows', 'primaryVisibility']
+
+    @classmethod
+    def get_shape_dict(cls, control_shape_path):
+        '''
+        Get the shape data for every control in a control shape file, importing the file if it isn't cached or
+        has changed on disk
+
+        Args:
+            control_shape_path (str): Full path to the control shape file
+
+        Returns:
+            (MappingProxyType). Read-only dictionary of shape data keyed by control info string, with ';' replaced by '_'
+        '''
+        if not control_shape_path or not os.path.exists(control_shape_path):
+            return types.MappingProxyType({})
+
+        mtime = os.path.getmtime(control_shape_path)
+        entry = cls.entry_dict.get(control_shape_path)
+        if entry and entry['mtime'] == mtime:
+            cls.hit_count += 1
+            return entry['shape_dict']
+
+        v1_core.v1_logging.get_logger().debug("Importing File - {0}".format(control_shape_path))
+        import_list = maya_utils.scene_utils.import_file_safe(control_shape_path, returnNewNodes=True)
+        cls.import_count += 1
+
+        shape_dict = {}
+        for control_holder in [x for x in import_list if type(x) == pm.nt.Transform]:
+            shape = control_holder.getShape()
+            shape_data = cls.read_shape(shape) if shape else None
+            if shape_data:
+                # Imported holders may be renamed on a name clash, the control_info attribute keeps the saved name
+                holder_name = control_holder.control_info.get() if control_holder.hasAttr('control_info') else control_holder.stripNamespace().nodeName()
+                shape_dict[holder_name] = shape_data
+        pm.delete([x for x in import_list if x.exists()])
+
+        read_only_dict = types.MappingProxyType(shape_dict)
+        cls.entry_dict[control_shape_path] = {'mtime': mtime, 'shape_dict': read_only_dict}
+
+        return read_only_dict
+
+    @classmethod
+    def clear(cls, control_shape_path = None):
+        '''
+        Remove cached control shape files
+
+        Args:
+            control_shape_path (str): Full path of the file to remove, if None all files are removed
+        '''
+        if control_shape_path:
+            cls.entry_dict.pop(control_shape_path, None)
+        else:
+            cls.entry_dict = {}
+
+    @classmethod
+    def get_stats(cls):
+        '''
+        Get cache usage counters
+
+        Returns:
+            (dictionary). 'imports', 'hits', and number of 'entries' in the cache
+        '''
+        return {'imports': cls.import_count, 'hits': cls.hit_count, 'entries': len(cls.entry_dict)}
+
+    @staticmethod
+    def read_shape(shape):
+        '''
+        Read the object space geometry and the draw override and display attributes of a nurbsCurve or mesh shape
+
+        Args:
+            shape (PyNode): Maya scene shape node
+
+        Returns:
+            (dictionary). Shape data to build the shape with create_shape(), or None if the shape type isn't supported
+        '''
+        selection_list = OpenMaya.MSelectionList()
+        selection_list.add(shape.longName())
+        dag_path = selection_list.getDagPath(0)
+
+        if dag_path.hasFn(OpenMaya.MFn.kNurbsCurve):
+            curve_fn = OpenMaya.MFnNurbsCurve(dag_path)
+            shape_data = {'type': 'nurbsCurve', 'cv_list': [(x.x, x.y, x.z) for x in curve_fn.cvPositions()], 'knot_list': list(curve_fn.knots()),
+                          'degree': curve_fn.degree, 'periodic': curve_fn.form == OpenMaya.MFnNurbsCurve.kPeriodic}
+        elif dag_path.hasFn(OpenMaya.MFn.kMesh):
+            mesh_fn = OpenMaya.MFnMesh(dag_path)
+            polygon_counts, polygon_connects = mesh_fn.getVertices()
+            shape_data = {'type': 'mesh', 'point_list': [(x.x, x.y, x.z) for x in mesh_fn.getPoints()], 'polygon_counts': list(polygon_counts),
+                          'polygon_connects': list(polygon_connects)}
+        else:
+            return None
+
+        shape_name = shape.longName()
+        shape_data['attribute_dict'] = {x: cmds.getAttr("{0}.{1}".format(shape_name, x)) for x in ControlShapeLibrary.shape_attribute_list 
+                                        if cmds.attributeQuery(x, node=shape_name, exists=True)}
+
+        return shape_data
+
+    @staticmethod
+    def create_shape(shape_data, parent):
+        '''
+        Build a shape from cached shape data under a transform.  The shape is built with Maya commands and parented
+        with parent -s -r, like a duplicated shape, so the build is undoable
+
+        Args:
+            shape_data (dictionary): Shape data from read_shape()
+            parent (PyNode): Maya scene transform or joint to create the shape under
+
+        Returns:
+            PyNode. The new shape node
+        '''
+        if shape_data['type'] == 'nurbsCurve':
+            temp_transform = cmds.curve(degree=shape_data['degree'], point=shape_data['cv_list'], knot=shape_data['knot_list'], 
+                                        periodic=shape_data['periodic'])
+        else:
+            # Faces are created one at a time then united and welded back to the cached topology
+            point_list = shape_data['point_list']
+            face_list = []
+            connect_index = 0
+            for polygon_count in shape_data['polygon_counts']:
+                face_point_list = [point_list[x] for x in shape_data['polygon_connects'][connect_index:connect_index + polygon_count]]
+                face_list.append(get_first_or_default(cmds.polyCreateFacet(point=face_point_list, constructionHistory=False)))
+                connect_index += polygon_count
+
+            temp_transform = get_first_or_default(cmds.polyUnite(face_list, constructionHistory=False)) if len(face_list) > 1 else face_list[0]
+            cmds.polyMergeVertex(temp_transform, distance=0.0001, constructionHistory=False)
+            cmds.delete(temp_transform, constructionHistory=True)
+
+        shape_name = get_first_or_default(cmds.parent(cmds.listRelatives(temp_transform, shapes=True, fullPath=True), parent.longName(), 
+                                                      shape=True, relative=True))
+        cmds.delete(temp_transform)
+        if shape_data['type'] == 'mesh':
+            cmds.sets(shape_name, edit=True, forceElement='initialShadingGroup')
+
+        for attr_name, value in shape_data['attribute_dict'].items():
+            cmds.setAttr("{0}.{1}".format(shape_name, attr_name), value)
+
+        shape = pm.PyNode(shape_name)
+        shape.rename(parent.stripNamespace().nodeName() + "Shape")
+        return shape
+
 class Component_Base(object, metaclass=Component_Meta):
     '''
     Abstract Base Class for all Maya Rig Components.  Rig Components handle building and removing rigs from a skeleton,
@@ -262,6 +424,7 @@ class Component_Base(object, metaclass=Component_Meta):
             for obj in anim_asset_network_list:
                 obj.disconnect_self()
 
+        freeform_utils.character_utils.MirrorIndex.clear(character_network)
         metadata.meta_network_utils.delete_network(character_network.node)
 
         # Remove any file references used by this character
@@ -299,12 +462,16 @@ class Component_Base(object, metaclass=Component_Meta):
         Args:
             character_network (PyNode): Maya scene character network node
         '''
+        zero_time = time.perf_counter()
+        control_list = []
         rig_component_list = character_network.get_all_downstream( ComponentCore )
         for component_network in rig_component_list:
             control_network = component_network.get_downstream(ControlJoints)
-            for control in control_network.get_connections():
-                maya_utils.node_utils.zero_node(control, ['constraint', 'animCurve', 'animLayer', 'animBlendNodeAdditiveDL', 
-                                                          'animBlendNodeAdditiveRotation', 'pairBlend'])
+            control_list.extend(control_network.get_connections())
+
+        maya_utils.node_utils.zero_nodes(control_list, ['constraint', 'animCurve', 'animLayer', 'animBlendNodeAdditiveDL', 
+                                                        'animBlendNodeAdditiveRotation', 'pairBlend'])
+        v1_core.v1_logging.get_logger().debug("Zeroed {0} Controls in {1} Seconds".format(len(control_list), time.perf_counter() - zero_time))
 
     @staticmethod
     def zero_all_overdrivers(character_network):
@@ -445,7 +612,8 @@ class Component_Base(object, metaclass=Component_Meta):
         transform_list = [x for x in control_holder_list if type(x) == pm.nt.Transform]
         pm.select(transform_list)
         maya_utils.scene_utils.export_selected_safe(control_shape_path, checkout = True)
-        pm.delete(transform_list)  
+        pm.delete(transform_list)
+        ControlShapeLibrary.clear(control_shape_path)
 
     @staticmethod
     def update_character_namespace(character_node, new_namespace):
@@ -481,26 +649,20 @@ class Component_Base(object, metaclass=Component_Meta):
     @staticmethod
     def import_control_shapes(character_group):
         '''
-        Import control shapes for the provided character from the top level group object of a character
+        Get the control shapes for the provided character from the top level group object of a character.  Shapes
+        come from the ControlShapeLibrary, so the Control_Shapes file is only imported when it has changed
 
         Args:
             character_object (PyNode): Maya scene object for the top level group of a character
 
         Returns:
-            tuple. List of all control holder groups and a list of all nodes imported
+            (MappingProxyType). Read-only dictionary of control shape data keyed by control info string
         '''
         # Listed in order of priority.  If we find an obj first we will use it and ignore other formats.
         character_root_path = Component_Base.get_character_root_directory(character_group)
         control_shape_path = Component_Base.get_control_shape_path(character_root_path)
 
-        control_holder_list = []
-        import_list = []
-        if os.path.exists(control_shape_path):
-            v1_core.v1_logging.get_logger().debug("Importing File - {0}".format(control_shape_path))
-            import_list = maya_utils.scene_utils.import_file_safe(control_shape_path, returnNewNodes=True)
-            control_holder_list = [x for x in import_list if type(x) == pm.nt.Transform]
-
-        return control_holder_list, import_list
+        return ControlShapeLibrary.get_shape_dict(control_shape_path)
 
     @staticmethod
     def select_all_controls(character_network):
@@ -662,15 +824,13 @@ class Component_Base(object, metaclass=Component_Meta):
 
         skeleton_dict = skeleton.create_single_joint_skeleton_dict(jnt, temporary)
 
-        control_holder_list, imported_nodes = Component_Base.import_control_shapes(character_network.group)
+        control_holder_list = Component_Base.import_control_shapes(character_network.group)
 
         for side, region_dict in skeleton_dict.items():
             for region, jnt_dict in region_dict.items():
                 component = FK()
                 rig_success = component.rig(skeleton_dict, side, region, False, control_holder_list)
 
-        pm.delete([x for x in imported_nodes if pm.objExists(x)])
-
     @staticmethod
     def build_pickwalk_network(character_network):
         all_rigging = character_network.get_all_downstream(ComponentCore)
@@ -804,10 +964,9 @@ class Component_Base(object, metaclass=Component_Meta):
         ordered_control_list = skeleton.sort_chain_by_hierarchy(control_list)
         zero_group_list = []
 
-        # If controls aren't already imported bring in a fresh import
-        import_controls = True if not control_holder_list else False
-        if import_controls:
-            control_holder_list, imported_nodes = Component_Base.import_control_shapes(self.character_world)
+        # If control shapes weren't passed in get them from the library
+        if not control_holder_list:
+            control_holder_list = Component_Base.import_control_shapes(self.character_world)
 
         locked_control_list = []
         for control in control_list:
@@ -856,9 +1015,6 @@ class Component_Base(object, metaclass=Component_Meta):
                 set_shader = locked_shader
             freeform_utils.materials.set_material(set_control, set_shader)
 
-        if import_controls:
-            pm.delete([x for x in imported_nodes if pm.objExists(x)])
-
         return zero_group_list
 
     def apply_control_shape(self, control_info, jnt, control_holder_list):
@@ -870,14 +1026,13 @@ class Component_Base(object, metaclass=Component_Meta):
         Args:
             control_info (ControlInfo): ControlInfo object storing all information about the control
             jnt (PyNode): Maya scene joint that we want to put the control shape on
-            control_holder_list (list<PyNode>): List of objects that hold control shapes imported from the Control_Shapes file
+            control_holder_list (MappingProxyType): Control shape data from import_control_shapes()
         '''
         control_info_string = str(control_info).replace(";", "_")
-        control_list = [x for x in control_holder_list if control_info_string == x.name()]
+        shape_data = control_holder_list.get(control_info_string)
 
-        if control_list:
-            dupe_shape = get_first_or_default(pm.duplicate(get_first_or_default(control_list).getShape(), addShape=True))
-            pm.parent(dupe_shape, jnt, s=True, r=True)
+        if shape_data:
+            ControlShapeLibrary.create_shape(shape_data, jnt)
         else:
             cube_size = maya_utils.node_utils.convert_scene_units(8)
             control_object = get_first_or_default(pm.polyCube(h=cube_size, d=cube_size, w=cube_size, name=skeleton.joint_short_name(jnt)))
@@ -1441,8 +1596,8 @@ class Rig_Component(Component_Base):
             region (str): The region to build this component on
             target_skeleton_dict (dictionary): The region dictionary for the skeleton this rig is applying on
             component_dict (dictionary): The json dictionary entry for the component
-            control_holder_list (list<PyNode>): List of all control shapes imported for the component to find 
-                it's shape from
+            control_holder_list (MappingProxyType): Control shape data from import_control_shapes() for the component
+                to find it's shape from
         '''
         v1_core.v1_logging.get_logger().debug("Rig_Component rig_from_json - {0} - {1} - {2}".format(cls, side, region))
         rig_component_start = time.perf_counter()
@@ -1554,6 +1709,7 @@ class Rig_Component(Component_Base):
         self.exclude = self.skeleton_dict[side][region].get('exclude')
         self.network = self.create_meta_network(self.skel_root, side, region)
         self.namespace = self.character_world.namespace()
+        freeform_utils.character_utils.MirrorIndex.clear(self.network['character'])
 
         self.get_parent_space(world_space)
 
@@ -1784,6 +1940,7 @@ class Rig_Component(Component_Base):
 
         self.delete_temporary_markup()
         joint_list = self.network['skeleton'].get_connections()
+        freeform_utils.character_utils.MirrorIndex.clear(self.network['character'])
         self.network['component'].delete_all()
 
         if not revert_animation:
@@ -2207,9 +2364,8 @@ class Rig_Component(Component_Base):
 
             self.bake_and_remove(None)
         
-            control_holder_list, imported_nodes = Component_Base.import_control_shapes(self.character_world)
+            control_holder_list = Component_Base.import_control_shapes(self.character_world)
             component_type().rig(skele_dict, side, region, control_holder_list = control_holder_list)
-            pm.delete([x for x in imported_nodes if x.exists()])
 
             for markup_network in markup_network_list:
                 markup_network.set('temporary', True, 'bool')
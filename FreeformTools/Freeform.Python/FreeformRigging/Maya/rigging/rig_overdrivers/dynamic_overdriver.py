@@ -35,6 +35,7 @@ from rigging.rig_overdrivers.overdriver import Overdriver
 
 import v1_core
 import v1_shared
+import v1_math
 import maya_utils
 
 from maya_utils.decorators import undoable
@@ -138,6 +139,7 @@ class Aim(Dynamic_Driver):
 
 class Pendulum(Aim):
     _requires_space = False
+    _simulated = False
     _icon = "../../Resources/pendulum-driver.png"
 
     def __init__(self, translate=False, rotate=True):
@@ -146,7 +148,8 @@ class Pendulum(Aim):
         self.maintain_offset = False
 
     def rig(self, component_node, control, bake_controls=False, default_space=None, baking_queue=None, **kwargs):
-        # Create the dynamic pendulum to be used as the Aim space for the overdriver
+        # Create the pendulum locator to be used as the Aim space for the overdriver.  Motion is solved analytically
+        # by solve_pendulum() and keyed directly, so no rigid body simulation is needed
         self.network = self.create_meta_network(component_node)
         #self.zero_character(self.network['character'], baking_queue)
 
@@ -157,24 +160,13 @@ class Pendulum(Aim):
 
         cur_namespace = pm.namespaceInfo(cur=True)
         pm.namespace(set=":")
-        time_range = (pm.playbackOptions(q=True, min=True), pm.playbackOptions(q=True, max=True))
 
-        object_space = pm.polySphere(r=8, sx=20, sy=20, ax=[0,1,0], cuv=2, ch=1, n="pendulum")[0]
+        object_space = pm.spaceLocator(n="pendulum")
         object_space.setParent(pre_dynamic_group)
 
         ws_pos = pm.xform(control, q=True, ws=True, t=True)
         pm.xform(object_space, ws=True, t=ws_pos)
 
-        rigid_body = pm.rigidBody(object_space, b=0, dp=5)
-        rigid_body_nail = pm.PyNode(pm.constrain(rigid_body, nail=True))
-        rigid_body_nail.setParent(pre_dynamic_group)
-        rigid_point_constraint = pm.pointConstraint(control, rigid_body_nail, mo=False)
-
-        pm.select(None)
-        gravity_field = pm.gravity(m=980)
-        gravity_field.setParent(pre_dynamic_group)
-        pm.connectDynamic(object_space, f=gravity_field)
-
         self.reset_pendulum(object_space)
 
         if not super().rig(component_node, control, [object_space], bake_controls=bake_controls, default_space=default_space, baking_queue=baking_queue, **kwargs):
@@ -182,20 +174,72 @@ class Pendulum(Aim):
         
         driver_control = self.network['controls'].get_first_connection()
 
+        # Defaults match the rigid body (damping 5, bounciness 0.6) and gravity field (980) this solver replaced
         driver_control.addAttr("damping", type='double', hidden=False, keyable=True)
-        driver_control.damping.set(rigid_body.damping.get())
-        driver_control.damping >> rigid_body.damping
+        driver_control.damping.set(5.0)
 
         driver_control.addAttr("bounciness", type='double', hidden=False, keyable=True)
-        driver_control.bounciness.set(rigid_body.bounciness.get())
-        driver_control.bounciness >> rigid_body.bounciness
+        driver_control.bounciness.set(0.6)
 
         driver_control.addAttr("gravity", type='double', hidden=False, keyable=True)
-        driver_control.gravity.set(gravity_field.magnitude.get())
-        driver_control.gravity >> gravity_field.magnitude
+        driver_control.gravity.set(980.0)
 
         self.reset_pendulum(object_space)
+        self.solve_pendulum(object_space)
+
+    def get_rigger_methods(self):
+        method_dict = super().get_rigger_methods()
+        method_dict[self.solve_pendulum_call] = {"Name" : "(Pendulum)Solve Pendulum", "ImagePath" : "../../Resources/pendulum-driver.png", "Tooltip" : "Re-solve and key the pendulum from the damping, bounciness, and gravity values on the control"}
+
+        return method_dict
+
+    @csharp_error_catcher
+    def solve_pendulum_call(self, c_rig_button, event_args):
+        self.solve_pendulum()
+
+    def get_pendulum(self):
+        '''
+        Find the pendulum locator from the aim constraint driving the overdriver control
+
+        Returns:
+            (PyNode). Maya scene pendulum locator
+        '''
+        driver_control = self.network['controls'].get_first_connection()
+        aim_constraint = get_first_or_default(list(set(pm.listConnections(driver_control, type='aimConstraint', s=True, d=False))))
+        return constraints.get_constraint_driver(aim_constraint, 0) if aim_constraint else None
+
+    @undoable
+    def solve_pendulum(self, pendulum = None):
+        '''
+        Sample the world space position of the overdriven control over the scene time range, solve the pendulum
+        motion with v1_math.dynamics.solve_pendulum() and key the result onto the pendulum in a single pass.
+
+        Args:
+            pendulum (PyNode): Maya scene pendulum locator, found from the aim constraint if not provided
+        '''
+        pendulum = pendulum if pendulum else self.get_pendulum()
+        control = self.network['overdriven_control'].get_first_connection()
+        driver_control = self.network['controls'].get_first_connection()
+
+        start_frame, end_frame = int(pm.playbackOptions(q=True, min=True)), int(pm.playbackOptions(q=True, max=True))
+        frame_list = list(range(start_frame, end_frame + 1))
+
+        matrix_dict = maya_utils.baking.get_bake_values([control, pendulum.getParent()], start_frame, end_frame)
+        pivot_list = [tuple(x.translate) for x in matrix_dict[control]]
+        start_position = tuple(pm.getAttr(pendulum.worldMatrix, t=start_frame).translate)
+
+        gravity_direction = (0.0, 0.0, -1.0) if pm.upAxis(q=True, axis=True) == 'z' else (0.0, -1.0, 0.0)
+        gravity = v1_math.dynamics.scale(gravity_direction, driver_control.gravity.get())
+
+        solve_start = time.perf_counter()
+        position_list = v1_math.dynamics.solve_pendulum(pivot_list, start_position, driver_control.damping.get(), driver_control.bounciness.get(), 
+                                                        gravity, maya_utils.scene_utils.get_scene_fps())
+        v1_core.v1_logging.get_logger().debug("Pendulum solved {0} frames in {1} seconds".format(len(frame_list), time.perf_counter() - solve_start))
 
+        # Keys are local to the pendulum parent, which follows the character world
+        local_position_list = [pm.dt.Point(x) * parent_matrix.inverse() for x, parent_matrix in zip(position_list, matrix_dict[pendulum.getParent()])]
+        for i, attr in enumerate([pendulum.tx, pendulum.ty, pendulum.tz]):
+            maya_utils.keyframe_utils.set_keys_bulk(attr, frame_list, [x[i] for x in local_position_list])
 
     def reset_pendulum(self, pendulum):
         '''
@@ -120,12 +120,11 @@ def rig_region(skeleton_dict, side, region, character_network, component_type, r
         if component_type._hasattachment != 'end':
             removed_node_list = rig_base.Component_Base.remove_rigging(end, exclude = 'root')
         
-    control_holder_list, imported_nodes = rig_base.Component_Base.import_control_shapes(character_network.group)
+    control_holder_list = rig_base.Component_Base.import_control_shapes(character_network.group)
 
     component = component_type()
     rig_success = component.rig(skeleton_dict, side, region, False, control_holder_list, additive = not character_category.remove_existing, reverse = reverse)
 
-    pm.delete([x for x in imported_nodes if pm.objExists(x)])
     maya_utils.scene_utils.set_current_frame()
 
 def switch_rigging(component_network):
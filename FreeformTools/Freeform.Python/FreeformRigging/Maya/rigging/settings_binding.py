@@ -18,6 +18,7 @@ If not, see <https://www.gnu.org/licenses/>.
 '''
 
 import pymel.core as pm
+import maya.cmds as cmds
 
 import sys
 from abc import ABCMeta, abstractmethod, abstractproperty
@@ -88,8 +89,10 @@ class XForm_Binding(Binding):
         category (str): Name of the category this setting should be saved under
         attribute (str): Name to save the attribute under
         binding (list<str>): List of all attribute names that should be saved
+        data_type (str): setAttr type flag needed to set the attribute, None for numeric attributes
     '''
     _do_register = True
+    data_type = None
 
     @staticmethod
     def get_inherited_class_strings():
@@ -129,7 +132,7 @@ class XForm_Binding(Binding):
             args (args): Optional args
         '''
         for i, bind in enumerate(self.binding):
-            attr_value = pm.PyNode('{0}.{1}'.format(obj.name(), bind)).get()
+            attr_value = cmds.getAttr('{0}.{1}'.format(obj.longName(), bind))
             data.setdefault(self.category, {})
             data[self.category][bind] = attr_value
 
@@ -151,6 +154,32 @@ class XForm_Binding(Binding):
         except:
             pass
 
+    def load_data_list(self, load_list):
+        '''
+        Load data from a json file onto many Maya scene objects in one pass, setting the attribute by name with
+        cmds.setAttr rather than resolving a PyNode attribute for each object
+
+        Args:
+            load_list (list<(dictionary, PyNode)>): Pairs of json joint dictionary to load from and Maya scene object to load onto
+
+        Returns:
+            (int). Number of objects the attribute was set on
+        '''
+        set_kwargs = {'type': self.data_type} if self.data_type else {}
+        set_count = 0
+        for data, obj in load_list:
+            try:
+                category_data = data.get(self.category, {})
+                if not all(x in category_data for x in self.binding):
+                    continue
+                cmds.setAttr("{0}.{1}".format(obj.longName(), self.attribute), *[category_data[x] for x in self.binding], **set_kwargs)
+                set_count += 1
+            except Exception:
+                # Matches load_data(), a bad settings entry or a locked, connected, or missing attribute only skips that object
+                pass
+
+        return set_count
+
 class Translate(XForm_Binding):
     '''
     Binding to save or load the tx, ty, and tz channels of the translate attribute to json
@@ -209,6 +238,7 @@ class BindPose_Binding(XForm_Binding):
         sub_attr (list<str>): List of all sub attribute names that should be saved from attribute
     '''
     _do_register = False
+    data_type = 'double3'
 
     def __init__(self):
         super().__init__()
@@ -224,10 +254,10 @@ class BindPose_Binding(XForm_Binding):
             obj (PyNode): Maya scene object to save attributes from
             args (args): Optional args
         '''
+        attr_value = get_first_or_default(cmds.getAttr('{0}.{1}'.format(obj.longName(), self.attribute)))
+        data.setdefault(self.category, {})
         for i, bind in enumerate(self.binding):
-            attr_value = pm.PyNode('{0}.{1}'.format(obj.name(), self.attribute)).get()
-            data.setdefault(self.category, {})
-            data[self.category][bind] = getattr(attr_value, self.sub_attr[i])
+            data[self.category][bind] = attr_value['xyz'.index(self.sub_attr[i])]
 
 class Bind_Translate(BindPose_Binding):
     '''
@@ -18,14 +18,18 @@ If not, see <https://www.gnu.org/licenses/>.
 '''
 
 import pymel.core as pm
+import maya.cmds as cmds
 import maya.mel as mel
+import maya.api.OpenMaya as OpenMaya
 
 import inspect
 import math
 import os
 import time
+import types
 
 import v1_core
+import v1_math
 import v1_shared.usertools
 
 import maya_utils
@@ -40,6 +44,7 @@ from metadata.network_core import AttachmentJoints, AddonCore, AddonControls, Ch
 from metadata.network_registry import Network_Registry, Property_Registry
 
 from v1_shared.shared_utils import get_first_or_default, get_index_or_default, get_last_or_default
+from v1_plan.combine_plan import CombinePart, CombinePlan
 
 
 
@@ -117,18 +122,173 @@ def replace_transforms_with_joints(obj_list):
 
     return return_list
 
+class SkeletonDictCache(object):
+    '''
+    Cache of get_skeleton_dict() results per character, so rigging actions don't re-read region markup from the
+    metadata graph on every call.  Entries are invalidated by Maya API callbacks, changes to the RegionsCore or any 
+    RigMarkupProperty node of a character clear that character, and DAG hierarchy changes or network nodes being added
+    or removed clear characters that were found by searching the joint hierarchy.  All entries are cleared on scene
+    open and new scene.
+
+    Attributes:
+        entry_dict (dictionary<PyNode, dictionary>): Cache entries keyed by character network node, each holding the 
+            read-only 'skeleton_dict', the node 'callback_list', and whether the entry 'uses_hierarchy'
+        global_callback_list (list<int>): Scene wide callback IDs, registered when the first entry is cached
+        hit_count (int): Number of get_skeleton_dict() calls returned from the cache
+        miss_count (int): Number of get_skeleton_dict() calls that built a new dictionary
+    '''
+    entry_dict = {}
+    global_callback_list = []
+    hit_count = 0
+    miss_count = 0
+
+    @classmethod
+    def get(cls, character_node):
+        '''
+        Get the cached skeleton dictionary for a character
+
+        Args:
+            character_node (PyNode): Maya scene character network node
+
+        Returns:
+            (MappingProxyType). Read-only skeleton dictionary, or None if the character isn't cached
+        '''
+        entry = cls.entry_dict.get(character_node)
+        if entry:
+            cls.hit_count += 1
+            return entry['skeleton_dict']
+
+        cls.miss_count += 1
+        return None
+
+    @classmethod
+    def add(cls, character_node, skeleton_dict, watch_node_list, uses_hierarchy):
+        '''
+        Cache a skeleton dictionary for a character
+
+        Args:
+            character_node (PyNode): Maya scene character network node
+            skeleton_dict (dictionary): The skeleton dictionary from get_skeleton_dict()
+            watch_node_list (list<PyNode>): Scene nodes that clear this entry when any of their attributes or connections change
+            uses_hierarchy (boolean): Whether the dictionary was found by searching the joint hierarchy
+
+        Returns:
+            (MappingProxyType). Read-only view of skeleton_dict
+        '''
+        if not cls.global_callback_list:
+            cls.add_global_callbacks()
+
+        callback_list = []
+        selection_list = OpenMaya.MSelectionList()
+        for watch_node in [x for x in watch_node_list if x.exists()]:
+            selection_list.add(watch_node.longName())
+        for i in range(selection_list.length()):
+            callback_list.append(OpenMaya.MNodeMessage.addAttributeChangedCallback(selection_list.getDependNode(i), cls.node_changed, character_node))
+
+        read_only_dict = types.MappingProxyType({side: types.MappingProxyType({region: types.MappingProxyType(region_dict) 
+                                                                               for region, region_dict in side_dict.items()})
+                                                 for side, side_dict in skeleton_dict.items()})
+        cls.entry_dict[character_node] = {'skeleton_dict': read_only_dict, 'callback_list': callback_list, 'uses_hierarchy': uses_hierarchy}
+
+        return read_only_dict
+
+    @classmethod
+    def remove(cls, character_node):
+        '''
+        Remove a character from the cache, and it's node callbacks
+
+        Args:
+            character_node (PyNode): Maya scene character network node
+        '''
+        entry = cls.entry_dict.pop(character_node, None)
+        if entry:
+            for callback_id in entry['callback_list']:
+                try:
+                    OpenMaya.MMessage.removeCallback(callback_id)
+                except RuntimeError:
+                    # Callbacks are already removed if their node was deleted
+                    pass
+
+    @classmethod
+    def clear(cls, uses_hierarchy_only = False):
+        '''
+        Remove cached characters
+
+        Args:
+            uses_hierarchy_only (boolean): Only remove characters that were found by searching the joint hierarchy
+        '''
+        for character_node in [k for k, v in cls.entry_dict.items() if v['uses_hierarchy'] or not uses_hierarchy_only]:
+            cls.remove(character_node)
+
+    @classmethod
+    def get_stats(cls):
+        '''
+        Get cache usage counters
+
+        Returns:
+            (dictionary). 'hits', 'misses', and number of 'entries' in the cache
+        '''
+        return {'hits': cls.hit_count, 'misses': cls.miss_count, 'entries': len(cls.entry_dict)}
+
+    @classmethod
+    def add_global_callbacks(cls):
+        '''
+        Register the scene wide callbacks that clear the cache
+        '''
+        cls.global_callback_list = [OpenMaya.MDagMessage.addAllDagChangesCallback(cls.hierarchy_changed),
+                                    OpenMaya.MDGMessage.addNodeAddedCallback(cls.network_changed, 'network'),
+                                    OpenMaya.MDGMessage.addNodeRemovedCallback(cls.network_changed, 'network'),
+                                    OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kBeforeOpen, cls.scene_changed),
+                                    OpenMaya.MSceneMessage.addCallback(OpenMaya.MSceneMessage.kBeforeNew, cls.scene_changed)]
+
+    @classmethod
+    def remove_global_callbacks(cls):
+        '''
+        Remove the scene wide callbacks and clear the cache
+        '''
+        cls.clear()
+        for callback_id in cls.global_callback_list:
+            OpenMaya.MMessage.removeCallback(callback_id)
+        cls.global_callback_list = []
+
+    @classmethod
+    def node_changed(cls, message, plug, other_plug, character_node):
+        # Ignore attribute evaluation, only edits to values, attributes, and connections change the skeleton dictionary
+        change_mask = (OpenMaya.MNodeMessage.kConnectionMade | OpenMaya.MNodeMessage.kConnectionBroken | OpenMaya.MNodeMessage.kAttributeSet | 
+                       OpenMaya.MNodeMessage.kAttributeAdded | OpenMaya.MNodeMessage.kAttributeRemoved)
+        if message & change_mask:
+            cls.remove(character_node)
+
+    @classmethod
+    def hierarchy_changed(cls, message, child, parent, *args):
+        cls.clear(uses_hierarchy_only = True)
+
+    @classmethod
+    def network_changed(cls, node, *args):
+        cls.clear(uses_hierarchy_only = True)
+
+    @classmethod
+    def scene_changed(cls, *args):
+        cls.clear()
+
+
 def get_skeleton_dict(jnt):
     '''
     Creates a dictionary of all region markup chains on a skeleton, using the direct connection from RegionsCore if it
-    exists on the skeleton, otherwise searching every joint for the RigMarkupProperty
+    exists on the skeleton, otherwise searching every joint for the RigMarkupProperty.  Results are cached per
+    character by SkeletonDictCache and returned read-only, copy the dictionary before changing it.
 
     Args:
         jnt (PyNode): The Maya scene joint node that's part of a skeleton
 
     Returns:
-        dictionary. All joints marked up by RigMarkupProperties organized by region and side
+        MappingProxyType. All joints marked up by RigMarkupProperties organized by region and side
     '''
     character_network = metadata.meta_network_utils.get_first_network_entry(jnt, CharacterCore)
+    cached_dict = SkeletonDictCache.get(character_network.node)
+    if cached_dict is not None:
+        return cached_dict
+
     regions_network = character_network.get_downstream(RegionsCore)
     skeleton_dict = {}
     # Fast search for new characters
@@ -139,8 +299,11 @@ def get_skeleton_dict(jnt):
             skeleton_dict.setdefault(side, {})
             skeleton_dict[side].setdefault(region_markup_node.region.get(), {})
             skeleton_dict[side][region_markup_node.region.get()][region_markup_node.tag.get()] = pm.listConnections(region_markup_node.message, type='joint')[0]
+        watch_node_list = [regions_network.node] + region_markup_node_list
+        uses_hierarchy = False
     # slow search for old characters
     else:
+        watch_node_list = [regions_network.node] if regions_network else []
         root_joint = get_root_joint(jnt)
         joint_list = get_hierarchy(root_joint, type='joint')
         for skeleton_joint in joint_list:
@@ -153,9 +316,12 @@ def get_skeleton_dict(jnt):
                     skeleton_dict.setdefault(side, {})
                     skeleton_dict[side].setdefault(rig_markup.data['region'], {})
                     skeleton_dict[side][rig_markup.data['region']][rig_markup.data['tag']] = skeleton_joint
+                    watch_node_list.append(rig_markup.node)
 
         clean_skeleton_dict(skeleton_dict)
-    return skeleton_dict
+        uses_hierarchy = True
+
+    return SkeletonDictCache.add(character_network.node, skeleton_dict, watch_node_list, uses_hierarchy)
 
 def clean_skeleton_dict(skeleton_dict):
     '''
@@ -935,7 +1101,7 @@ def calculate_pole_vector_position(joint_list, frame):
 
     return mid_point + (pv_vector * length)
 
-def zero_skeleton_joints(joint_list, offset_dict = None):
+def zero_skeleton_joints(joint_list, offset_dict = None, key = False):
     '''
     Zero all joints in the provided list to their bind translate and rotate
 
@@ -943,20 +1109,43 @@ def zero_skeleton_joints(joint_list, offset_dict = None):
         joint_list (list<PyNode>): List of Maya scene joints to zero
         offset_dict (dictionary): dictionary of joints with entries for transform attribute offsets.  Example:
             {nt.Joint(u'gua:foot_l'): {'rotate': dt.Vector([0.0, 0.0, 20.0]), 'translate': dt.Vector([0.0, 0.0, 0.0])}}
+        key (boolean): Whether or not to key every zeroed attribute
+
+    Returns:
+        (int). Number of attributes zeroed
+    '''
+    return maya_utils.node_utils.set_plug_values(get_bind_plug_values(joint_list, offset_dict), key = key)
+
+def get_bind_plug_values(joint_list, offset_dict = None):
     '''
+    Gather the bind translate and rotate values for a list of joints, along with a scale of 1.  Translate and rotate
+    are skipped on joints without bind values or with any locked channel
+
+    Args:
+        joint_list (list<PyNode>): List of Maya scene joints to zero
+        offset_dict (dictionary): dictionary of joints with entries for transform attribute offsets.
+
+    Returns:
+        (list<tuple>). (plug name, (x,y,z) value) for every attribute to zero
+    '''
+    plug_value_list = []
     for jnt in joint_list:
-        if pm.attributeQuery('bind_translate', node=jnt, exists=True) and not maya_utils.node_utils.attribute_is_locked(jnt.translate):
-            jnt.translate.set(jnt.bind_translate.get(), force=True)
-            if offset_dict and jnt in offset_dict.keys():
-                jnt.translate.set(jnt.translate.get() + offset_dict[jnt]['translate'], force=True)
+        jnt_name = jnt.longName()
+        user_attr_set = set(cmds.listAttr(jnt_name, ud=True) or [])
+        locked_attr_set = set(cmds.listAttr(jnt_name, locked=True) or [])
+        jnt_offset = offset_dict.get(jnt) if offset_dict else None
 
-        if (pm.attributeQuery('bind_rotate', node=jnt, exists=True) and not maya_utils.node_utils.attribute_is_locked(jnt.rotate)):
-            jnt.rotate.set(jnt.bind_rotate.get(), force=True)
-            if offset_dict and jnt in offset_dict.keys():
-                jnt.rotate.set(jnt.rotate.get() + offset_dict[jnt]['rotate'], force=True)
+        for attr_name in ['translate', 'rotate']:
+            is_locked = [x for x in [attr_name, attr_name+'X', attr_name+'Y', attr_name+'Z'] if x in locked_attr_set]
+            if 'bind_' + attr_name in user_attr_set and not is_locked:
+                value = get_first_or_default(cmds.getAttr("{0}.bind_{1}".format(jnt_name, attr_name)))
+                if jnt_offset:
+                    value = [x + y for x, y in zip(value, jnt_offset[attr_name])]
+                plug_value_list.append(("{0}.{1}".format(jnt_name, attr_name), tuple(value)))
 
-        jnt.scale.set([1,1,1])
+        plug_value_list.append(("{0}.scale".format(jnt_name), (1,1,1)))
 
+    return plug_value_list
 
 def zero_orient_joints(joint_list):
     for obj in joint_list:
@@ -978,19 +1167,126 @@ def zero_character(jnt, offset_dict = None, ignore_rigged = True):
     zero_joint_list = get_hierarchy(character_root_jnt, type='joint')
     if ignore_rigged:
         zero_joint_list = [x for x in zero_joint_list if not is_rigged(x)]
-    zero_skeleton_joints(zero_joint_list, offset_dict)
 
-    root_parent = character_root_jnt.getParent()
-    if "UE_Actor_Offset" in root_parent.name():
-        root_parent.translate.set([0,0,0])
-        root_parent.rotate.set([0,0,0])
-        root_parent.scale.set([1,1,1])
+    zero_time = time.perf_counter()
+    plug_value_list = get_bind_plug_values(zero_joint_list, offset_dict)
 
+    offset_parent_list = []
+    root_parent = character_root_jnt.getParent()
+    if root_parent and "UE_Actor_Offset" in root_parent.name():
+        offset_parent_list.append(root_parent)
         offset_parent = root_parent.getParent()
-        if "UE_Attachment_Offset" in offset_parent.name():
-            offset_parent.translate.set([0,0,0])
-            offset_parent.rotate.set([0,0,0])
-            offset_parent.scale.set([1,1,1])
+        if offset_parent and "UE_Attachment_Offset" in offset_parent.name():
+            offset_parent_list.append(offset_parent)
+
+    for offset_parent in offset_parent_list:
+        offset_name = offset_parent.longName()
+        plug_value_list.extend([(offset_name + '.translate', (0,0,0)), (offset_name + '.rotate', (0,0,0)), (offset_name + '.scale', (1,1,1))])
+
+    maya_utils.node_utils.set_plug_values(plug_value_list)
+    v1_core.v1_logging.get_logger().debug("Zeroed {0} Joints in {1} Seconds".format(len(zero_joint_list), time.perf_counter() - zero_time))
+
+def get_transfer_constraint_type(constraint_name):
+    '''
+    Find which constraint v1_math.retarget.solve_transfer() should match for a constraint type name, checking
+    names in the same order as maya_utils.node_utils.get_constraint_by_name()
+
+    Args:
+        constraint_name (str): Name of a constraint type, ie. 'parentConstraint'
+
+    Returns:
+        str. 'parent', 'orient' or 'point', or None if the constraint can't be solved without building it
+    '''
+    for constraint_type in ['parent', 'orient', 'point']:
+        if constraint_type in constraint_name.lower():
+            return constraint_type
+    return None
+
+def transfer_joint_animations(transfer_list, keep_offset = True):
+    '''
+    Transfer animation from source joints to target joints, matching what the given constraint types would do
+    when baked.  World matrices are sampled for every joint across the bake range and the target local transforms
+    are solved with v1_math.retarget.solve_transfer() and keyed directly, no constraints are built and the scene
+    isn't played back.  Constraint types other than parent, orient and point fall back to a constraint and bake, as
+    does every joint below a fallback joint, since it can't be solved until its parent is baked.  With smart bake on
+    every joint falls back, solved keys are set on every sampled frame.  Like the bake, keys are set on the target's
+    current animation layer and keys outside the bake range are kept
+
+    Args:
+        transfer_list (list<tuple>): (source joint, target joint, constraint name) for each joint to transfer
+        keep_offset (boolean): Whether or not to hold the offset between joints on the current frame, like maintainOffset
+    '''
+    transfer_time = time.perf_counter()
+
+    bake_settings = v1_core.global_settings.GlobalSettings().get_category(v1_core.global_settings.BakeSettings)
+
+    # Parents before children, so children are solved in their parent's new space and a fallback parent is found
+    # before any of its children
+    transfer_list = sorted(transfer_list, key = lambda x: len(x[1].longName().split('|')))
+    solve_list = []
+    fallback_list = []
+    fallback_target_set = set()
+    for transfer_entry in transfer_list:
+        target_jnt = transfer_entry[1]
+        if (bake_settings.smart_bake or not get_transfer_constraint_type(transfer_entry[2]) 
+            or fallback_target_set.intersection(target_jnt.getAllParents())):
+            fallback_list.append(transfer_entry)
+            fallback_target_set.add(target_jnt)
+        else:
+            solve_list.append(transfer_entry)
+    target_index_dict = {x[1]: i for i, x in enumerate(solve_list)}
+
+    start_frame, end_frame = maya_utils.baking.get_bake_time_range([x[0] for x in transfer_list], bake_settings)
+    frame_list = list(range(start_frame, end_frame + 1, max(int(bake_settings.sample_by), 1)))
+
+    joint_data_list = []
+    for source_jnt, target_jnt, constraint_name in solve_list:
+        source_world_attr = source_jnt.worldMatrix.name()
+        target_world_attr = target_jnt.worldMatrix.name()
+        parent_world_attr = target_jnt.parentMatrix.name()
+        constraint_type = get_transfer_constraint_type(constraint_name)
+
+        offset = None
+        if keep_offset:
+            offset = v1_math.retarget.get_constraint_offset(constraint_type, v1_math.retarget.from_list(cmds.getAttr(source_world_attr)),
+                                                             v1_math.retarget.from_list(cmds.getAttr(target_world_attr)),
+                                                             v1_math.retarget.from_list(cmds.getAttr(parent_world_attr)))
+
+        target_name = target_jnt.longName()
+        joint_data_list.append({'constraint_type': constraint_type, 'offset': offset, 'parent_index': target_index_dict.get(target_jnt.getParent()),
+                                'source_world': [v1_math.retarget.from_list(cmds.getAttr(source_world_attr, time=x)) for x in frame_list],
+                                'target_world': [v1_math.retarget.from_list(cmds.getAttr(target_world_attr, time=x)) for x in frame_list],
+                                'parent_world': [v1_math.retarget.from_list(cmds.getAttr(parent_world_attr, time=x)) for x in frame_list],
+                                'joint_orient': get_first_or_default(cmds.getAttr(target_name + '.jointOrient')) if target_jnt.hasAttr('jointOrient') else (0, 0, 0),
+                                'rotate_axis': get_first_or_default(cmds.getAttr(target_name + '.rotateAxis')),
+                                'rotate_order': cmds.getAttr(target_name + '.rotateOrder')})
+    v1_core.v1_logging.get_logger().debug("Sampled {0} Joints over {1} Frames in {2} Seconds".format(len(solve_list), len(frame_list), time.perf_counter() - transfer_time))
+
+    result_list = v1_math.retarget.solve_transfer(joint_data_list)
+
+    locked_attr_dict = {}
+    for (source_jnt, target_jnt, constraint_name), result in zip(solve_list, result_list):
+        for attr_name in ['translate', 'rotate']:
+            value_list = result[attr_name]
+            if not value_list:
+                continue
+            if attr_name == 'translate':
+                # World matrices are in internal units, convert to match the scene units keys are set in
+                value_list = [[maya_utils.node_utils.convert_scene_units(x) for x in y] for y in value_list]
+            locked_attr_list = locked_attr_dict.setdefault(target_jnt, cmds.listAttr(target_jnt.longName(), locked=True) or [])
+            for i, axis in enumerate('XYZ'):
+                if attr_name + axis not in locked_attr_list:
+                    maya_utils.keyframe_utils.set_keys_bulk(getattr(target_jnt, attr_name + axis), frame_list, [x[i] for x in value_list])
+
+    if fallback_list:
+        delete_list = []
+        for source_jnt, target_jnt, constraint_name in fallback_list:
+            constraint_method = maya_utils.node_utils.get_constraint_by_name(constraint_name)
+            delete_list.append( constraint_method(source_jnt, target_jnt, mo=keep_offset) )
+        maya_utils.baking.bake_objects([x[1] for x in fallback_list], True, True, True, use_settings = True, simulation = False)
+        pm.delete(delete_list)
+
+    v1_core.v1_logging.get_logger().info("Transferred {0} Joints in {1} Seconds".format(len(transfer_list), time.perf_counter() - transfer_time))
 
 def region_transfer_animations(source_node, dest_node, keep_offset = True):
     '''
@@ -1015,8 +1311,7 @@ def region_transfer_animations(source_node, dest_node, keep_offset = True):
     source_joint = source_joint_core_network.get_first_connection()
     source_skeleton_dict = get_skeleton_dict(source_joint)
 
-    delete_list = []
-    bake_list = []
+    transfer_list = []
     for side, source_side_dict in source_skeleton_dict.items():
         side_dict = skeleton_dict.get(side)
         if side_dict is None:
@@ -1032,16 +1327,10 @@ def region_transfer_animations(source_node, dest_node, keep_offset = True):
             for souce_jnt, target_jnt in zip(source_chain, chain):
                 if not 'unitConversion' in [x.type() for x in target_jnt.rx.listConnections(s=True, d=False)]:
                     retarget_property = metadata.meta_property_utils.get_property(target_jnt, JointRetargetProperty)
-                    if retarget_property is not None:
-                        constraint_name = retarget_property.get('constraint_type')
-                        constraint_method = maya_utils.node_utils.get_constraint_by_name(constraint_name)
-                    else:
-                        constraint_method = pm.orientConstraint
-                    delete_list.append( constraint_method(souce_jnt, target_jnt, mo=keep_offset) )
-                    bake_list.append(target_jnt)
+                    constraint_name = retarget_property.get('constraint_type') if retarget_property is not None else 'orientConstraint'
+                    transfer_list.append((souce_jnt, target_jnt, constraint_name))
 
-    maya_utils.baking.bake_objects(bake_list, True, True, True, use_settings = True, simulation = False)
-    pm.delete(delete_list)
+    transfer_joint_animations(transfer_list, keep_offset)
 
     pm.autoKeyframe(state=autokey_state)
 
@@ -1066,9 +1355,8 @@ def joint_transfer_animations(source_node, dest_node, keep_offset = True, joint_
     source_network = metadata.meta_network_utils.create_from_node(source_node)
     namespace = source_network.group.namespace()
 
-    delete_list = []
+    transfer_list = []
     failed_joint_list = []
-    no_bake_list = []
     for jnt in character_joint_list:
         new_name = namespace + jnt.name() if not character_namespace else jnt.name().replace(character_namespace, namespace) 
         if pm.objExists(new_name):
@@ -1077,20 +1365,12 @@ def joint_transfer_animations(source_node, dest_node, keep_offset = True, joint_
             has_connected_property = 'unitConversion' in [x.type() for x in jnt.rx.listConnections(s=True, d=False)]
             if not has_connected_property and not is_rigged(jnt):
                 retarget_property = metadata.meta_property_utils.get_property(jnt, JointRetargetProperty)
-                if retarget_property is not None:
-                    constraint_name = retarget_property.get('constraint_type')
-                    constraint_method = maya_utils.node_utils.get_constraint_by_name(constraint_name)
-                else:
-                    constraint_method = pm.orientConstraint
-                delete_list.append( constraint_method(new_node, jnt, mo=keep_offset) )
-            else:
-                no_bake_list.append(jnt)
+                constraint_name = retarget_property.get('constraint_type') if retarget_property is not None else 'orientConstraint'
+                transfer_list.append((new_node, jnt, constraint_name))
         else:
             failed_joint_list.append(jnt)
 
-    bake_list = [x for x in character_joint_list if x not in no_bake_list]
-    maya_utils.baking.bake_objects(bake_list, True, True, True, use_settings = True, simulation = False)
-    pm.delete(delete_list)
+    transfer_joint_animations(transfer_list, keep_offset)
 
     if failed_joint_list:
         failed_message = "JOINTS FAILED - "
@@ -1464,7 +1744,6 @@ def import_and_combine(path_list, skeleton_list = None, base_mesh = None, mesh_g
 
     character_settings = v1_core.global_settings.GlobalSettings().get_category(v1_core.global_settings.CharacterSettings)
 
-    import_dict = {}
     bind_settings_list = []
     offset_settings_list = []
     for path in path_list:
@@ -1472,9 +1751,8 @@ def import_and_combine(path_list, skeleton_list = None, base_mesh = None, mesh_g
         bind_settings_list.append(file_ops.get_first_settings_file(dir_path, 'bind', None, True))
         offset_settings_list.append(file_ops.get_first_settings_file(dir_path, 'offset', None, True))
         
-        import_objects = maya_utils.scene_utils.import_file_safe(path, fbx_mode="add", tag_imported=True, 
-                                                                 load_properties=load_properties, returnNewNodes=True)
-        import_dict[path] = import_objects
+    import_dict = maya_utils.scene_utils.import_files_safe(path_list, fbx_mode="add", tag_imported=True, 
+                                                          load_properties=load_properties, returnNewNodes=True)
         
     bind_settings_list = [x for x in list(set(bind_settings_list)) if x != None]
     offset_settings_list = [x for x in list(set(offset_settings_list)) if x != None]
@@ -1516,8 +1794,9 @@ def import_and_combine(path_list, skeleton_list = None, base_mesh = None, mesh_g
                                              load_joint_list = character_skeleton, update_settings_path = False)
         zero_skeleton_joints(character_skeleton)
 
-    # duplicate all meshes and bind them to the one skeleton
-    dupe_combine_list = []
+    # Gather every skinned mesh to combine, the base mesh goes first so its vertices keep their indices
+    combine_start = time.perf_counter()
+    skin_cluster_dict = {}
     delete_mesh_list = []
     for path, imported_obj_list in import_dict.items():
         imported_mesh_list = pm.ls(imported_obj_list, type='mesh')
@@ -1528,53 +1807,81 @@ def import_and_combine(path_list, skeleton_list = None, base_mesh = None, mesh_g
         for imported_mesh in imported_mesh_list:
             mesh_skin_cluster = skin_weights.find_skin_cluster(imported_mesh)
             if (mesh_skin_cluster is not None):
-                dupe_mesh, skeleton_list = duplicate_for_combine(imported_mesh, skeleton_list)
-                pm.select(dupe_mesh, replace=True)
-                pm.bakePartialHistory(prePostDeformers=True)
-                dupe_combine_list.append(dupe_mesh)
+                skin_cluster_dict[imported_mesh] = mesh_skin_cluster
 
-    # If a base mesh was given include it in the combine
+    combine_mesh_list = list(skin_cluster_dict.keys())
     if base_mesh:
-        dupe_base_mesh, skeleton_list = duplicate_for_combine(base_mesh, skeleton_list)
-        dupe_combine_list.insert(0, dupe_base_mesh)
+        skin_cluster_dict[base_mesh] = skin_weights.find_skin_cluster(base_mesh)
+        combine_mesh_list.insert(0, base_mesh)
         delete_mesh_list.append(base_mesh)
         mesh_name = base_mesh.stripNamespace().nodeName()
 
+    # Read every part's weights once and plan the whole combine against the one skeleton
+    part_list = []
+    for mesh_transform in combine_mesh_list:
+        influence_list, weight_list, vertex_count = skin_weights.get_skin_weights(skin_cluster_dict[mesh_transform])
+        # Full paths let the plan move weight from joints missing on the skeleton to their nearest ancestor
+        influence_list = [get_first_or_default(cmds.ls(x, long=True)) or x for x in influence_list]
+        part_list.append(CombinePart(mesh_transform.name(), influence_list, weight_list, vertex_count))
+    plan = CombinePlan(part_list, [x.name() for x in skeleton_list] if skeleton_list else None)
+    reassign_dict = plan.reassign_dict
+    for missing_influence in plan.missing_influence_list:
+        if missing_influence in reassign_dict:
+            v1_core.v1_logging.get_logger().warning("import_and_combine - {0} isn't on the skeleton, its weights were moved to {1}".format(
+                missing_influence, reassign_dict[missing_influence]))
+        else:
+            v1_core.v1_logging.get_logger().warning("import_and_combine - {0} isn't on the skeleton, its weights were dropped".format(missing_influence))
+
+    # Merge before any mesh is duplicated, so a failed merge only has to remove the imports
+    try:
+        merged_weight_list = plan.merge_weights()
+    except ValueError:
+        pm.delete([x for file_import_list in import_dict.values() for x in file_import_list if pm.objExists(x)])
+        if character_network:
+            settings_path = file_ops.get_first_settings_file_from_character(character_network)
+            file_ops.load_settings_from_json(character_network.group, settings_path, binding_list, load_joint_list = character_skeleton, 
+                                             update_settings_path = False)
+            zero_skeleton_joints(character_skeleton)
+            reattach_skeleton(constraint_weight_dict)
+        raise
+
+    dupe_combine_list = [duplicate_mesh_for_combine(x) for x in combine_mesh_list]
+
     combine_mesh = None
     if len(dupe_combine_list) > 1:
+        # Gather PartialModelProperty and each part's ImportedCore before the combine
         partial_property_list = []
-        # Gather and disconnect PartialModelProperty
+        part_network_list = []
         for obj in dupe_combine_list:
             property_list = metadata.meta_property_utils.get_property_list(obj, PartialModelProperty)
             partial_property_list.extend(property_list)
+            imported_network = metadata.meta_network_utils.get_first_network_entry(obj, ImportedCore) if not property_list else None
+            part_network_list.append(imported_network)
 
-        # Combine Mesh and reconnect PartialModelProperty nodes
-        combine_mesh, combine_skin_cluster = pm.polyUniteSkinned(dupe_combine_list, ch=True, mergeUVSets=True, centerPivot=True)
-        combine_mesh = pm.PyNode(combine_mesh)
-        combine_skin_cluster = pm.PyNode(combine_skin_cluster)
-        pm.select(combine_mesh, replace=True)
-        pm.bakePartialHistory(prePostDeformers=True)
+        combine_mesh = pm.PyNode(get_first_or_default(pm.polyUnite(dupe_combine_list, ch=True, mergeUVSets=True, centerPivot=True)))
+        pm.delete(combine_mesh, constructionHistory=True)
 
         for partial_property in partial_property_list:
             partial_property.connect_node(combine_mesh)
 
-        total_vertex_count = -1
-        for obj in dupe_combine_list:
-            vertex_count = len(obj.vtx)
-            existing_property = metadata.meta_property_utils.get_property(obj, PartialModelProperty)
-            if not existing_property:
-                imported_network = metadata.meta_network_utils.get_first_network_entry(obj, ImportedCore)
+        # Parts that weren't already partial models get a PartialModelProperty for their vertex range
+        for imported_network, vertex_range in zip(part_network_list, plan.get_vertex_ranges()):
+            if imported_network:
                 partial_property = Property_Registry().get(PartialModelProperty)()
                 imported_network.connect_node(partial_property.node)
                 partial_property.connect_node(combine_mesh)
+                partial_property.set('vertex_indicies', "[({0},{1})]".format(*vertex_range))
 
-                object_first_vertex = total_vertex_count + 1
-                object_last_vertex = total_vertex_count + vertex_count
-                partial_property.set('vertex_indicies', "[({0},{1})]".format(object_first_vertex, object_last_vertex))
+        pm.delete(dupe_combine_list)
 
-            total_vertex_count += vertex_count
+    # Bind once and write every part's weights in a single bulk set
+    skin_mesh = combine_mesh if combine_mesh else get_first_or_default(dupe_combine_list)
+    if skin_mesh and plan.influence_list:
+        combine_skin_cluster = pm.skinCluster([skin_mesh] + [pm.PyNode(x) for x in plan.influence_list], toSelectedBones=True)
+        skin_weights.set_skin_weights(combine_skin_cluster, plan.influence_list, merged_weight_list)
 
-        pm.delete(dupe_combine_list)
+    v1_core.v1_logging.get_logger().info("import_and_combine - Combined {0} Meshes on {1} Influences in {2} Seconds".format(
+        len(part_list), len(plan.influence_list), time.perf_counter() - combine_start))
 
     pm.delete(delete_mesh_list)
     pm.delete(delete_skeleton_list)
@@ -1601,6 +1908,29 @@ def import_and_combine(path_list, skeleton_list = None, base_mesh = None, mesh_g
     
     return return_mesh
 
+def duplicate_mesh_for_combine(mesh_transform):
+    '''
+    Duplicates the provided mesh without its skinning, keeping its ImportedCore and PartialModelProperty connections.
+    The combine re-binds the result, see v1_plan.combine_plan.CombinePlan
+
+    Args:
+        mesh_transform (PyNode): Transform of the skinned mesh to duplicate
+
+    Returns:
+        PyNode. Transform of the duplicated mesh
+    '''
+    imported_network = metadata.meta_network_utils.get_first_network_entry(mesh_transform, ImportedCore)
+    partial_property_list = metadata.meta_property_utils.get_property_list(mesh_transform, PartialModelProperty)
+
+    dupe_mesh = get_first_or_default(pm.duplicate(mesh_transform))
+    pm.delete([x for x in dupe_mesh.getShapes() if x.intermediateObject.get()])
+    if imported_network:
+        imported_network.connect_node(dupe_mesh)
+    for partial_property in partial_property_list:
+        partial_property.connect_node(dupe_mesh)
+
+    return dupe_mesh
+
 def duplicate_for_combine(mesh_transform, skeleton_list = None):
     '''
     Duplicates the provided mesh and re-binds it to the joints in skeleton_list
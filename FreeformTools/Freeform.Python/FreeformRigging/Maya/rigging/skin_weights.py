@@ -18,6 +18,8 @@ If not, see <https://www.gnu.org/licenses/>.
 '''
 
 import pymel.core as pm
+import maya.api.OpenMaya as OpenMaya
+import maya.api.OpenMayaAnim as OpenMayaAnim
 
 import time
 import os
@@ -58,6 +60,56 @@ def find_skin_cluster(obj):
 
     return return_cluster
 
+def _get_skin_function_set(skin_cluster):
+    '''
+    Get the API skin cluster function set, the skinned mesh path and a component for every vertex on the mesh
+    '''
+    selection_list = OpenMaya.MSelectionList()
+    selection_list.add(skin_cluster.name())
+    skin_fn = OpenMayaAnim.MFnSkinCluster(selection_list.getDependNode(0))
+
+    mesh_path = skin_fn.getPathAtIndex(0)
+    component_fn = OpenMaya.MFnSingleIndexedComponent()
+    component = component_fn.create(OpenMaya.MFn.kMeshVertComponent)
+    component_fn.setCompleteData(OpenMaya.MFnMesh(mesh_path).numVertices)
+
+    return skin_fn, mesh_path, component
+
+def get_skin_weights(skin_cluster):
+    '''
+    Read every vertex weight on a skin cluster in a single API call
+
+    Args:
+        skin_cluster (PyNode): The skin cluster to read
+
+    Returns:
+        (list<str>, list<float>, int). Influence names in skin cluster order, vertex-major weights and the vertex count
+    '''
+    skin_fn, mesh_path, component = _get_skin_function_set(skin_cluster)
+    influence_list = [x.partialPathName() for x in skin_fn.influenceObjects()]
+    weight_array, influence_count = skin_fn.getWeights(mesh_path, component)
+
+    return influence_list, list(weight_array), OpenMaya.MFnMesh(mesh_path).numVertices
+
+def set_skin_weights(skin_cluster, influence_list, weight_list):
+    '''
+    Write every vertex weight on a skin cluster in a single API call
+
+    Args:
+        skin_cluster (PyNode): The skin cluster to write to
+        influence_list (list<str>): Influence names the weights are for, partial or full paths, must all be influences on
+            the skin cluster
+        weight_list (list<float>): Vertex-major weights, a row of len(influence_list) weights for every vertex
+    '''
+    skin_fn, mesh_path, component = _get_skin_function_set(skin_cluster)
+    skin_index_dict = {}
+    for i, influence_path in enumerate(skin_fn.influenceObjects()):
+        skin_index_dict[influence_path.partialPathName()] = i
+        skin_index_dict[influence_path.fullPathName()] = i
+    index_array = OpenMaya.MIntArray([skin_index_dict[x] for x in influence_list])
+
+    skin_fn.setWeights(mesh_path, component, index_array, OpenMaya.MDoubleArray(weight_list), normalize=False)
+
 
 #region settings file ops
 def save_skin_weights_with_dialog(character_grp):
@@ -50,7 +50,7 @@ from rigging.rig_components.fk import FK
 from rigging.rig_components.ik import IK
 from rigging.rig_overdrivers.overdriver import Overdriver, Position_Overdriver, Rotation_Overdriver
 
-from metadata.network_core import AddonCore, AddonControls, CharacterCore, ComponentCore, ControlJoints, JointsCore, RigCore, RigComponent, OverDrivenControl, SkeletonJoints
+from metadata.network_core import AddonCore, AddonControls, CharacterCore, ComponentCore, ControlJoints, JointsCore, RegionsCore, RigCore, RigComponent, OverDrivenControl, SkeletonJoints
 from metadata.exporter_properties import ExportDefinition
 from metadata.export_modify_properties import AnimCurveProperties
 from metadata.meta_properties import ControlProperty, HIKProperty
@@ -71,6 +71,8 @@ class HelixRigger:
         process (System.Diagnostics.Process): The process for the program calling the UI
         ui (Rigging.Rigger): The C# ui class object
         vm (Rigging.RiggerVM): The C# view model class object
+        component_lookup (dictionary): Maya scene component network node to (C# Character, C# Component)
+        scene_state (dictionary): Character network node name to the signature it had at the last UI update
     '''
     ToolVisibilityCategory = "ToolVisibilitySettings"
 
@@ -80,6 +82,7 @@ class HelixRigger:
         self.vm = self.ui.DataContext
 
         self.component_lookup = {}
+        self.scene_state = {}
         
         for rig_type_name in rigging.component_registry.Component_Registry().name_list:
             self.vm.AddRigType(rig_type_name)
@@ -167,6 +170,8 @@ class HelixRigger:
 
         self.get_prop_files()
         self.vm.UpdateRiggerUI()
+        # Scene state must be cleared before the UI updates on scene open so the update is a full refresh
+        scene_tools.scene_manager.SceneManager().update_method_list.append(self.rigger_reset_scene_state)
         scene_tools.scene_manager.SceneManager().update_method_list.append(self.vm.UpdateRiggerUI)
         scene_tools.scene_manager.SceneManager().method_list.append(self.vm.UpdateRiggerInPlace)
 
@@ -241,6 +246,7 @@ class HelixRigger:
 
         self.vm.CloseWindowEventHandler -= self.close
 
+        scene_tools.scene_manager.SceneManager().remove_method(self.rigger_reset_scene_state)
         scene_tools.scene_manager.SceneManager().remove_method(self.vm.UpdateRiggerUI)
         scene_tools.scene_manager.SceneManager().remove_method(self.vm.UpdateRiggerInPlace)
 
@@ -911,20 +917,26 @@ class HelixRigger:
         '''
         update_from_scene(self, vm, event_args)
         Update the UI by quering for all character network nodes in the scene and creating character objects for the UI
-        based on the information for each one
+        based on the information for each one.  If the UI has been updated before only characters whose scene
+        signature has changed since the last update are refreshed, a full refresh happens when scene_state is empty
 
         Args:
             vm (Rigging.RiggerVM): C# view model object sending the command
             event_args (None): None
         '''
-        v1_core.v1_logging.get_logger().info("-------------     Helix Rigger UI Updating     -------------")
+        update_start = time.perf_counter()
+        full_update = not self.scene_state
+        update_type = "Full" if full_update else "Incremental"
+        v1_core.v1_logging.get_logger().info("-------------     Helix Rigger UI Updating ({0})     -------------".format(update_type))
 
         self.delete_orphaned_characters()
-        self.clean_component_lookup()
+        for c_character in self.clean_component_lookup():
+            self.scene_state.pop(c_character.NodeName, None)
         update_character_list = []
         remove_character_list = [x for x in self.vm.CharacterList if not pm.objExists(x.NodeName)]
 
         for c_character in remove_character_list:
+            self.scene_state.pop(c_character.NodeName, None)
             self.vm.UnloadCharacter(c_character, False)
 
         if self.vm.UiManualUpdate:
@@ -932,8 +944,11 @@ class HelixRigger:
         else:
             update_character_list = [metadata.meta_network_utils.create_from_node(x) for x in metadata.meta_network_utils.get_all_network_nodes(CharacterCore)]
 
+        updated_character_list = []
         for character_network in update_character_list:
-            self.update_or_load_character(character_network)
+            c_character = self.update_or_load_character(character_network)
+            if c_character:
+                updated_character_list.append(c_character)
 
         self.vm.SetDefaultActiveCharacter()
 
@@ -946,9 +961,70 @@ class HelixRigger:
                 #anim_curves = HelixExporter.create_anim_curves(curve_network.node, metadata.meta_property_utils.attribute_changed, self.set_frame, self.get_frame)
                 #definition.ExportProperties.Add(anim_curves)
         
-        self.update_component_lookup()
-        freeform_utils.materials.apply_color_set()
-        maya_utils.scene_utils.clean_scene()
+        if full_update:
+            self.update_component_lookup()
+        else:
+            for c_character in updated_character_list:
+                self.update_character_component_lookup(c_character)
+
+        if full_update or updated_character_list or remove_character_list:
+            freeform_utils.materials.apply_color_set()
+        if full_update:
+            maya_utils.scene_utils.clean_scene()
+
+        v1_core.v1_logging.get_logger().info("Helix Rigger UI {0} Update - {1} of {2} Characters updated in {3} Seconds".format(update_type, 
+                                             len(updated_character_list), len(update_character_list), time.perf_counter() - update_start))
+
+    def rigger_reset_scene_state(self):
+        '''
+        Clear the stored scene state so the next UI update does a full refresh
+        '''
+        self.scene_state = {}
+
+    def get_character_signature(self, character_network):
+        '''
+        Builds a lightweight signature of the scene data that the UI displays for a character from the metadata graph.
+        Component, addon, and property network nodes are compared by name, joints by their full DAG path so re-parenting
+        is caught, region markup by its side, region, and tag values, prop attachments by their attached file, and the
+        rig settings file by its path and modified time, so any rig, markup, property, or settings change produces a 
+        different signature
+
+        Args:
+            character_network (CharacterCore): Network MetaNode object for a character
+
+        Returns:
+            (tuple). Hashable signature of the character's scene state
+        '''
+        joints_core = character_network.get_downstream(JointsCore)
+        joint_list = joints_core.get_connections() if joints_core else []
+        property_node_list = pm.listConnections(joint_list, type='network') if joint_list else []
+
+        prop_list = []
+        for joint in joint_list:
+            prop_attachment_network = metadata.meta_property_utils.get_property(joint, metadata.joint_properties.PropAttachProperty)
+            if prop_attachment_network:
+                prop_list.append((prop_attachment_network.node.longName(), prop_attachment_network.get('attached_file')))
+
+        regions_core = character_network.get_downstream(RegionsCore)
+        region_markup_list = regions_core.get_connections() if regions_core else []
+        region_list = [(x.longName(), x.side.get(), x.region.get(), x.tag.get()) for x in region_markup_list]
+
+        component_name_list = [x.node.longName() for x in character_network.get_all_downstream(ComponentCore)]
+        addon_name_list = [x.node.longName() for x in character_network.get_all_downstream(AddonCore)]
+
+        directory_path = rigging.rig_base.Component_Base.get_character_root_directory(character_network.group)
+        settings_file_path = rigging.file_ops.get_first_settings_file(directory_path, "rig") if directory_path else ""
+        settings_mtime = os.path.getmtime(settings_file_path) if settings_file_path and os.path.exists(settings_file_path) else None
+
+        return (character_network.node.character_name.get(), 
+                character_network.get('version'),
+                tuple(sorted(component_name_list)), 
+                tuple(sorted(addon_name_list)), 
+                tuple(sorted(x.longName() for x in joint_list)), 
+                tuple(sorted(set(x.longName() for x in property_node_list))), 
+                tuple(sorted(prop_list)), 
+                tuple(sorted(region_list)),
+                (directory_path, settings_file_path, settings_mtime))
 
 
     def rigger_update_component_lookup(self):
@@ -967,12 +1043,31 @@ class HelixRigger:
                 if pm.objExists(c_component.NodeName):
                     self.component_lookup[pm.PyNode(c_component.NodeName)] = (c_character, c_component)
 
+    def update_character_component_lookup(self, c_character):
+        '''
+        Replaces the component_lookup entries for a single C# Character with its current ComponentList
+
+        Args:
+            c_character (Rigging.Character): C# character object
+        '''
+        remove_node_list = [x for x,y in self.component_lookup.items() if y[0] == c_character]
+        for node in remove_node_list:
+            del(self.component_lookup[node])
+
+        for c_component in c_character.ComponentList:
+            if pm.objExists(c_component.NodeName):
+                self.component_lookup[pm.PyNode(c_component.NodeName)] = (c_character, c_component)
+
     def clean_component_lookup(self):
         '''
         When scene nodes are deleted it breaks Python dictionaries that reference them.  The PyNode keys
         still exist in the dictionary, but can't be accessed.  So we create a new clean dictionary
         and remove the UI elements for any missing scene nodes.
+
+        Returns:
+            (list<Rigging.Character>). List of all C# Characters that had components removed
         '''
+        changed_character_list = []
         component_lookup_copy = self.component_lookup.copy()
         self.component_lookup = {}
         for node, (c_character, c_component) in component_lookup_copy.items():
@@ -980,6 +1075,10 @@ class HelixRigger:
                 self.component_lookup[node] = (c_character, c_component)
             else:
                 c_character.RemoveComponent(c_component)
+                if c_character not in changed_character_list:
+                    changed_character_list.append(c_character)
+
+        return changed_character_list
 
 
     def rigger_get_active_character(self):
@@ -1012,17 +1111,30 @@ class HelixRigger:
 
     def update_or_load_character(self, character_network):
         '''
-        Determine whether the character_network needs to be updated or a new Character added
+        Determine whether the character_network needs to be updated or a new Character added.  Existing characters
+        whose signature matches the last update are skipped
 
         Args:
             character_network (CharacterCore): Network MetaNode object for a character
+
+        Returns:
+            (Rigging.Character). The C# Character that was updated or loaded, None if the character was unchanged
         '''
         c_character = self.get_c_character(character_network)
+        node_name = character_network.node.longName()
+        signature = self.get_character_signature(character_network)
 
         if c_character:
+            if self.scene_state.get(node_name) == signature:
+                return None
             self.update_character(c_character, character_network)
         else:
-            self.load_character(character_network)
+            c_character = self.load_character(character_network)
+
+        # Updating can clean up orphaned markup, so store the signature of the updated scene
+        self.scene_state[node_name] = self.get_character_signature(character_network)
+
+        return c_character
         
 
     def update_character(self, c_character, character_network):
@@ -2502,9 +2614,8 @@ class HelixRigger:
         sel_list = pm.ls(selection=True)
         control_list = [x for x in sel_list if metadata.meta_property_utils.get_properties([x], ControlProperty)]
         other_list = [x for x in sel_list if x not in control_list]
-        for control in control_list:
-            maya_utils.node_utils.zero_node(control, ['constraint', 'animCurve', 'animLayer', 'animBlendNodeAdditiveDL', 
-                                                      'animBlendNodeAdditiveRotation', 'pairBlend'])
+        maya_utils.node_utils.zero_nodes(control_list, ['constraint', 'animCurve', 'animLayer', 'animBlendNodeAdditiveDL', 
+                                                        'animBlendNodeAdditiveRotation', 'pairBlend'])
 
         rigging.skeleton.zero_skeleton_joints(other_list)
 
@@ -2834,7 +2945,7 @@ class HelixRigger:
         freeform_utils.character_utils.remove_existing_rigging(component_type._hasattachment, region_chain)
         skeleton_dict = rigging.skeleton.get_skeleton_dict(root_joint)
         character_network = metadata.meta_network_utils.create_from_node(pm.PyNode(c_character.NodeName))
-        control_holder_list, imported_nodes = rigging.rig_base.Component_Base.import_control_shapes(character_network.group)
+        control_holder_list = rigging.rig_base.Component_Base.import_control_shapes(character_network.group)
 
         component = component_type()
         
@@ -2847,9 +2958,6 @@ class HelixRigger:
             c_character.AddComponent(new_c_component)
             self.component_lookup[component_node] = (c_character, new_c_component)
 
-
-        pm.delete([x for x in imported_nodes if x.exists()])
-
         if not character_category.remove_existing:
             component.open_rig_switcher()
 
@@ -103,6 +103,8 @@ class RegionEditor(object):
             vm (RegionEditor.RegionEditorVM): C# view model object sending the command
             event_args (None): Unused, but must exist to register on a C# event
         '''
+        # Region markup values may have been edited in place, which the rigger's incremental update can't detect
+        scene_tools.scene_manager.SceneManager().run_by_string('rigger_reset_scene_state')
         scene_tools.scene_manager.SceneManager().run_by_string('UpdateRiggerInPlace')
 
         self.vm.PickEventHandler -= self.pick_from_scene
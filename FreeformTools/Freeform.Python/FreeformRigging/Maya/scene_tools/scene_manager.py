@@ -19,6 +19,9 @@ If not, see <https://www.gnu.org/licenses/>.
 
 import pymel.core as pm
 
+import time
+from contextlib import contextmanager
+
 import v1_core
 import v1_shared
 
@@ -31,6 +34,164 @@ class InvalidPyMelError(Exception):
         message = "An Invalid Pymel object was selected.  Scene Manager will not update until only valid objects are selected."
         super().__init__(message)
 
+class SelectionDispatcher(object):
+    '''
+    Coalesces bursts of SelectionChanged events into a single delivery.  Each event only flags the dispatcher
+    as pending and queues one lowest priority evalDeferred, so a box select or scrub that fires many events
+    results in one pm.ls() call and one call to each subscriber once Maya goes idle.  The selection list is
+    shared between all subscribers, so subscribers should treat it as read-only.
+
+    Attribute:
+        subscriber_list (list<method>): List of all methods to run when the selection changes
+        pending (boolean): Whether or not a deferred dispatch is queued
+        enabled (boolean): Whether or not dispatches run, a deferred dispatch queued before disabling is dropped
+        suspend_count (int): Number of active suspends, dispatch only runs while this is 0
+        suspended_event (boolean): Whether or not a selection event was received while suspended
+        event_count (int): Number of SelectionChanged events received
+        dispatch_count (int): Number of times the subscribers have been run
+        stats (dictionary): Per subscriber timing, {subscriber name : {'calls' : int, 'total' : float, 'max' : float}}
+    '''
+
+    def __init__(self, subscriber_list):
+        self.subscriber_list = subscriber_list
+        self.pending = False
+        self.enabled = True
+        self.suspend_count = 0
+        self.suspended_event = False
+        self.event_count = 0
+        self.dispatch_count = 0
+        self.stats = {}
+
+    def queue(self):
+        '''
+        Register a selection event and queue a single deferred dispatch if one isn't already waiting
+        '''
+        self.event_count += 1
+        if self.suspend_count > 0:
+            self.suspended_event = True
+            return
+
+        if not self.pending:
+            self.pending = True
+            pm.evalDeferred(self.flush, lowestPriority=True)
+
+    def flush(self):
+        '''
+        Run all subscribers with the current selection, if a dispatch is pending
+        '''
+        if not self.pending or not self.enabled:
+            return
+        self.pending = False
+
+        if self.suspend_count > 0:
+            self.suspended_event = True
+            return
+
+        self.dispatch()
+
+    def dispatch(self):
+        '''
+        Query the selection once and pass it to every subscriber, recording how long each subscriber takes
+        '''
+        try:
+            selection_list = pm.ls(selection=True)
+        except Exception as e:
+            raise InvalidPyMelError
+
+        self.dispatch_count += 1
+        # Copy the list so subscribers can un-register themselves while running
+        for method in list(self.subscriber_list):
+            start_time = time.perf_counter()
+            try:
+                method(selection_list)
+            finally:
+                self.record_time(method, time.perf_counter() - start_time)
+
+    def record_time(self, method, run_time):
+        '''
+        Add a single run of a subscriber to the timing stats
+
+        Args:
+            method (method): The subscriber that was run
+            run_time (float): Time in seconds the subscriber took to run
+        '''
+        method_name = method.__name__ if hasattr(method, '__name__') else str(method)
+        method_stats = self.stats.setdefault(method_name, {'calls' : 0, 'total' : 0.0, 'max' : 0.0})
+        method_stats['calls'] += 1
+        method_stats['total'] += run_time
+        method_stats['max'] = max(method_stats['max'], run_time)
+
+    def reset_stats(self):
+        '''
+        Clear all event counts and timing stats
+        '''
+        self.event_count = 0
+        self.dispatch_count = 0
+        self.stats = {}
+
+    def log_stats(self):
+        '''
+        Write event counts and per subscriber timing to the log
+        '''
+        logger = v1_core.v1_logging.get_logger()
+        logger.info("SelectionDispatcher - {0} events coalesced into {1} dispatches".format(self.event_count, self.dispatch_count))
+        for method_name, method_stats in sorted(self.stats.items(), key=lambda x: x[1]['total'], reverse=True):
+            average = method_stats['total'] / method_stats['calls'] if method_stats['calls'] else 0.0
+            logger.info("SelectionDispatcher - {0} : {1} calls, {2:.4f}s total, {3:.4f}s average, {4:.4f}s max".format(method_name, 
+                        method_stats['calls'], method_stats['total'], average, method_stats['max']))
+
+    def enable(self):
+        '''
+        Allow selection events to dispatch again
+        '''
+        self.enabled = True
+
+    def disable(self):
+        '''
+        Stop dispatching selection events and drop any that are pending or were received while suspended
+        '''
+        self.enabled = False
+        self.pending = False
+        self.suspended_event = False
+
+    def suspend(self):
+        '''
+        Stop dispatching selection events until resume() is called.  Suspends stack, so nested calls are safe
+        '''
+        self.suspend_count += 1
+
+    def resume(self, dispatch=True):
+        '''
+        Release a suspend.  When the last suspend is released and the selection changed while suspended, 
+        a single dispatch is queued
+
+        Args:
+            dispatch (boolean): Whether or not to queue a dispatch for selection events received while suspended
+        '''
+        self.suspend_count = max(self.suspend_count - 1, 0)
+        if self.suspend_count == 0:
+            suspended_event = self.suspended_event
+            self.suspended_event = False
+            if dispatch and suspended_event:
+                # queue() counts events, don't count the replayed one twice
+                self.event_count -= 1
+                self.queue()
+
+    @contextmanager
+    def suspended(self, dispatch=True):
+        '''
+        Context manager to suspend selection dispatch for the duration of a scripted batch operation
+
+        Args:
+            dispatch (boolean): Whether or not to dispatch once on exit if the selection changed
+        '''
+        self.suspend()
+        try:
+            yield self
+        finally:
+            self.resume(dispatch)
+
+
 class SceneManager(object, metaclass=Singleton):
     '''
     Manages all tools and scene updating whenever a new Maya scene is opened.  Tools register their update method
@@ -44,6 +205,7 @@ class SceneManager(object, metaclass=Singleton):
         selection_changed_enabled (int): Whether or not to run selection changed methods
         selection_changed_id (int): ID # of the scriptJob that is running on selection
         selection_changed_list (list<method>): List of all methods to run when the selection changes
+        selection_dispatcher (SelectionDispatcher): Coalesces selection events and runs selection_changed_list
     '''
     
     method_list = []
@@ -59,6 +221,7 @@ class SceneManager(object, metaclass=Singleton):
     selection_changed_enabled = True
     selection_changed_id = -1
     selection_changed_list = []
+    selection_dispatcher = SelectionDispatcher(selection_changed_list)
 
 
     def __init__(self):
@@ -97,12 +260,14 @@ class SceneManager(object, metaclass=Singleton):
         Used to enable SelectionChanged scriptJob
         '''
         SceneManager.selection_changed_enabled = True
+        SceneManager.selection_dispatcher.enable()
 
     def disable_selection_changed_job(self):
         '''
-        Used to disable SelectionChanged scriptJob
+        Used to disable SelectionChanged scriptJob, selection events already queued are dropped
         '''
         SceneManager.selection_changed_enabled = False
+        SceneManager.selection_dispatcher.disable()
 
 
     def scene_update(self):
@@ -115,16 +280,23 @@ class SceneManager(object, metaclass=Singleton):
 
     def selection_changed(self):
         '''
-        Run all methods stored in the selection_changed_list of SceneManager, passing the current selection
+        Queue a run of all methods stored in the selection_changed_list of SceneManager.  Events are coalesced
+        by the selection_dispatcher so a burst of selection changes only runs each method once, on idle.
         '''
         if SceneManager.selection_changed_enabled:
-            try:
-                selection_list = pm.ls(selection=True)
-            except Exception as e:
-                raise InvalidPyMelError
-            else:
-                for method in SceneManager.selection_changed_list:
-                    method(selection_list)
+            SceneManager.selection_dispatcher.queue()
+
+    def suspend_selection_changed(self, dispatch=True):
+        '''
+        Context manager to stop selection changed methods from running during scripted batch operations
+
+        Args:
+            dispatch (boolean): Whether or not to run selection changed methods once on exit if the selection changed
+
+        Returns:
+            (contextmanager). Context manager that suspends the selection_dispatcher
+        '''
+        return SceneManager.selection_dispatcher.suspended(dispatch)
 
     def run_by_string(self, match_string, *args, **kwargs):
         '''
@@ -1,28 +1,41 @@
 import os
 import sys
-import time
 import subprocess
 
-import v1_core
+from maya_standalone import batch_runner
 
 
-def get_file_list():
-    file_list_directory = os.path.join(v1_core.global_settings.GlobalSettings.get_user_freeform_folder(), "batch")
-    # If an arg is passed in it is the relative path to the directory to look for export_file_list's in
-    if len(sys.argv) > 1:
-        config_manager = v1_core.global_settings.ConfigManager()
-        data_path = config_manager.content_root_path()
-        arg_path = sys.argv[1]
-        file_list_directory = arg_path.replace("..", data_path)
+MAYAPY_PATH = r"C:\Program Files\Autodesk\Maya2018\bin\mayapy.exe"
+CHECK_SCRIPT_PATH = os.path.join("%V1TOOLSROOT%", "V1.Python", "Maya", "batches", "cinematic_anim_check.py")
 
-    export_file_list = [os.path.join(file_list_directory, x) for x in os.listdir(file_list_directory) if "export_file_list" in x]
-    
-    return export_file_list 
+def file_filter(file_path):
+    # The batch runs on the export file lists in a directory, each list is checked in it's own mayapy
+    return "export_file_list" in os.path.basename(file_path)
+
+def file_commands(file_path):
+    # A failed check raises CalledProcessError, which fails the file in the batch report
+    subprocess.run([MAYAPY_PATH, os.path.expandvars(CHECK_SCRIPT_PATH), file_path], check=True)
+
+
+# Run from commandline with the directory to look for export_file_list's in, and --workers to check lists in parallel
+# Re-run with the same --batch-dir to resume a batch that stopped part way
+BATCH_JOB = batch_runner.BatchJob("cinematic_check_files", file_commands, file_filter = file_filter)
+
+def get_argv():
+    import v1_core
+
+    argv = sys.argv[1:]
+    # With no args check the lists in the user batch folder, a relative directory is relative to the content root
+    if not argv:
+        argv = [os.path.join(v1_core.global_settings.GlobalSettings.get_user_freeform_folder(), "batch")]
+    elif ".." in argv[0] and not argv[0].startswith("-"):
+        data_path = v1_core.global_settings.ConfigManager().content_root_path()
+        argv[0] = argv[0].replace("..", data_path)
+
+    return argv
 
 def main():
-    for file in get_file_list():
-        maya_py_cmd = "start C:\\\"Program Files\"\\Autodesk\\Maya2018\\bin\\mayapy.exe %V1TOOLSROOT%\\V1.Python\\Maya\\batches\\cinematic_anim_check.py {0}".format(file)
-        os.system(maya_py_cmd)
-    
+    batch_runner.main(BATCH_JOB, get_argv())
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,560 @@
+'''
+Freeform Rigging and Animation Tools
+Copyright (C) 2020  Micah Zahm
+
+Freeform Rigging and Animation Tools is free software: you can redistribute it
+and/or modify it under the terms of the GNU General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Freeform Rigging and Animation Tools is distributed in the hope that it will
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Freeform Rigging and Animation Tools.
+If not, see <https://www.gnu.org/licenses/>.
+'''
+
+# Pure Python, this module must not import Maya so batches can be planned, resumed and tested outside of Maya
+
+import argparse
+import csv
+import json
+import os
+import subprocess
+import sys
+import time
+import traceback
+
+
+# Number of times a file can crash a worker before it's quarantined and no longer run
+QUARANTINE_CRASH_COUNT = 2
+# Environment variable v1_core.v1_logging appends to the log file name, matches global_settings.EnvironmentKey.LOGSUFFIX
+LOG_SUFFIX_KEY = "FREEFORM_LOG_SUFFIX"
+
+class BatchJob(object):
+    '''
+    Declares a batch, which files it runs on and what it does to each file.  Jobs are run with run_batch(),
+    or from a batch script with main() so the same script can act as the controller and as each worker
+
+    Args:
+        name (str): Name of the batch, used for the default batch folder and report names
+        file_function (method): Runs on each file, takes the file path and returns a json serializable result or None.
+            Any exception fails the file and is recorded in the report
+        extension_list (list<str>): File extensions to gather when walking a directory, ie. ['.ma']
+        file_filter (method): If given, takes a file path and returns whether the file should be run
+        initialize (method): Runs once in each worker before any files, ie. to start maya.standalone
+        uninitialize (method): Runs once in each worker after all files
+    '''
+    def __init__(self, name, file_function, extension_list = None, file_filter = None, initialize = None, uninitialize = None):
+        self.name = name
+        self.file_function = file_function
+        self.extension_list = [x.lower() for x in extension_list] if extension_list else None
+        self.file_filter = file_filter
+        self.initialize = initialize
+        self.uninitialize = uninitialize
+
+    def __repr__(self):
+        return "BatchJob({0})".format(self.name)
+
+    def filter_file(self, file_path):
+        '''
+        Check whether the job should run on a file
+
+        Args:
+            file_path (str): Full path to the file
+
+        Returns:
+            boolean. True if the file matches the job extensions and filter
+        '''
+        if self.extension_list and os.path.splitext(file_path)[-1].lower() not in self.extension_list:
+            return False
+        return self.file_filter(file_path) if self.file_filter else True
+
+
+def walk_files(root_dir, cache_path = None):
+    '''
+    Find every file under a directory.  If a cache path is given, the listing of every folder is saved with the
+    folder's modified time and only folders that changed since the last walk are listed again
+
+    Args:
+        root_dir (str): Directory to walk
+        cache_path (str): Full path to the json walk cache file
+
+    Returns:
+        list<str>. Full path to every file, in a stable sorted order
+    '''
+    cache_dict = {}
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'r') as cache_file:
+                cache_dict = json.load(cache_file)
+        except ValueError:
+            cache_dict = {}
+
+    new_cache_dict = {}
+    return_file_list = []
+    dir_list = [os.path.normpath(root_dir)]
+    while dir_list:
+        dir_path = dir_list.pop()
+        try:
+            modified_time = os.stat(dir_path).st_mtime
+        except OSError:
+            continue
+
+        cache_entry = cache_dict.get(dir_path)
+        if cache_entry and cache_entry['mtime'] == modified_time:
+            file_name_list, sub_dir_list = cache_entry['files'], cache_entry['dirs']
+        else:
+            file_name_list, sub_dir_list = [], []
+            with os.scandir(dir_path) as entry_list:
+                for entry in entry_list:
+                    if entry.is_dir():
+                        sub_dir_list.append(entry.name)
+                    else:
+                        file_name_list.append(entry.name)
+
+        new_cache_dict[dir_path] = {'mtime': modified_time, 'files': file_name_list, 'dirs': sub_dir_list}
+        return_file_list.extend([os.path.join(dir_path, x) for x in file_name_list])
+        dir_list.extend([os.path.join(dir_path, x) for x in sub_dir_list])
+
+    if cache_path:
+        with open(cache_path, 'w') as cache_file:
+            json.dump(new_cache_dict, cache_file)
+
+    return sorted(return_file_list)
+
+def get_file_list(job, file_arg, cache_path = None):
+    '''
+    Gather the files a job should run on.  Matches the argument handling of the old batch scripts, a file is read
+    as a list of file paths and a directory is walked
+
+    Args:
+        job (BatchJob): The job to gather files for
+        file_arg (str): Path to a text file listing a file path per line, or a directory to walk
+        cache_path (str): Full path to the json walk cache file, see walk_files()
+
+    Returns:
+        list<str>. Full path to every file the job should run on
+    '''
+    if not file_arg or not os.path.exists(file_arg):
+        return []
+
+    if os.path.isfile(file_arg):
+        with open(file_arg, 'r') as list_file:
+            file_list = [x.strip() for x in list_file.readlines() if x.strip()]
+    else:
+        file_list = walk_files(file_arg, cache_path)
+
+    return [x for x in file_list if job.filter_file(x)]
+
+def get_shard(file_list, worker_index, worker_count):
+    '''
+    Split a file list between workers, each worker takes every worker_count'th file so long runs of heavy files
+    in one folder are spread across all workers
+
+    Args:
+        file_list (list<str>): Every file in the batch
+        worker_index (int): Index of the worker
+        worker_count (int): Number of workers
+
+    Returns:
+        list<str>. Files for the worker
+    '''
+    return file_list[worker_index::max(worker_count, 1)]
+
+def get_peak_memory():
+    '''
+    Get the peak memory use of this process
+
+    Returns:
+        int. Peak resident memory in bytes, or None if it can't be read on this platform
+    '''
+    if sys.platform == 'win32':
+        import ctypes
+        import ctypes.wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [('cb', ctypes.wintypes.DWORD), ('PageFaultCount', ctypes.wintypes.DWORD),
+                        ('PeakWorkingSetSize', ctypes.c_size_t), ('WorkingSetSize', ctypes.c_size_t),
+                        ('QuotaPeakPagedPoolUsage', ctypes.c_size_t), ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                        ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t), ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                        ('PagefileUsage', ctypes.c_size_t), ('PeakPagefileUsage', ctypes.c_size_t)]
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        process_handle = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(process_handle, ctypes.byref(counters), counters.cb):
+            return counters.PeakWorkingSetSize
+        return None
+
+    try:
+        import resource
+    except ImportError:
+        return None
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak_memory if sys.platform == 'darwin' else peak_memory * 1024
+
+
+class BatchJournal(object):
+    '''
+    Append-only journal of a worker's progress through a batch.  A 'start' entry is written before each file runs
+    and a 'finish' entry after, each flushed and fsync'd to disk before moving on, so the journal survives the
+    worker crashing outright.  A file with more starts than finishes crashed the worker that ran it
+
+    Args:
+        batch_dir (str): Folder the batch writes its journals to
+        worker_index (int): Index of the worker writing the journal
+    '''
+    @staticmethod
+    def get_journal_path(batch_dir, worker_index):
+        return os.path.join(batch_dir, "journal_{0}.jsonl".format(worker_index))
+
+    @staticmethod
+    def read(batch_dir):
+        '''
+        Read every journal written by any worker in a batch folder
+
+        Args:
+            batch_dir (str): Folder the batch writes its journals to
+
+        Returns:
+            (dictionary, dictionary). Finish entry for each file path that finished, if a file finished more than once
+                the last one written wins.  Number of times each unfinished file crashed a worker
+        '''
+        result_dict = {}
+        start_count_dict = {}
+        if not os.path.exists(batch_dir):
+            return result_dict, {}
+
+        for file_name in sorted(os.listdir(batch_dir)):
+            if not (file_name.startswith("journal_") and file_name.endswith(".jsonl")):
+                continue
+            with open(os.path.join(batch_dir, file_name), 'r') as journal_file:
+                for line in journal_file:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A worker that died mid-write can leave a partial last line
+                        continue
+                    if entry['event'] == 'start':
+                        start_count_dict[entry['file']] = start_count_dict.get(entry['file'], 0) + 1
+                    elif entry['event'] == 'finish':
+                        result_dict[entry['file']] = entry
+
+        # Every start that wasn't matched by a finish is a crash.  Once a file finishes it's done, so earlier crashes don't count
+        crash_dict = {}
+        for file_path, start_count in start_count_dict.items():
+            if file_path not in result_dict:
+                crash_dict[file_path] = start_count
+
+        return result_dict, crash_dict
+
+
+    def __init__(self, batch_dir, worker_index = 0):
+        self.path = BatchJournal.get_journal_path(batch_dir, worker_index)
+        self.worker_index = worker_index
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.path, 'a')
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self._file.close()
+        self._file = None
+
+    def _write(self, entry):
+        self._file.write(json.dumps(entry, default=str) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def start(self, file_path):
+        '''
+        Record that a file is about to run
+
+        Args:
+            file_path (str): Full path to the file
+        '''
+        self._write({'event': 'start', 'file': file_path, 'worker': self.worker_index, 'time': time.time()})
+
+    def finish(self, result_entry):
+        '''
+        Record that a file finished running
+
+        Args:
+            result_entry (dictionary): Result entry from run_file()
+        '''
+        entry = dict(result_entry)
+        entry.update({'event': 'finish', 'worker': self.worker_index, 'time': time.time()})
+        self._write(entry)
+
+
+def read_results(batch_dir):
+    '''
+    Read every result written by any worker in a batch folder
+
+    Args:
+        batch_dir (str): Folder the batch writes its journals to
+
+    Returns:
+        dictionary. Result entry for each file path that finished
+    '''
+    return BatchJournal.read(batch_dir)[0]
+
+def get_quarantine_list(crash_dict):
+    '''
+    Find the files that have crashed workers too many times to try again
+
+    Args:
+        crash_dict (dictionary): Number of times each unfinished file crashed a worker, from BatchJournal.read()
+
+    Returns:
+        list<str>. Full path to each quarantined file
+    '''
+    return [x for x, crash_count in crash_dict.items() if crash_count >= QUARANTINE_CRASH_COUNT]
+
+def get_remaining_files(file_list, batch_dir, worker_index = 0, worker_count = 1):
+    '''
+    Find the files in a worker's share of the batch that still need to run, skipping finished and quarantined files
+
+    Args:
+        file_list (list<str>): Every file in the batch
+        batch_dir (str): Folder the batch writes its journals to
+        worker_index (int): Index of the worker
+        worker_count (int): Number of workers
+
+    Returns:
+        list<str>. Files the worker still needs to run
+    '''
+    result_dict, crash_dict = BatchJournal.read(batch_dir)
+    skip_set = set(result_dict.keys()).union(get_quarantine_list(crash_dict))
+    return [x for x in get_shard(file_list, worker_index, worker_count) if x not in skip_set]
+
+def get_worker_state(file_list, batch_dir, worker_index = 0, worker_count = 1):
+    '''
+    Summarize a worker's progress through its share of the batch, used to tell whether a crashed worker got anywhere
+
+    Args:
+        file_list (list<str>): Every file in the batch
+        batch_dir (str): Folder the batch writes its journals to
+        worker_index (int): Index of the worker
+        worker_count (int): Number of workers
+
+    Returns:
+        (int, int). Number of files remaining and number of crashes journaled for the worker's share
+    '''
+    result_dict, crash_dict = BatchJournal.read(batch_dir)
+    shard_list = get_shard(file_list, worker_index, worker_count)
+    quarantine_set = set(get_quarantine_list(crash_dict))
+    remaining_count = len([x for x in shard_list if x not in result_dict and x not in quarantine_set])
+    return (remaining_count, sum([crash_dict.get(x, 0) for x in shard_list]))
+
+def run_file(job, file_path):
+    '''
+    Run a job on a single file, catching any error
+
+    Args:
+        job (BatchJob): The job to run
+        file_path (str): Full path to the file
+
+    Returns:
+        dictionary. Result entry with the 'file', 'status', 'duration', 'peak_memory', 'result' and 'error'
+    '''
+    start_time = time.perf_counter()
+    result_entry = {'file': file_path, 'status': 'success', 'duration': 0.0, 'peak_memory': None, 'result': None, 'error': None}
+    try:
+        result_entry['result'] = job.file_function(file_path)
+    except Exception:
+        result_entry['status'] = 'failed'
+        result_entry['error'] = traceback.format_exc()
+    result_entry['duration'] = time.perf_counter() - start_time
+    result_entry['peak_memory'] = get_peak_memory()
+
+    return result_entry
+
+def run_shard(job, file_list, batch_dir, worker_index = 0, worker_count = 1):
+    '''
+    Run a job on a worker's share of the batch.  Progress is written to the worker's BatchJournal before and after
+    each file, so a batch that stops part way, even from a hard crash, can be resumed.  Files that already finished
+    on any worker are skipped, as are files that have crashed a worker QUARANTINE_CRASH_COUNT times
+
+    Args:
+        job (BatchJob): The job to run
+        file_list (list<str>): Every file in the batch
+        batch_dir (str): Folder the batch writes its journals to
+        worker_index (int): Index of this worker
+        worker_count (int): Number of workers
+
+    Returns:
+        list<dictionary>. Result entry for each file this worker ran
+    '''
+    if not os.path.exists(batch_dir):
+        os.makedirs(batch_dir)
+
+    shard_list = get_remaining_files(file_list, batch_dir, worker_index, worker_count)
+
+    result_list = []
+    if job.initialize:
+        job.initialize()
+    try:
+        with BatchJournal(batch_dir, worker_index) as journal:
+            for file_path in shard_list:
+                journal.start(file_path)
+                result_entry = run_file(job, file_path)
+                result_entry['worker'] = worker_index
+                journal.finish(result_entry)
+                result_list.append(result_entry)
+
+                print("{0} - {1} in {2} Seconds".format(result_entry['status'], file_path, result_entry['duration']))
+    finally:
+        if job.uninitialize:
+            job.uninitialize()
+
+    return result_list
+
+def write_report(job, file_list, batch_dir):
+    '''
+    Consolidate every worker's results into a json and csv report.  Files without a result are reported as
+    'not_run'
+
+    Args:
+        job (BatchJob): The job that ran
+        file_list (list<str>): Every file in the batch
+        batch_dir (str): Folder the batch wrote its results to
+
+    Returns:
+        dictionary. The report, with a 'summary' count for each status and a 'files' list of result entries
+    '''
+    result_dict, crash_dict = BatchJournal.read(batch_dir)
+    quarantine_list = get_quarantine_list(crash_dict)
+
+    report_list = []
+    summary_dict = {}
+    for file_path in file_list:
+        status = 'quarantined' if file_path in quarantine_list else 'not_run'
+        error = "Crashed the worker {0} times".format(crash_dict[file_path]) if file_path in crash_dict else None
+        result_entry = result_dict.get(file_path, {'file': file_path, 'status': status, 'duration': 0.0, 'peak_memory': None,
+                                                   'result': None, 'error': error})
+        report_list.append(result_entry)
+        summary_dict[result_entry['status']] = summary_dict.get(result_entry['status'], 0) + 1
+    summary_dict['duration'] = sum([x['duration'] for x in report_list])
+
+    report_dict = {'job': job.name, 'summary': summary_dict, 'files': report_list}
+    with open(os.path.join(batch_dir, "{0}_report.json".format(job.name)), 'w') as report_file:
+        json.dump(report_dict, report_file, indent=4, default=str)
+
+    with open(os.path.join(batch_dir, "{0}_report.csv".format(job.name)), 'w', newline='') as report_file:
+        writer = csv.writer(report_file)
+        writer.writerow(['file', 'status', 'duration', 'peak_memory', 'worker', 'error'])
+        for result_entry in report_list:
+            error_line = result_entry['error'].strip().splitlines()[-1] if result_entry['error'] else ''
+            writer.writerow([result_entry['file'], result_entry['status'], round(result_entry['duration'], 3),
+                             result_entry.get('peak_memory') or '', result_entry.get('worker', ''), error_line])
+
+    return report_dict
+
+def run_batch(job, file_arg, batch_dir = None, worker_count = 1, interpreter = None, script_path = None):
+    '''
+    Run a job across every file it matches and write the consolidated report.  With one worker the job runs in
+    this process, with more each worker is a separate interpreter running script_path, which must call main() with
+    the same job.  Workers that crash are restarted.  Re-running a batch with the same batch_dir resumes it, skipping
+    every file that finished and every quarantined file
+
+    Args:
+        job (BatchJob): The job to run
+        file_arg (str): Path to a text file listing a file path per line, or a directory to walk
+        batch_dir (str): Folder to write journals and the report to, defaults to a folder named for file_arg and the job
+            next to file_arg
+        worker_count (int): Number of workers to split the batch across
+        interpreter (str): Full path to the python interpreter for workers, ie. mayapy.exe.  Defaults to this interpreter
+        script_path (str): Full path to the batch script workers run.  Defaults to the script that was run
+
+    Returns:
+        dictionary. The report, see write_report()
+    '''
+    batch_start = time.perf_counter()
+    if batch_dir is None:
+        file_arg = os.path.normpath(file_arg)
+        batch_name = os.path.splitext(os.path.basename(file_arg))[0]
+        batch_dir = os.path.join(os.path.dirname(file_arg), "{0}_{1}_batch".format(batch_name, job.name))
+    if not os.path.exists(batch_dir):
+        os.makedirs(batch_dir)
+
+    # The file list is saved so workers and resumed runs all see the same batch without walking again
+    list_path = os.path.join(batch_dir, "file_list.json")
+    if os.path.exists(list_path):
+        with open(list_path, 'r') as list_file:
+            file_list = json.load(list_file)
+    else:
+        file_list = get_file_list(job, file_arg, os.path.join(batch_dir, "walk_cache.json"))
+        with open(list_path, 'w') as list_file:
+            json.dump(file_list, list_file, indent=4)
+
+    print("Running {0} on {1} Files with {2} Workers, {3} Already Finished".format(job.name, len(file_list), worker_count,
+                                                                                   len(read_results(batch_dir))))
+    if worker_count <= 1:
+        run_shard(job, file_list, batch_dir)
+    else:
+        interpreter = interpreter if interpreter else sys.executable
+        script_path = os.path.abspath(script_path if script_path else sys.argv[0])
+        def start_worker(worker_index):
+            # Each worker logs to it's own file instead of every worker rotating the same log
+            worker_environment = dict(os.environ)
+            worker_environment[LOG_SUFFIX_KEY] = "worker_{0}".format(worker_index)
+            process = subprocess.Popen([interpreter, script_path, '--batch-dir', batch_dir,
+                                        '--worker', str(worker_index), '--worker-count', str(worker_count)], env = worker_environment)
+            return (process, get_worker_state(file_list, batch_dir, worker_index, worker_count))
+
+        process_dict = {x: start_worker(x) for x in range(worker_count)}
+        while process_dict:
+            time.sleep(0.1)
+            for worker_index, (process, start_state) in list(process_dict.items()):
+                if process.poll() is None:
+                    continue
+                del process_dict[worker_index]
+
+                # Restart a crashed worker to pick up after the file it crashed on, as long as the crash was journaled.
+                # Crashing files are quarantined after QUARANTINE_CRASH_COUNT crashes, so restarts always run out
+                worker_state = get_worker_state(file_list, batch_dir, worker_index, worker_count)
+                if process.returncode != 0 and worker_state[0] and worker_state != start_state:
+                    print("Worker {0} Crashed, Restarting with {1} Files Remaining".format(worker_index, worker_state[0]))
+                    process_dict[worker_index] = start_worker(worker_index)
+
+    report_dict = write_report(job, file_list, batch_dir)
+    print("Finished {0} in {1} Seconds - {2}".format(job.name, time.perf_counter() - batch_start, report_dict['summary']))
+
+    return report_dict
+
+def main(job, argv = None):
+    '''
+    Command line entry point for batch scripts.  Run the script with a file list or directory to start a batch as
+    the controller, the controller re-runs the script with --worker for each worker
+
+    Args:
+        job (BatchJob): The job the script declares
+        argv (list<str>): Command line arguments, defaults to sys.argv
+    '''
+    parser = argparse.ArgumentParser(description = "Run the {0} batch".format(job.name))
+    parser.add_argument('file_arg', nargs='?', help="Text file listing a file path per line, or a directory to walk")
+    parser.add_argument('extension', nargs='?', help="File extension to gather, overrides the job extensions")
+    parser.add_argument('--batch-dir', help="Folder to write journals and the report to, re-use it to resume a batch")
+    parser.add_argument('--workers', type=int, default=1, help="Number of workers to split the batch across")
+    parser.add_argument('--interpreter', help="Python interpreter for workers, defaults to this interpreter")
+    parser.add_argument('--worker', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--worker-count', type=int, default=1, help=argparse.SUPPRESS)
+    args = parser.parse_args(sys.argv[1:] if argv is None else argv)
+    if args.worker is None and not args.file_arg:
+        parser.error("file_arg is required to start a batch")
+    if args.extension:
+        job.extension_list = [args.extension.lower()]
+
+    if args.worker is not None:
+        with open(os.path.join(args.batch_dir, "file_list.json"), 'r') as list_file:
+            file_list = json.load(list_file)
+        run_shard(job, file_list, args.batch_dir, args.worker, args.worker_count)
+    else:
+        run_batch(job, args.file_arg, args.batch_dir, args.workers, args.interpreter)
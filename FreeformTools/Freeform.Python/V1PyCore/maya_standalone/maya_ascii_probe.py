@@ -0,0 +1,264 @@
+'''
+Freeform Rigging and Animation Tools
+Copyright (C) 2020  Micah Zahm
+
+Freeform Rigging and Animation Tools is free software: you can redistribute it
+and/or modify it under the terms of the GNU General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Freeform Rigging and Animation Tools is distributed in the hope that it will
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Freeform Rigging and Animation Tools.
+If not, see <https://www.gnu.org/licenses/>.
+'''
+
+# Pure Python, this module must not import Maya so scenes can be checked before paying to open them
+
+import collections
+import shlex
+
+
+SceneReference = collections.namedtuple('SceneReference', ['path', 'namespace', 'reference_node', 'loaded'])
+SceneReference.__doc__ = '''
+A top level reference read from a Maya ASCII file
+
+Attributes:
+    path (str): File path of the reference as written in the scene
+    namespace (str): Namespace the reference is loaded into
+    reference_node (str): Name of the reference node
+    loaded (boolean): False if the reference is deferred, unloaded
+'''
+
+NetworkNode = collections.namedtuple('NetworkNode', ['name', 'meta_type'])
+NetworkNode.__doc__ = '''
+A network node read from a Maya ASCII file
+
+Attributes:
+    name (str): Name of the node
+    meta_type (str): The node's meta_type string attribute, None if it doesn't have one
+'''
+
+
+def iter_statements(file_path):
+    '''
+    Stream the top level MEL statements from a Maya ASCII file without loading the file.  A statement can span
+    many lines and only ends at a ';' outside of a string, large data statements are joined but never parsed
+
+    Args:
+        file_path (str): Full path to the .ma file
+
+    Returns:
+        generator<str>. Each statement, without the trailing ';'
+    '''
+    line_list = []
+    in_string = False
+    with open(file_path, 'r', encoding='utf-8', errors='replace') as scene_file:
+        for line in scene_file:
+            if not line_list and not in_string and line.startswith('//'):
+                continue
+
+            if '"' in line or in_string:
+                is_escaped = False
+                for character in line:
+                    if is_escaped:
+                        is_escaped = False
+                    elif character == '\\':
+                        is_escaped = in_string
+                    elif character == '"':
+                        in_string = not in_string
+
+            line_list.append(line)
+            if not in_string and line.rstrip().endswith(';'):
+                yield ''.join(line_list).strip()[:-1]
+                line_list = []
+
+def split_statement(statement):
+    '''
+    Split a MEL statement into its command, flags and arguments
+
+    Args:
+        statement (str): A single statement from iter_statements()
+
+    Returns:
+        list<str>. Every token in the statement with quotes removed
+    '''
+    try:
+        return shlex.split(statement, posix=True)
+    except ValueError:
+        return statement.split()
+
+def get_flag_value(token_list, flag, default = None):
+    '''
+    Find the value given to a MEL flag
+
+    Args:
+        token_list (list<str>): Tokens from split_statement()
+        flag (str): The flag to find, ie. '-ns'
+        default (value): Value to return if the flag isn't in the statement
+
+    Returns:
+        str. The token after the flag, or the default
+    '''
+    if flag in token_list:
+        flag_index = token_list.index(flag)
+        if flag_index + 1 < len(token_list):
+            return token_list[flag_index + 1]
+    return default
+
+def get_index(a_list, index, default = None):
+    return a_list[index] if len(a_list) > index else default
+
+def get_first(a_list, default = None):
+    return a_list[0] if a_list else default
+
+
+class SceneProbe(object):
+    '''
+    Everything batches commonly check before opening a Maya ASCII scene, read by streaming the file instead of
+    opening it in Maya.  Reads the version, requires statements, top level references, network nodes and every
+    meta_type string attribute in the scene
+
+    Args:
+        file_path (str): Full path to the .ma file
+        header_only (boolean): Stop reading at the first createNode, only the version, requires and references are read
+
+    Attributes:
+        file_path (str): Full path to the .ma file
+        version (str): Maya version that saved the file
+        requires_list (list<tuple<str, str>>): (plugin, version) of every requires statement, the first is always 'maya'
+        node_type_dict (dictionary): Plugin for each node type the file says it requires
+        reference_list (list<SceneReference>): Every top level reference
+        network_list (list<NetworkNode>): Every network node
+        meta_type_list (list<str>): Every meta_type string attribute value on any node, including properties baked to objects
+    '''
+    def __init__(self, file_path, header_only = False):
+        self.file_path = file_path
+        self.version = None
+        self.requires_list = []
+        self.node_type_dict = {}
+        self.reference_list = []
+        self.network_list = []
+        self.meta_type_list = []
+
+        with open(file_path, 'r', encoding='utf-8', errors='replace') as scene_file:
+            header = scene_file.readline().split()
+        if header[:2] != ['//Maya', 'ASCII']:
+            raise ValueError("{0} is not a Maya ASCII file".format(file_path))
+        self.version = header[2] if len(header) > 2 else None
+
+        self._read(header_only)
+
+    def __repr__(self):
+        return "SceneProbe({0})".format(self.file_path)
+
+    def _read(self, header_only):
+        node_name = None
+        node_type = None
+        node_meta_type = None
+        for statement in iter_statements(self.file_path):
+            # Only tokenize the statements we read, most of a scene is setAttr data we skip on the first word
+            command = statement.split(None, 1)[0] if statement else None
+            if command == 'createNode':
+                if header_only:
+                    break
+                if node_type == 'network':
+                    self.network_list.append(NetworkNode(node_name, node_meta_type))
+                token_list = split_statement(statement)
+                node_type = get_index(token_list, 1)
+                node_name = get_flag_value(token_list, '-n')
+                node_meta_type = None
+            elif command == 'setAttr' and node_type is not None and 'meta_type"' in statement:
+                # Properties baked onto objects save their meta_type as '<guid>x_xmeta_type'
+                token_list = split_statement(statement)
+                attr_name = get_first([x for x in token_list if x.startswith('.')])
+                if attr_name and attr_name.endswith('meta_type') and get_flag_value(token_list, '-type') == 'string':
+                    self.meta_type_list.append(token_list[-1])
+                    if attr_name == '.meta_type':
+                        node_meta_type = token_list[-1]
+            elif command == 'requires':
+                token_list = split_statement(statement)
+                node_type_list = []
+                while '-nodeType' in token_list:
+                    node_type_list.append(get_flag_value(token_list, '-nodeType'))
+                    token_list.pop(token_list.index('-nodeType') + 1)
+                    token_list.remove('-nodeType')
+                # Remaining flags like -dataType are skipped with their value, leaving the plugin and version
+                argument_list = [x for i, x in enumerate(token_list[1:]) if not x.startswith('-') and not token_list[i].startswith('-')]
+                if len(argument_list) >= 2:
+                    self.requires_list.append((argument_list[-2], argument_list[-1]))
+                    for node_type_name in node_type_list:
+                        self.node_type_dict[node_type_name] = argument_list[-2]
+            elif command == 'file':
+                token_list = split_statement(statement)
+                if '-r' in token_list:
+                    self.reference_list.append(SceneReference(token_list[-1], get_flag_value(token_list, '-ns'),
+                                                              get_flag_value(token_list, '-rfn'), get_flag_value(token_list, '-dr') != '1'))
+            elif command in ('select', 'connectAttr', 'relationship', 'fileInfo', 'currentUnit'):
+                # Everything past the node definitions, close off the last node.  fileInfo and currentUnit come before
+                # any nodes, so they leave nothing to close
+                if node_type == 'network':
+                    self.network_list.append(NetworkNode(node_name, node_meta_type))
+                node_type = None
+
+        if node_type == 'network':
+            self.network_list.append(NetworkNode(node_name, node_meta_type))
+
+    def has_meta_type(self, type_name):
+        '''
+        Check whether any node in the scene has a meta_type attribute for a metadata type.  meta_type values are
+        saved as the class string, ie. "<class 'metadata.network_core.ImportedCore'>", so a class name matches
+
+        Args:
+            type_name (str): Class name, or any part of the meta_type string
+
+        Returns:
+            boolean. True if any meta_type in the scene contains type_name
+        '''
+        return any([type_name in x for x in self.meta_type_list])
+
+    def has_reference(self, path_fragment):
+        '''
+        Check whether the scene references a file
+
+        Args:
+            path_fragment (str): File name or any part of the path, compared case insensitive with forward slashes
+
+        Returns:
+            boolean. True if any top level reference path contains path_fragment
+        '''
+        path_fragment = path_fragment.replace('\\', '/').lower()
+        return any([path_fragment in x.path.replace('\\', '/').lower() for x in self.reference_list])
+
+    def requires_plugin(self, plugin_name):
+        '''
+        Check whether the scene requires a plugin
+
+        Args:
+            plugin_name (str): Name of the plugin as written in the requires statement
+
+        Returns:
+            boolean. True if the scene requires the plugin
+        '''
+        return plugin_name in [x[0] for x in self.requires_list]
+
+
+def probe_scene(file_path, header_only = False):
+    '''
+    Read a Maya ASCII scene without Maya, returning None for files that can't be read so batch filters can skip them
+
+    Args:
+        file_path (str): Full path to the .ma file
+        header_only (boolean): Only read the version, requires and references
+
+    Returns:
+        SceneProbe. What was read from the scene, or None if the file isn't a readable Maya ASCII file
+    '''
+    try:
+        return SceneProbe(file_path, header_only)
+    except (IOError, OSError, ValueError, IndexError):
+        return None
@@ -0,0 +1,166 @@
+'''
+Freeform Rigging and Animation Tools
+Copyright (C) 2020  Micah Zahm
+
+Freeform Rigging and Animation Tools is free software: you can redistribute it
+and/or modify it under the terms of the GNU General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Freeform Rigging and Animation Tools is distributed in the hope that it will
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Freeform Rigging and Animation Tools.
+If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+import maya_standalone
+from maya_standalone import batch_runner
+
+
+WORKER_SCRIPT = '''
+import os
+import sys
+sys.path.insert(0, {0!r})
+from maya_standalone import batch_runner
+
+def file_function(file_path):
+    # Simulate Maya crashing on a corrupt file
+    if file_path.endswith("b.ma"):
+        os._exit(3)
+    return os.path.basename(file_path)
+
+if __name__ == "__main__":
+    batch_runner.main(batch_runner.BatchJob("worker_test", file_function, ['.ma']))
+'''
+
+
+class BatchRunnerTest(unittest.TestCase):
+
+	def setUp(self):
+		self.temp_dir = tempfile.mkdtemp()
+		self.content_dir = os.path.join(self.temp_dir, "content")
+		self.batch_dir = os.path.join(self.temp_dir, "batch")
+		os.makedirs(os.path.join(self.content_dir, "sub"))
+		for file_name in ["a.ma", "b.ma", "c.fbx", os.path.join("sub", "d.ma"), os.path.join("sub", "e.MA")]:
+			with open(os.path.join(self.content_dir, file_name), 'w') as new_file:
+				new_file.write("//Maya ASCII")
+
+	def tearDown(self):
+		shutil.rmtree(self.temp_dir)
+
+	def test_file_list(self):
+		job = batch_runner.BatchJob("test", None, ['.ma'], file_filter = lambda x: not x.endswith("b.ma"))
+		file_list = batch_runner.get_file_list(job, self.content_dir)
+		self.assertEqual([os.path.basename(x) for x in file_list], ["a.ma", "d.ma", "e.MA"])
+
+		list_path = os.path.join(self.temp_dir, "list.txt")
+		with open(list_path, 'w') as list_file:
+			list_file.write("\n".join(file_list[:2]) + "\n\n")
+		self.assertEqual(batch_runner.get_file_list(job, list_path), file_list[:2])
+
+	def test_walk_cache(self):
+		cache_path = os.path.join(self.temp_dir, "walk_cache.json")
+		file_list = batch_runner.walk_files(self.content_dir, cache_path)
+		self.assertEqual(len(file_list), 5)
+		self.assertEqual(batch_runner.walk_files(self.content_dir, cache_path), file_list)
+
+		# A stale entry for an unchanged folder is trusted, so the cache is what gets read
+		with open(cache_path, 'r') as cache_file:
+			cache_dict = json.load(cache_file)
+		cache_dict[os.path.normpath(self.content_dir)]['files'].append("cached.ma")
+		with open(cache_path, 'w') as cache_file:
+			json.dump(cache_dict, cache_file)
+		self.assertIn(os.path.join(os.path.normpath(self.content_dir), "cached.ma"), batch_runner.walk_files(self.content_dir, cache_path))
+
+	def test_shard(self):
+		file_list = [str(x) for x in range(7)]
+		shard_list = [batch_runner.get_shard(file_list, x, 3) for x in range(3)]
+		self.assertEqual(shard_list, [['0', '3', '6'], ['1', '4'], ['2', '5']])
+		self.assertEqual(sorted(sum(shard_list, [])), file_list)
+
+	def test_main_requires_file_arg(self):
+		job = batch_runner.BatchJob("main_test", lambda x: None, ['.ma'])
+		with self.assertRaises(SystemExit):
+			batch_runner.main(job, [])
+		with self.assertRaises(SystemExit):
+			batch_runner.main(job, ['--batch-dir', self.batch_dir])
+		self.assertFalse(os.path.exists(self.batch_dir))
+
+	def test_run_and_report(self):
+		def file_function(file_path):
+			if file_path.endswith("b.ma"):
+				raise ValueError("bad file")
+			return len(file_path)
+
+		job = batch_runner.BatchJob("report_test", file_function, ['.ma'])
+		report_dict = batch_runner.run_batch(job, self.content_dir, self.batch_dir)
+		self.assertEqual(report_dict['summary']['success'], 3)
+		self.assertEqual(report_dict['summary']['failed'], 1)
+
+		failed_entry = [x for x in report_dict['files'] if x['status'] == 'failed'][0]
+		self.assertTrue(failed_entry['file'].endswith("b.ma"))
+		self.assertIn("bad file", failed_entry['error'])
+		self.assertTrue(os.path.exists(os.path.join(self.batch_dir, "report_test_report.csv")))
+
+	def test_resume(self):
+		run_list = []
+		def crash_function(file_path):
+			if len(run_list) == 2:
+				raise KeyboardInterrupt()
+			run_list.append(file_path)
+
+		job = batch_runner.BatchJob("resume_test", crash_function, ['.ma'])
+		with self.assertRaises(KeyboardInterrupt):
+			batch_runner.run_batch(job, self.content_dir, self.batch_dir)
+		self.assertEqual(len(batch_runner.read_results(self.batch_dir)), 2)
+
+		resume_list = []
+		job.file_function = resume_list.append
+		report_dict = batch_runner.run_batch(job, self.content_dir, self.batch_dir)
+		self.assertEqual(len(resume_list), 2)
+		self.assertFalse(set(resume_list).intersection(run_list))
+		self.assertEqual(report_dict['summary']['success'], 4)
+
+	def test_workers(self):
+		script_path = os.path.join(self.temp_dir, "worker_script.py")
+		pycore_path = os.path.dirname(os.path.dirname(os.path.abspath(batch_runner.__file__)))
+		with open(script_path, 'w') as script_file:
+			script_file.write(WORKER_SCRIPT.format(pycore_path))
+
+		job = batch_runner.BatchJob("worker_test", None, ['.ma'])
+		report_dict = batch_runner.run_batch(job, self.content_dir, self.batch_dir, worker_count = 2, script_path = script_path)
+		self.assertEqual(report_dict['summary']['success'], 3)
+		self.assertEqual(report_dict['summary']['quarantined'], 1)
+		self.assertEqual(sorted(x['result'] for x in report_dict['files'] if x['result']), ["a.ma", "d.ma", "e.MA"])
+		self.assertEqual(set(x.get('worker') for x in report_dict['files'] if x['status'] == 'success'), {0, 1})
+
+	def test_quarantine(self):
+		job = batch_runner.BatchJob("quarantine_test", os.path.basename, ['.ma'])
+		file_list = batch_runner.get_file_list(job, self.content_dir)
+		os.makedirs(self.batch_dir)
+
+		# Starts without a finish are what a hard crash leaves in the journal
+		with batch_runner.BatchJournal(self.batch_dir, 0) as journal:
+			journal.start(file_list[0])
+			journal.start(file_list[1])
+			journal.start(file_list[1])
+		result_dict, crash_dict = batch_runner.BatchJournal.read(self.batch_dir)
+		self.assertEqual(result_dict, {})
+		self.assertEqual(crash_dict, {file_list[0]: 1, file_list[1]: 2})
+		self.assertEqual(batch_runner.get_quarantine_list(crash_dict), [file_list[1]])
+
+		# A file that crashed once is retried, a quarantined file is skipped
+		self.assertEqual(batch_runner.get_remaining_files(file_list, self.batch_dir), [file_list[0]] + file_list[2:])
+		result_list = batch_runner.run_shard(job, file_list, self.batch_dir)
+		self.assertEqual([x['file'] for x in result_list], [file_list[0]] + file_list[2:])
+		self.assertEqual(batch_runner.BatchJournal.read(self.batch_dir)[1], {file_list[1]: 2})
@@ -0,0 +1,81 @@
+'''
+Freeform Rigging and Animation Tools
+Copyright (C) 2020  Micah Zahm
+
+Freeform Rigging and Animation Tools is free software: you can redistribute it
+and/or modify it under the terms of the GNU General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Freeform Rigging and Animation Tools is distributed in the hope that it will
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Freeform Rigging and Animation Tools.
+If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import os
+import tempfile
+import unittest
+
+import maya_standalone
+from maya_standalone import maya_ascii_probe
+
+
+SCENE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "animation_scene.ma")
+
+
+class MayaAsciiProbeTest(unittest.TestCase):
+
+	def test_statements(self):
+		statement_list = list(maya_ascii_probe.iter_statements(SCENE_PATH))
+		self.assertTrue(statement_list[0].startswith("file -rdi 1"))
+		self.assertTrue(statement_list[-1].startswith("connectAttr"))
+		# Semicolons and escaped quotes inside strings don't end a statement
+		self.assertIn('setAttr ".definition_name" -type "string" "run; \\"fast\\""', statement_list)
+		self.assertEqual(len([x for x in statement_list if x.startswith('setAttr ".notes"')]), 1)
+
+	def test_header(self):
+		probe = maya_ascii_probe.probe_scene(SCENE_PATH)
+		self.assertEqual(probe.version, "2022")
+		self.assertEqual(probe.requires_list, [("maya", "2022"), ("mayaHIK", "1.0_HIK_2016.5"), 
+											   ("Mayatomr", "2012.0m - 3.9.1.48 "), ("stereoCamera", "10.0")])
+		self.assertEqual(probe.node_type_dict, {"HIKCharacterNode": "mayaHIK", "HIKSkeletonGeneratorNode": "mayaHIK"})
+		self.assertTrue(probe.requires_plugin("mayaHIK"))
+		self.assertFalse(probe.requires_plugin("fbxmaya"))
+
+	def test_references(self):
+		probe = maya_ascii_probe.probe_scene(SCENE_PATH)
+		self.assertEqual(probe.reference_list, [
+			maya_ascii_probe.SceneReference("W:/Projects/Data/Characters/Hero/rigging/hero_rig.ma", "hero", "heroRN", True),
+			maya_ascii_probe.SceneReference("W:/Projects/Data/Props/sword.ma", "prop", "propRN", False)])
+		self.assertTrue(probe.has_reference("characters\\hero\\rigging\\HERO_RIG.ma"))
+		self.assertFalse(probe.has_reference("villain_rig.ma"))
+
+	def test_network_nodes(self):
+		probe = maya_ascii_probe.probe_scene(SCENE_PATH)
+		self.assertEqual([x.name for x in probe.network_list], ["Core", "ExportDefinition", "plain_network"])
+		self.assertEqual(probe.network_list[1].meta_type, "<class 'metadata.exporter_properties.ExportDefinition'>")
+		self.assertIsNone(probe.network_list[2].meta_type)
+		self.assertTrue(probe.has_meta_type("ExportDefinition"))
+		self.assertTrue(probe.has_meta_type("EditUVProperty"))
+		self.assertFalse(probe.has_meta_type("ImportedCore"))
+
+	def test_header_only(self):
+		probe = maya_ascii_probe.probe_scene(SCENE_PATH, header_only = True)
+		self.assertEqual(len(probe.reference_list), 2)
+		self.assertEqual(len(probe.requires_list), 4)
+		self.assertEqual(probe.network_list, [])
+		self.assertEqual(probe.meta_type_list, [])
+
+	def test_invalid_file(self):
+		with tempfile.NamedTemporaryFile('w', suffix=".ma", delete=False) as binary_file:
+			binary_file.write("FOR4 not an ascii scene")
+		try:
+			self.assertIsNone(maya_ascii_probe.probe_scene(binary_file.name))
+		finally:
+			os.remove(binary_file.name)
+		self.assertIsNone(maya_ascii_probe.probe_scene(SCENE_PATH + ".missing"))
@@ -33,6 +33,7 @@ from v1_core import json_utils
 class EnvironmentKey(Freeform_Enum):
     TOOLSROOT = "V1TOOLSROOT"
     CONTENT = "CONTENT_ROOT"
+    LOGSUFFIX = "FREEFORM_LOG_SUFFIX"
 
 class ConfigKey(Freeform_Enum):
     DEVELOPER = "Developer"
@@ -17,10 +17,14 @@ along with Freeform Rigging and Animation Tools.
 If not, see <https://www.gnu.org/licenses/>.
 '''
 
+import atexit
 import logging
 import logging.config # Max/Unreal don't catch this on import logging
+import logging.handlers
 import os
+import queue
 import shutil
+import threading
 
 '''
 Error Levels:
@@ -76,9 +80,61 @@ def log_config(log_path):
     return config
 
 
+class LoggingManager(object):
+    '''
+    Tracks the background listener that writes queued log records to the log file, and the logger and queue handler
+    it was set up on
+    '''
+    listener = None
+    logger = None
+    queue_handler = None
+
+
+class RepeatFilter(logging.Filter):
+    '''
+    Rate limits identical log messages.  The first repeat_limit of the same message within interval seconds are
+    logged, further repeats are dropped and counted, and the count is added to the next one logged after the interval.
+    Share one filter across handlers, the decision is stored on the record so every handler logs the same messages
+
+    Args:
+        repeat_limit (int): Number of identical messages to log in each interval
+        interval (float): Seconds before a message that hit the limit is logged again
+    '''
+    def __init__(self, repeat_limit = 5, interval = 10.0):
+        super(RepeatFilter, self).__init__()
+        self.repeat_limit = repeat_limit
+        self.interval = interval
+        self.repeat_dict = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        # Handlers share the record, later handlers use the first decision instead of counting the message again
+        if hasattr(record, 'repeat_allowed'):
+            return record.repeat_allowed
+
+        message = record.getMessage()
+        key = (record.levelno, message)
+        with self._lock:
+            window_start, count = self.repeat_dict.get(key, (record.created, 0))
+            if record.created - window_start > self.interval:
+                suppressed_count = count - self.repeat_limit
+                if suppressed_count > 0:
+                    record.msg = "{0} ~~ {1} Repeats Suppressed".format(message, suppressed_count)
+                    record.args = None
+                window_start, count = record.created, 0
+
+            self.repeat_dict[key] = (window_start, count + 1)
+            # Drop messages that haven't repeated recently so the filter doesn't grow over a long session
+            if len(self.repeat_dict) > 1000:
+                self.repeat_dict = {k: v for k, v in self.repeat_dict.items() if record.created - v[0] <= self.interval}
+
+        record.repeat_allowed = count < self.repeat_limit
+        return record.repeat_allowed
+
+
 def logging_wrapper(method, source_name, *args, **kwargs):
     '''
-    Wrapper to log any individual method call
+    Wrapper to log any individual method call.  Arguments are only formatted if debug logging is enabled
 
     Args:
         method (method): The method to wrap
@@ -87,22 +143,94 @@ def logging_wrapper(method, source_name, *args, **kwargs):
         kwargs (kwargs): Kwargs for the method
     '''
     def method_wrap(*args, **kwargs):
-        print_args = [x for x in args if (not type(x) == dict) and (not type(x) == list)]
-        get_logger().debug("{0} -----> {1}.{2} ~~ Args:{2} Kwargs:{3}".format(source_name, method.__module__, method.__name__, print_args, kwargs))
+        logger = get_logger()
+        if logger.isEnabledFor(logging.DEBUG):
+            print_args = [x for x in args if (not type(x) == dict) and (not type(x) == list)]
+            logger.debug("%s -----> %s.%s ~~ Args:%s Kwargs:%s", source_name, method.__module__, method.__name__, print_args, kwargs)
         return method(*args, **kwargs)
 
     return method_wrap, args, kwargs
 
 
+def get_log_name(log_name):
+    '''
+    Get the log file name for this process.  Processes that set the FREEFORM_LOG_SUFFIX environment variable, like
+    batch workers, log to their own file so parallel processes don't share one rotating log
+
+    Args:
+        log_name (string): Base name of the log file
+
+    Returns:
+        string. Log name with the process suffix, if one is set
+    '''
+    from v1_core import global_settings
+
+    log_suffix = os.environ.get(global_settings.EnvironmentKey.LOGSUFFIX.value)
+    return "{0}_{1}".format(log_name, log_suffix) if log_suffix else log_name
+
+
+def start_queue_listener(logger):
+    '''
+    Move the file handlers of a logger behind a queue, so file writes happen on a background thread instead of the
+    thread that logged.  Console handlers are left as they are, since output to Maya's script editor isn't thread safe.
+    Records are formatted before they're queued, so no scene objects are read on the background thread.  Every
+    handler on the logger shares one RepeatFilter
+
+    Args:
+        logger (Logger): The configured logger to change
+    '''
+    stop_queue_listener()
+
+    file_handler_list = [x for x in logger.handlers if isinstance(x, logging.FileHandler)]
+    log_queue = queue.Queue(-1)
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setLevel(min([x.level for x in file_handler_list] + [logging.CRITICAL]))
+    for handler in file_handler_list:
+        logger.removeHandler(handler)
+    logger.addHandler(queue_handler)
+
+    repeat_filter = RepeatFilter()
+    for handler in logger.handlers:
+        handler.addFilter(repeat_filter)
+
+    LoggingManager.logger = logger
+    LoggingManager.queue_handler = queue_handler
+    LoggingManager.listener = logging.handlers.QueueListener(log_queue, *file_handler_list, respect_handler_level=True)
+    LoggingManager.listener.start()
+
+
+def stop_queue_listener():
+    '''
+    Write every queued record and stop the background listener thread, if one is running.  The file handlers go back
+    on the logger in place of the queue handler, so anything logged afterwards is still written
+    '''
+    if LoggingManager.listener:
+        LoggingManager.logger.removeHandler(LoggingManager.queue_handler)
+        LoggingManager.listener.stop()
+        for handler in LoggingManager.listener.handlers:
+            LoggingManager.logger.addHandler(handler)
+
+        LoggingManager.listener = None
+        LoggingManager.logger = None
+        LoggingManager.queue_handler = None
+
+atexit.register(stop_queue_listener)
+
+
 def setup_logging(log_name):
     '''
-    Setup logging settings and log file, copy old log file to a backup, and create a new one
+    Setup logging settings and log file, copy old log file to a backup, and create a new one.  Files are written
+    from a background thread, see start_queue_listener()
 
     Args:
-        log_name (string): Name of the log file to output to
+        log_name (string): Name of the log file to output to, see get_log_name()
     '''
     from v1_core import global_settings
 
+    # Stop any previous listener so queued records are written before the old log file is moved
+    stop_queue_listener()
+
+    log_name = get_log_name(log_name)
     user_dir = global_settings.GlobalSettings.get_user_freeform_folder()
     if not os.path.exists(user_dir):
         os.makedirs(user_dir)
@@ -116,6 +244,7 @@ def setup_logging(log_name):
             pass
 
     logging.config.dictConfig(log_config(output_path))
+    start_queue_listener(logging.getLogger())
     
 
 def get_logger():
@@ -0,0 +1,186 @@
+'''
+Freeform Rigging and Animation Tools
+Copyright (C) 2020  Micah Zahm
+
+Freeform Rigging and Animation Tools is free software: you can redistribute it 
+and/or modify it under the terms of the GNU General Public License as published 
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Freeform Rigging and Animation Tools is distributed in the hope that it will 
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Freeform Rigging and Animation Tools.  
+If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import math
+
+
+def add(a, b):
+    '''
+    Component-wise addition of two 3 value sequences
+
+    Returns:
+        tuple. (x,y,z) result
+    '''
+    return (a[0] + b[0], a[1] + b[1], a[2] + b[2])
+
+def subtract(a, b):
+    '''
+    Component-wise subtraction of two 3 value sequences
+
+    Returns:
+        tuple. (x,y,z) result
+    '''
+    return (a[0] - b[0], a[1] - b[1], a[2] - b[2])
+
+def scale(a, value):
+    '''
+    Multiply each component of a 3 value sequence by a scalar
+
+    Returns:
+        tuple. (x,y,z) result
+    '''
+    return (a[0] * value, a[1] * value, a[2] * value)
+
+def dot(a, b):
+    '''
+    Dot product of two 3 value sequences
+
+    Returns:
+        float. Dot product
+    '''
+    return a[0]*b[0] + a[1]*b[1] + a[2]*b[2]
+
+def length(a):
+    '''
+    Length of a 3 value sequence
+
+    Returns:
+        float. Length of the vector
+    '''
+    return math.sqrt(a[0]*a[0] + a[1]*a[1] + a[2]*a[2])
+
+def lerp(a, b, weight):
+    '''
+    Linear interpolation between two 3 value sequences
+
+    Args:
+        a (list<float>): Start value
+        b (list<float>): End value
+        weight (float): 0 to 1 blend from a to b
+
+    Returns:
+        tuple. (x,y,z) result
+    '''
+    return (a[0] + (b[0] - a[0]) * weight, a[1] + (b[1] - a[1]) * weight, a[2] + (b[2] - a[2]) * weight)
+
+
+def solve_pendulum(pivot_list, start_position, damping = 0.0, bounciness = 0.0, gravity = (0.0, 0.0, -980.0), frame_rate = 30.0,
+                   substeps = 8, rest_length = None):
+    '''
+    Solve a damped pendulum hanging from a moving pivot across a whole frame range.  Replaces a Maya rigid body with a
+    nail constraint and gravity field, so the result can be found without playing back the scene.
+
+    The bob is integrated with position Verlet over substeps between each frame, with the pivot linearly interpolated
+    between its frame samples.  After each step the bob is projected back to rest_length from the pivot, which removes
+    the velocity that stretched the rod.  Bounciness returns that fraction of the stretching velocity back along the rod
+    as a bounce, at 0 the rod is perfectly inelastic.  Damping works as drag, the bob velocity decays by exp(-damping)
+    every second.
+
+    Args:
+        pivot_list (list<list<float>>): World space (x,y,z) position of the pivot for every frame
+        start_position (list<float>): World space (x,y,z) position of the bob on the first frame, the bob starts at rest
+        damping (float): Drag applied to the bob velocity
+        bounciness (float): 0 to 1 restitution of the rod constraint
+        gravity (list<float>): (x,y,z) acceleration applied to the bob in scene units per second squared
+        frame_rate (float): Frames per second of the scene
+        substeps (int): Number of integration steps per frame
+        rest_length (float): Length of the rod, if None the distance from the pivot to start_position on the first frame is used
+
+    Returns:
+        list<tuple>. World space (x,y,z) position of the bob for every frame in pivot_list
+    '''
+    if not pivot_list:
+        return []
+
+    substeps = max(int(substeps), 1)
+    bounciness = min(max(bounciness, 0.0), 1.0)
+    step_time = 1.0 / (frame_rate * substeps)
+    velocity_retain = math.exp(-max(damping, 0.0) * step_time)
+    gravity_step = scale(gravity, step_time * step_time)
+
+    position = tuple(start_position)
+    if rest_length is None:
+        rest_length = length(subtract(position, pivot_list[0]))
+    previous_position = position
+
+    position_list = [position]
+    for previous_pivot, pivot in zip(pivot_list[:-1], pivot_list[1:]):
+        for step in range(1, substeps + 1):
+            step_pivot = lerp(previous_pivot, pivot, step / float(substeps))
+
+            velocity_step = scale(subtract(position, previous_position), velocity_retain)
+            new_position = add(add(position, velocity_step), gravity_step)
+
+            # Rod constraint, keep the bob at rest_length from the pivot
+            offset = subtract(new_position, step_pivot)
+            offset_length = length(offset)
+            bounce_velocity = (0.0, 0.0, 0.0)
+            if offset_length > 0.0:
+                direction = scale(offset, 1.0 / offset_length)
+                stretch_speed = max(dot(subtract(new_position, position), direction), 0.0)
+                bounce_velocity = scale(direction, -stretch_speed * bounciness)
+                new_position = add(step_pivot, scale(direction, rest_length))
+
+            # Verlet velocity is the last step's motion, so the bounce is stored by moving the previous position
+            previous_position = subtract(position, bounce_velocity)
+            position = new_position
+
+        position_list.append(position)
+
+    return position_list
+
+def solve_goal(goal_list, goal_weight, goal_smoothness = 0.0, start_position = None):
+    '''
+    Solve a particle following a moving goal across a whole frame range, in the manner of a Maya particle goal.
+    Replaces playing back a particle simulation so the result can be found without touching the scene.
+
+    Each frame the particle keeps the velocity it had last frame, then is pulled toward the goal by the goal weight.
+    At a weight of 1 the particle sits on the goal, lower weights let it lag behind and overshoot.  Goal smoothness
+    softens the pull the same way as Maya's goalSmoothness, the effective weight is goal_weight ** (1 + goal_smoothness),
+    so a higher smoothness gives a looser, smoother follow.
+
+    Args:
+        goal_list (list<list<float>>): World space (x,y,z) position of the goal for every frame
+        goal_weight (float): 0 to 1 strength of the pull toward the goal
+        goal_smoothness (float): 0 or higher softening of the goal weight
+        start_position (list<float>): World space (x,y,z) position of the particle on the first frame, the particle starts
+            at rest.  If None the particle starts on the goal
+
+    Returns:
+        list<tuple>. World space (x,y,z) position of the particle for every frame in goal_list
+    '''
+    if not goal_list:
+        return []
+
+    goal_weight = min(max(goal_weight, 0.0), 1.0)
+    weight = goal_weight ** (1.0 + max(goal_smoothness, 0.0))
+
+    position = tuple(start_position) if start_position is not None else tuple(goal_list[0])
+    velocity = (0.0, 0.0, 0.0)
+
+    position_list = [position]
+    for goal in goal_list[1:]:
+        free_position = add(position, velocity)
+        new_position = lerp(free_position, goal, weight)
+
+        velocity = subtract(new_position, position)
+        position = new_position
+        position_list.append(position)
+
+    return position_list
@@ -0,0 +1,112 @@
+'''
+Freeform Rigging and Animation Tools
+Copyright (C) 2020  Micah Zahm
+
+Freeform Rigging and Animation Tools is free software: you can redistribute it
+and/or modify it under the terms of the GNU General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Freeform Rigging and Animation Tools is distributed in the hope that it will
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Freeform Rigging and Animation Tools.
+If not, see <https://www.gnu.org/licenses/>.
+'''
+
+
+import v1_math
+
+
+def get_reflection(axis):
+    '''
+    Get the 4x4 matrix that reflects points across the plane facing an axis
+
+    Args:
+        axis (str): Name of the axis to mirror on, 'x', 'y', or 'z'
+
+    Returns:
+        tuple<tuple<float>>. 4x4 reflection matrix
+    '''
+    axis_index = 'xyz'.index(axis)
+    return tuple(tuple((-1.0 if i == axis_index else 1.0) if i == j else 0.0 for j in range(4)) for i in range(4))
+
+def mirror_matrix(matrix, axis):
+    '''
+    Mirror a 4x4 world matrix across an axis.  The matrix is reflected on both sides, reflection * matrix * reflection,
+    so the result is still a right handed transform.  The translate on the mirror axis and the rotation around the
+    other two axes are negated, the same as negating those world space transform values
+
+    Args:
+        matrix (list<list<float>>): 4x4 world matrix
+        axis (str): Name of the axis to mirror on, 'x', 'y', or 'z'
+
+    Returns:
+        tuple<tuple<float>>. Mirrored 4x4 matrix
+    '''
+    # Reflection is diagonal, so reflecting both sides only flips the sign of rows and columns on the mirror axis
+    axis_index = 'xyz'.index(axis)
+    return tuple(tuple(-x if (i == axis_index) != (j == axis_index) else x for j, x in enumerate(row)) for i, row in enumerate(matrix))
+
+def solve_mirror(control_list, axis):
+    '''
+    Mirror world space poses onto controls for every sampled frame.  Each control is given the mirror of a source
+    world matrix and the local translate and rotate that place it there are solved.  Controls are solved in list order,
+    so parents must come before their children.  A control below another control in the list is solved in that
+    control's mirrored space, keeping any offset transforms between them
+
+    Each control is a dictionary with
+        'source_world' (list<matrix>): 4x4 world matrix to mirror onto the control for every frame
+        'world' (list<matrix>): 4x4 world matrix of the control for every frame before the mirror
+        'parent_world' (list<matrix>): 4x4 world matrix of the control's parent for every frame before the mirror
+        'parent_index' (int): Index in control_list of the control's nearest mirrored ancestor, or None if no ancestor is mirrored
+        'rotate_axis' (list<float>): (x,y,z) rotate axis of the control in degrees
+        'rotate_order' (str or int): Rotate order of the control
+
+    Args:
+        control_list (list<dictionary>): Controls to mirror
+        axis (str): Name of the axis to mirror on, 'x', 'y', or 'z'
+
+    Returns:
+        list<dictionary>. For each control the 'translate' and 'rotate' (x,y,z) value for every frame
+    '''
+    new_world_list = []
+    result_list = []
+    for control_data in control_list:
+        rotate_order = control_data.get('rotate_order', 'xyz')
+        rotate_axis = v1_math.retarget.euler_to_matrix(control_data.get('rotate_axis', (0.0, 0.0, 0.0)))
+        parent_index = control_data.get('parent_index')
+
+        new_world = []
+        translate_list = []
+        rotate_list = []
+        previous_rotate = None
+        for frame_index, source_world in enumerate(control_data['source_world']):
+            parent_world = control_data['parent_world'][frame_index]
+            new_parent_world = parent_world
+            if parent_index is not None:
+                # Carry the parent through the ancestor's mirror, parent_world * inverse(ancestor_world) is any offset between them
+                ancestor_world = control_list[parent_index]['world'][frame_index]
+                parent_offset = v1_math.retarget.multiply(parent_world, v1_math.retarget.inverse(ancestor_world))
+                new_parent_world = v1_math.retarget.multiply(parent_offset, new_world_list[parent_index][frame_index])
+            original_local = v1_math.retarget.multiply(control_data['world'][frame_index], v1_math.retarget.inverse(parent_world))
+
+            local_matrix = v1_math.retarget.multiply(mirror_matrix(source_world, axis), v1_math.retarget.inverse(new_parent_world))
+            local_translation = v1_math.retarget.get_translation(local_matrix)
+            local_rotation = v1_math.retarget.get_rotation(local_matrix)
+            # Control keeps it's own scale, only translate and rotate are mirrored
+            new_world.append(v1_math.retarget.multiply(v1_math.retarget.compose(v1_math.retarget.get_scale(original_local), local_rotation, local_translation), new_parent_world))
+
+            # Transform local rotation is rotate_axis * rotate, strip the axis to get rotate
+            rotate_matrix = v1_math.retarget.multiply(v1_math.retarget.transpose(rotate_axis), local_rotation)
+            previous_rotate = v1_math.retarget.matrix_to_euler(rotate_matrix, rotate_order, previous_rotate)
+            translate_list.append(local_translation)
+            rotate_list.append(previous_rotate)
+
+        new_world_list.append(new_world)
+        result_list.append({'translate': translate_list, 'rotate': rotate_list})
+
+    return result_list
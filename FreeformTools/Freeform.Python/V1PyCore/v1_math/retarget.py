@@ -0,0 +1,329 @@
+'''
+Freeform Rigging and Animation Tools
+Copyright (C) 2020  Micah Zahm
+
+Freeform Rigging and Animation Tools is free software: you can redistribute it
+and/or modify it under the terms of the GNU General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Freeform Rigging and Animation Tools is distributed in the hope that it will
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Freeform Rigging and Animation Tools.
+If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import math
+
+
+# Maya rotateOrder enum order, each string lists the axes in the order they're applied
+ROTATE_ORDERS = ['xyz', 'yzx', 'zxy', 'xzy', 'yxz', 'zyx']
+
+IDENTITY = ((1.0, 0.0, 0.0, 0.0), (0.0, 1.0, 0.0, 0.0), (0.0, 0.0, 1.0, 0.0), (0.0, 0.0, 0.0, 1.0))
+
+
+#region Matrix Math
+# Matrices follow Maya's convention, row major with row vectors, so a child's world matrix is local * parent world
+def from_list(value_list):
+    '''
+    Build a 4x4 matrix from a flat list of 16 values, as returned by cmds.getAttr on a matrix attribute
+
+    Returns:
+        tuple<tuple<float>>. 4x4 matrix
+    '''
+    return tuple(tuple(value_list[i*4:i*4+4]) for i in range(4))
+
+def to_list(matrix):
+    '''
+    Flatten a 4x4 matrix to a list of 16 values
+
+    Returns:
+        list<float>. Flat row major matrix values
+    '''
+    return [x for row in matrix for x in row]
+
+def multiply(a, b):
+    '''
+    Multiply two square matrices of the same size
+
+    Returns:
+        tuple<tuple<float>>. a * b
+    '''
+    size = len(a)
+    return tuple(tuple(sum(a[i][k] * b[k][j] for k in range(size)) for j in range(size)) for i in range(size))
+
+def inverse(matrix):
+    '''
+    Invert a 4x4 matrix with Gauss-Jordan elimination
+
+    Returns:
+        tuple<tuple<float>>. Inverse of the matrix
+    '''
+    work = [list(row) + [1.0 if i == j else 0.0 for j in range(4)] for i, row in enumerate(matrix)]
+    for column in range(4):
+        pivot = max(range(column, 4), key = lambda x: abs(work[x][column]))
+        if abs(work[pivot][column]) < 1e-12:
+            raise ValueError("Matrix is singular and can't be inverted")
+        work[column], work[pivot] = work[pivot], work[column]
+
+        pivot_value = work[column][column]
+        work[column] = [x / pivot_value for x in work[column]]
+        for row in range(4):
+            if row != column and work[row][column] != 0.0:
+                row_scale = work[row][column]
+                work[row] = [x - row_scale * y for x, y in zip(work[row], work[column])]
+
+    return tuple(tuple(row[4:]) for row in work)
+
+def transpose(matrix):
+    '''
+    Transpose a square matrix, for a pure rotation this is it's inverse
+
+    Returns:
+        tuple<tuple<float>>. Transposed matrix
+    '''
+    return tuple(zip(*matrix))
+
+def transform_point(point, matrix):
+    '''
+    Transform an (x,y,z) point by a 4x4 matrix
+
+    Returns:
+        tuple. (x,y,z) transformed point
+    '''
+    return tuple(point[0] * matrix[0][j] + point[1] * matrix[1][j] + point[2] * matrix[2][j] + matrix[3][j] for j in range(3))
+
+def get_translation(matrix):
+    '''
+    Returns:
+        tuple. (x,y,z) translation of a 4x4 matrix
+    '''
+    return tuple(matrix[3][:3])
+
+def get_scale(matrix):
+    '''
+    Returns:
+        tuple. (x,y,z) scale of a 4x4 matrix, the length of each axis
+    '''
+    return tuple(math.sqrt(sum(x * x for x in matrix[i][:3])) for i in range(3))
+
+def get_rotation(matrix):
+    '''
+    Returns:
+        tuple<tuple<float>>. 3x3 rotation of a 4x4 matrix with scale removed from each axis
+    '''
+    rotation = []
+    for i in range(3):
+        axis_length = math.sqrt(sum(x * x for x in matrix[i][:3])) or 1.0
+        rotation.append(tuple(x / axis_length for x in matrix[i][:3]))
+    return tuple(rotation)
+
+def compose(scale, rotation, translation):
+    '''
+    Build a 4x4 matrix from it's parts
+
+    Args:
+        scale (list<float>): (x,y,z) scale
+        rotation (list<list<float>>): 3x3 rotation matrix
+        translation (list<float>): (x,y,z) translation
+
+    Returns:
+        tuple<tuple<float>>. 4x4 matrix
+    '''
+    return (tuple(x * scale[0] for x in rotation[0]) + (0.0,),
+            tuple(x * scale[1] for x in rotation[1]) + (0.0,),
+            tuple(x * scale[2] for x in rotation[2]) + (0.0,),
+            tuple(translation) + (1.0,))
+
+def remove_scale(matrix):
+    '''
+    Returns:
+        tuple<tuple<float>>. 4x4 matrix with the same rotation and translation and a scale of 1
+    '''
+    return compose((1.0, 1.0, 1.0), get_rotation(matrix), get_translation(matrix))
+#endregion
+
+
+#region Euler Rotation
+def axis_rotation(axis, degrees):
+    '''
+    3x3 rotation matrix around a single axis
+
+    Args:
+        axis (int): 0, 1, 2 for x, y, z
+        degrees (float): Rotation in degrees
+
+    Returns:
+        tuple<tuple<float>>. 3x3 rotation matrix
+    '''
+    cos_value = math.cos(math.radians(degrees))
+    sin_value = math.sin(math.radians(degrees))
+    # Other two axes in cyclic order, so y rotates z toward x
+    first, second = (axis + 1) % 3, (axis + 2) % 3
+
+    rotation = [[0.0] * 3 for i in range(3)]
+    rotation[axis][axis] = 1.0
+    rotation[first][first] = cos_value
+    rotation[first][second] = sin_value
+    rotation[second][first] = -sin_value
+    rotation[second][second] = cos_value
+    return tuple(tuple(row) for row in rotation)
+
+def euler_to_matrix(rotation, rotate_order = 'xyz'):
+    '''
+    Convert an euler rotation to a 3x3 rotation matrix
+
+    Args:
+        rotation (list<float>): (x,y,z) rotation in degrees
+        rotate_order (str or int): Rotate order as an axis string or Maya rotateOrder value
+
+    Returns:
+        tuple<tuple<float>>. 3x3 rotation matrix
+    '''
+    rotate_order = ROTATE_ORDERS[rotate_order] if isinstance(rotate_order, int) else rotate_order
+    axis_list = ['xyz'.index(x) for x in rotate_order]
+
+    matrix = axis_rotation(axis_list[0], rotation[axis_list[0]])
+    for axis in axis_list[1:]:
+        matrix = multiply(matrix, axis_rotation(axis, rotation[axis]))
+    return matrix
+
+def matrix_to_euler(matrix, rotate_order = 'xyz', previous = None):
+    '''
+    Convert a 3x3 rotation matrix to an euler rotation.  Every rotation has two euler solutions plus any number of
+    360 degree turns on each axis, the one closest to the previous rotation is returned so a curve built from
+    consecutive frames stays continuous
+
+    Args:
+        matrix (list<list<float>>): 3x3 rotation matrix
+        rotate_order (str or int): Rotate order as an axis string or Maya rotateOrder value
+        previous (list<float>): (x,y,z) rotation in degrees to stay closest to, if None (0,0,0) is used
+
+    Returns:
+        tuple. (x,y,z) rotation in degrees
+    '''
+    rotate_order = ROTATE_ORDERS[rotate_order] if isinstance(rotate_order, int) else rotate_order
+    i, j, k = ['xyz'.index(x) for x in rotate_order]
+    # Even permutations of xyz share signs with the xyz solution, odd permutations flip them
+    parity = 1.0 if (i, j, k) in [(0, 1, 2), (1, 2, 0), (2, 0, 1)] else -1.0
+
+    # Work with the column vector form of the matrix, the transpose of Maya's row vector form
+    column = transpose(matrix)
+    first = math.degrees(math.atan2(parity * column[k][j], column[k][k]))
+    second = math.degrees(math.asin(max(-1.0, min(1.0, -parity * column[k][i]))))
+    third = math.degrees(math.atan2(parity * column[j][i], column[i][i]))
+
+    previous = previous if previous is not None else (0.0, 0.0, 0.0)
+    previous_solution = (previous[i], previous[j], previous[k])
+
+    best_solution = None
+    best_distance = None
+    for solution in [(first, second, third), (first + 180.0, 180.0 - second, third + 180.0)]:
+        solution = tuple(x + 360.0 * round((y - x) / 360.0) for x, y in zip(solution, previous_solution))
+        solution_distance = sum(abs(x - y) for x, y in zip(solution, previous_solution))
+        if best_distance is None or solution_distance < best_distance:
+            best_solution, best_distance = solution, solution_distance
+
+    euler = [0.0, 0.0, 0.0]
+    euler[i], euler[j], euler[k] = best_solution
+    return tuple(euler)
+#endregion
+
+
+def get_constraint_offset(constraint_type, source_world, target_world, target_parent_world):
+    '''
+    Find the offset a maintain offset constraint would store, from the source and target pose on one frame
+
+    Args:
+        constraint_type (str): 'parent', 'orient' or 'point'
+        source_world (list<list<float>>): 4x4 world matrix of the driving joint
+        target_world (list<list<float>>): 4x4 world matrix of the driven joint
+        target_parent_world (list<list<float>>): 4x4 world matrix of the driven joint's parent
+
+    Returns:
+        tuple. 4x4 offset matrix for 'parent', 3x3 offset rotation for 'orient', (x,y,z) parent space offset for 'point'
+    '''
+    if constraint_type == 'parent':
+        return multiply(remove_scale(target_world), inverse(remove_scale(source_world)))
+    elif constraint_type == 'orient':
+        return multiply(get_rotation(target_world), transpose(get_rotation(source_world)))
+    else:
+        target_position = transform_point(get_translation(target_world), inverse(target_parent_world))
+        source_position = transform_point(get_translation(source_world), inverse(target_parent_world))
+        return tuple(x - y for x, y in zip(target_position, source_position))
+
+def solve_transfer(joint_list):
+    '''
+    Transfer animation from source joints onto target joints the way parent, orient and point constraints would,
+    without building constraints or playing back the scene.  Joints are solved in list order, so parents must come
+    before their children.  A target whose parent is also in the list is solved in the parent's new space.
+
+    Each joint is a dictionary with
+        'constraint_type' (str): 'parent', 'orient' or 'point'
+        'source_world' (list<matrix>): 4x4 world matrix of the driving joint for every frame
+        'target_world' (list<matrix>): 4x4 world matrix of the target joint for every frame before the transfer
+        'parent_world' (list<matrix>): 4x4 world matrix of the target joint's parent for every frame before the transfer
+        'parent_index' (int): Index in joint_list of the target joint's parent, or None if the parent isn't transferred
+        'offset' (tuple): Offset from get_constraint_offset(), or None for no offset
+        'joint_orient' (list<float>): (x,y,z) joint orient of the target joint in degrees
+        'rotate_axis' (list<float>): (x,y,z) rotate axis of the target joint in degrees
+        'rotate_order' (str or int): Rotate order of the target joint
+
+    Args:
+        joint_list (list<dictionary>): Joints to transfer
+
+    Returns:
+        list<dictionary>. For each joint the 'translate' and 'rotate' (x,y,z) value for every frame, each is None if
+            the constraint type doesn't drive it
+    '''
+    new_world_list = []
+    result_list = []
+    for joint_data in joint_list:
+        constraint_type = joint_data['constraint_type']
+        offset = joint_data.get('offset')
+        rotate_order = joint_data.get('rotate_order', 'xyz')
+        joint_orient = euler_to_matrix(joint_data.get('joint_orient', (0.0, 0.0, 0.0)))
+        rotate_axis = euler_to_matrix(joint_data.get('rotate_axis', (0.0, 0.0, 0.0)))
+        parent_index = joint_data.get('parent_index')
+
+        new_world = []
+        translate_list = []
+        rotate_list = []
+        previous_rotate = None
+        for frame_index, source_world in enumerate(joint_data['source_world']):
+            parent_world = joint_data['parent_world'][frame_index]
+            new_parent_world = new_world_list[parent_index][frame_index] if parent_index is not None else parent_world
+            original_local = multiply(joint_data['target_world'][frame_index], inverse(parent_world))
+
+            local_translation = get_translation(original_local)
+            local_rotation = get_rotation(original_local)
+            if constraint_type == 'parent':
+                target_world = multiply(offset, remove_scale(source_world)) if offset else remove_scale(source_world)
+                local_matrix = multiply(target_world, inverse(new_parent_world))
+                local_translation = get_translation(local_matrix)
+                local_rotation = get_rotation(local_matrix)
+            elif constraint_type == 'orient':
+                world_rotation = multiply(offset, get_rotation(source_world)) if offset else get_rotation(source_world)
+                local_rotation = multiply(world_rotation, transpose(get_rotation(new_parent_world)))
+            elif constraint_type == 'point':
+                position = transform_point(get_translation(source_world), inverse(new_parent_world))
+                local_translation = tuple(x + y for x, y in zip(position, offset)) if offset else position
+
+            new_world.append(multiply(compose(get_scale(original_local), local_rotation, local_translation), new_parent_world))
+
+            if constraint_type in ['parent', 'point']:
+                translate_list.append(local_translation)
+            if constraint_type in ['parent', 'orient']:
+                # Joint local rotation is rotate_axis * rotate * joint_orient, strip the axis and orient to get rotate
+                rotate_matrix = multiply(multiply(transpose(rotate_axis), local_rotation), transpose(joint_orient))
+                previous_rotate = matrix_to_euler(rotate_matrix, rotate_order, previous_rotate)
+                rotate_list.append(previous_rotate)
+
+        new_world_list.append(new_world)
+        result_list.append({'translate': translate_list if translate_list else None, 'rotate': rotate_list if rotate_list else None})
+
+    return result_list
@@ -0,0 +1,111 @@
+'''
+Freeform Rigging and Animation Tools
+Copyright (C) 2020  Micah Zahm
+
+Freeform Rigging and Animation Tools is free software: you can redistribute it 
+and/or modify it under the terms of the GNU General Public License as published 
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Freeform Rigging and Animation Tools is distributed in the hope that it will 
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Freeform Rigging and Animation Tools.  
+If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import math
+
+import v1_math
+
+
+def distance(a, b):
+    '''
+    Distance between two (x,y,z) points
+
+    Returns:
+        float. Distance between a and b
+    '''
+    return math.sqrt((a[0] - b[0])**2 + (a[1] - b[1])**2 + (a[2] - b[2])**2)
+
+def distance_curve(position_list, reference_position):
+    '''
+    Distance of every position in a trajectory from a reference position
+
+    Args:
+        position_list (list<list<float>>): (x,y,z) position for each frame
+        reference_position (list<float>): (x,y,z) position to measure from
+
+    Returns:
+        list<float>. Distance for each frame
+    '''
+    return [distance(x, reference_position) for x in position_list]
+
+def speed_curve(position_list, frame_rate):
+    '''
+    Speed in units per second for every frame in a trajectory, found from the distance travelled since the previous
+    frame.  The first frame has no previous frame, so it uses the speed from the first to the second frame.
+
+    Args:
+        position_list (list<list<float>>): (x,y,z) position for each frame
+        frame_rate (float): Frames per second of the trajectory
+
+    Returns:
+        list<float>. Speed for each frame
+    '''
+    if len(position_list) < 2:
+        return [0.0] * len(position_list)
+
+    speed_list = [distance(a, b) * frame_rate for a, b in zip(position_list[:-1], position_list[1:])]
+    return speed_list[:1] + speed_list
+
+def angle_curve(rotation_list, reference_rotation):
+    '''
+    Angle in degrees between every rotation in a trajectory and a reference rotation, found from the absolute euler
+    difference on each axis
+
+    Args:
+        rotation_list (list<list<float>>): (x,y,z) euler rotation in degrees for each frame
+        reference_rotation (list<float>): (x,y,z) euler rotation in degrees to measure from
+
+    Returns:
+        list<float>. Angle for each frame
+    '''
+    angle_list = []
+    for rotation in rotation_list:
+        quaternion = v1_math.rotation.euler_degrees_to_quaternion(abs(rotation[0] - reference_rotation[0]), 
+                                                                  abs(rotation[1] - reference_rotation[1]), 
+                                                                  abs(rotation[2] - reference_rotation[2]))
+        angle_list.append(v1_math.rotation.angle_of_quaternion_degree(*quaternion))
+
+    return angle_list
+
+def is_translating(translation_list, rotation_list, threshold = 1.0):
+    '''
+    Analyze a trajectory to see if it is translating or rotating.  Walks the frames in order, if the translation
+    length changes by more than threshold from the first frame it is translating, if the rotation length does it is
+    rotating.
+
+    Args:
+        translation_list (list<list<float>>): (x,y,z) translation for each frame
+        rotation_list (list<list<float>>): (x,y,z) euler rotation in degrees for each frame
+        threshold (float): Change in length that counts as moving
+
+    Returns:
+        bool. True if translation changes first, False if rotation changes first or neither does
+    '''
+    if not translation_list:
+        return False
+
+    origin = (0.0, 0.0, 0.0)
+    start_distance = distance(translation_list[0], origin)
+    start_rotate = distance(rotation_list[0], origin)
+    for translation, rotation in zip(translation_list, rotation_list):
+        if abs(distance(translation, origin) - start_distance) > threshold:
+            return True
+        if abs(distance(rotation, origin) - start_rotate) > threshold:
+            return False
+    return False
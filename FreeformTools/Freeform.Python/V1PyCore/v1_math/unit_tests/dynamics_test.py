@@ -0,0 +1,65 @@
+'''
+Freeform Rigging and Animation Tools
+Copyright (C) 2020  Micah Zahm
+
+Freeform Rigging and Animation Tools is free software: you can redistribute it 
+and/or modify it under the terms of the GNU General Public License as published 
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Freeform Rigging and Animation Tools is distributed in the hope that it will 
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Freeform Rigging and Animation Tools.  
+If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import unittest
+
+from v1_math import dynamics
+
+
+class DynamicsTest(unittest.TestCase):
+
+	def test_empty_pivot_list(self):
+		self.assertEqual(dynamics.solve_pendulum([], (0, 0, -20)), [])
+
+	def test_static_pendulum_at_rest(self):
+		pivot_list = [(0.0, 0.0, 0.0)] * 30
+		position_list = dynamics.solve_pendulum(pivot_list, (0.0, 0.0, -20.0), gravity = (0.0, 0.0, 0.0))
+		self.assertEqual(len(position_list), 30)
+		for position in position_list:
+			for a, b in zip(position, (0.0, 0.0, -20.0)):
+				self.assertAlmostEqual(a, b)
+
+	def test_rest_length_preserved(self):
+		pivot_list = [(frame * 5.0, 0.0, 0.0) for frame in range(60)]
+		position_list = dynamics.solve_pendulum(pivot_list, (0.0, 0.0, -20.0))
+		for pivot, position in zip(pivot_list, position_list):
+			self.assertAlmostEqual(dynamics.length(dynamics.subtract(position, pivot)), 20.0, places=4)
+
+	def test_rest_length_preserved_with_bounce(self):
+		# Control defaults, damping 5 and bounciness 0.6
+		pivot_list = [(frame * 5.0, 0.0, frame * -2.0) for frame in range(60)]
+		position_list = dynamics.solve_pendulum(pivot_list, (0.0, 0.0, -20.0), damping = 5.0, bounciness = 0.6)
+		for pivot, position in zip(pivot_list, position_list):
+			self.assertAlmostEqual(dynamics.length(dynamics.subtract(position, pivot)), 20.0, places=4)
+
+	def test_damping_reduces_swing(self):
+		pivot_list = [(0.0, 0.0, 0.0)] * 90
+		free_list = dynamics.solve_pendulum(pivot_list, (20.0, 0.0, 0.0))
+		damped_list = dynamics.solve_pendulum(pivot_list, (20.0, 0.0, 0.0), damping = 5.0)
+		self.assertLess(max(abs(x[0]) for x in damped_list[60:]), max(abs(x[0]) for x in free_list[60:]))
+
+	def test_goal_full_weight_follows_goal(self):
+		goal_list = [(frame * 3.0, 0.0, 0.0) for frame in range(20)]
+		self.assertEqual(dynamics.solve_goal(goal_list, 1.0, 0.0), goal_list)
+
+	def test_goal_lags_and_settles(self):
+		goal_list = [(0.0, 0.0, 0.0)] + [(10.0, 0.0, 0.0)] * 299
+		position_list = dynamics.solve_goal(goal_list, 0.65, 2.0)
+		self.assertLess(position_list[1][0], 10.0)
+		self.assertAlmostEqual(position_list[-1][0], 10.0, places=3)
@@ -0,0 +1,93 @@
+'''
+Freeform Rigging and Animation Tools
+Copyright (C) 2020  Micah Zahm
+
+Freeform Rigging and Animation Tools is free software: you can redistribute it 
+and/or modify it under the terms of the GNU General Public License as published 
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Freeform Rigging and Animation Tools is distributed in the hope that it will 
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Freeform Rigging and Animation Tools.  
+If not, see <https://www.gnu.org/licenses/>.
+'''
+
+
+import unittest
+
+import v1_math
+from v1_math import mirror
+from v1_math import retarget
+
+
+def transform_world(translation, rotation, parent_world = retarget.IDENTITY, rotate_order = 'xyz'):
+	return retarget.multiply(retarget.compose((1.0, 1.0, 1.0), retarget.euler_to_matrix(rotation, rotate_order), translation), parent_world)
+
+
+class MirrorTest(unittest.TestCase):
+
+	def assertMatrixEqual(self, a, b, places = 5):
+		for row_a, row_b in zip(a, b):
+			for x, y in zip(row_a, row_b):
+				self.assertAlmostEqual(x, y, places)
+
+	def test_reflection(self):
+		matrix = transform_world((1.0, 2.0, 3.0), (10.0, 20.0, 30.0))
+		for axis in 'xyz':
+			reflection = mirror.get_reflection(axis)
+			self.assertMatrixEqual(mirror.mirror_matrix(matrix, axis), retarget.multiply(retarget.multiply(reflection, matrix), reflection))
+			self.assertMatrixEqual(mirror.mirror_matrix(mirror.mirror_matrix(matrix, axis), axis), matrix)
+
+	def test_matches_attribute_flip(self):
+		# Mirroring the world matrix matches negating the mirror attributes of a world space transform
+		translation = (5.0, -3.0, 12.0)
+		rotation = (25.0, -40.0, 75.0)
+		for axis, flip_list in [('x', ['tx', 'ry', 'rz']), ('y', ['ty', 'rx', 'rz']), ('z', ['tz', 'rx', 'ry'])]:
+			flip_translation = [-x if 't' + a in flip_list else x for x, a in zip(translation, 'xyz')]
+			flip_rotation = [-x if 'r' + a in flip_list else x for x, a in zip(rotation, 'xyz')]
+			for rotate_order in retarget.ROTATE_ORDERS:
+				matrix = transform_world(translation, rotation, rotate_order = rotate_order)
+				expected = transform_world(flip_translation, flip_rotation, rotate_order = rotate_order)
+				self.assertMatrixEqual(mirror.mirror_matrix(matrix, axis), expected)
+
+	def test_solve_in_parent_space(self):
+		# Source world poses over 3 frames, mirrored onto a control under a moving parent with a child control
+		frame_list = [((10.0, 0.0, 5.0), (0.0, 0.0, 0.0)), ((12.0, 3.0, 5.0), (0.0, 30.0, 10.0)), ((15.0, 6.0, 2.0), (15.0, 60.0, -20.0))]
+		source_world = [transform_world(t, r) for t, r in frame_list]
+		source_child = [transform_world((0.0, 4.0, 0.0), (0.0, 0.0, 45.0), x) for x in source_world]
+		parent_world = [transform_world((0.0, 0.0, float(i)), (0.0, 0.0, 10.0 * i)) for i in range(3)]
+		control_world = [transform_world((1.0, 1.0, 1.0), (0.0, 0.0, 0.0), x) for x in parent_world]
+		child_world = [transform_world((0.0, 1.0, 0.0), (0.0, 0.0, 0.0), x) for x in control_world]
+
+		control_list = [{'source_world': source_world, 'world': control_world, 'parent_world': parent_world, 'parent_index': None,
+						 'rotate_axis': (0.0, 0.0, 0.0), 'rotate_order': 'zxy'},
+						{'source_world': source_child, 'world': child_world, 'parent_world': control_world, 'parent_index': 0}]
+		result_list = mirror.solve_mirror(control_list, 'x')
+
+		for frame_index in range(3):
+			control_result = transform_world(result_list[0]['translate'][frame_index], result_list[0]['rotate'][frame_index], parent_world[frame_index], 'zxy')
+			self.assertMatrixEqual(control_result, mirror.mirror_matrix(source_world[frame_index], 'x'))
+			child_result = transform_world(result_list[1]['translate'][frame_index], result_list[1]['rotate'][frame_index], control_result)
+			self.assertMatrixEqual(child_result, mirror.mirror_matrix(source_child[frame_index], 'x'))
+
+	def test_solve_under_offset(self):
+		# Child control sits under an offset group below the mirrored control, and is solved in the group's mirrored space
+		source_world = [transform_world((10.0, 2.0, 5.0), (0.0, 30.0, 10.0))]
+		source_child = [transform_world((0.0, 4.0, 1.0), (20.0, 0.0, 45.0), source_world[0])]
+		control_world = [transform_world((1.0, 1.0, 1.0), (0.0, 10.0, 0.0))]
+		offset_world = [transform_world((0.0, 2.0, 0.0), (0.0, 0.0, 90.0), control_world[0])]
+		child_world = [transform_world((0.0, 1.0, 0.0), (0.0, 0.0, 0.0), offset_world[0])]
+
+		control_list = [{'source_world': source_world, 'world': control_world, 'parent_world': [retarget.IDENTITY], 'parent_index': None},
+						{'source_world': source_child, 'world': child_world, 'parent_world': offset_world, 'parent_index': 0}]
+		result_list = mirror.solve_mirror(control_list, 'y')
+
+		control_result = transform_world(result_list[0]['translate'][0], result_list[0]['rotate'][0])
+		offset_result = transform_world((0.0, 2.0, 0.0), (0.0, 0.0, 90.0), control_result)
+		child_result = transform_world(result_list[1]['translate'][0], result_list[1]['rotate'][0], offset_result)
+		self.assertMatrixEqual(child_result, mirror.mirror_matrix(source_child[0], 'y'))
@@ -0,0 +1,95 @@
+'''
+Freeform Rigging and Animation Tools
+Copyright (C) 2020  Micah Zahm
+
+Freeform Rigging and Animation Tools is free software: you can redistribute it 
+and/or modify it under the terms of the GNU General Public License as published 
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Freeform Rigging and Animation Tools is distributed in the hope that it will 
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Freeform Rigging and Animation Tools.  
+If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import unittest
+
+import v1_math
+from v1_math import retarget
+
+
+def joint_world(translation, rotation, parent_world = retarget.IDENTITY, joint_orient = (0.0, 0.0, 0.0), rotate_order = 'xyz'):
+	local_rotation = retarget.multiply(retarget.euler_to_matrix(rotation, rotate_order), retarget.euler_to_matrix(joint_orient))
+	return retarget.multiply(retarget.compose((1.0, 1.0, 1.0), local_rotation, translation), parent_world)
+
+
+class RetargetTest(unittest.TestCase):
+
+	def assertMatrixEqual(self, a, b, places = 5):
+		for row_a, row_b in zip(a, b):
+			for x, y in zip(row_a, row_b):
+				self.assertAlmostEqual(x, y, places)
+
+	def test_inverse(self):
+		matrix = joint_world((1.0, 2.0, 3.0), (10.0, 20.0, 30.0))
+		self.assertMatrixEqual(retarget.multiply(matrix, retarget.inverse(matrix)), retarget.IDENTITY)
+
+	def test_euler_round_trip(self):
+		rotation = (25.0, -40.0, 75.0)
+		for rotate_order in retarget.ROTATE_ORDERS:
+			matrix = retarget.euler_to_matrix(rotation, rotate_order)
+			result = retarget.matrix_to_euler(matrix, rotate_order, rotation)
+			for x, y in zip(result, rotation):
+				self.assertAlmostEqual(x, y, 5)
+
+	def test_euler_continuity(self):
+		matrix = retarget.euler_to_matrix((0.0, 0.0, 190.0))
+		result = retarget.matrix_to_euler(matrix, 'xyz', (0.0, 0.0, 170.0))
+		self.assertAlmostEqual(result[2], 190.0, 5)
+
+	def test_parent_transfer_matches_source(self):
+		# Two joint source chain animated over 3 frames, target chain has a joint orient on the child
+		frame_rotation_list = [(0.0, 0.0, 0.0), (0.0, 30.0, 10.0), (15.0, 60.0, -20.0)]
+		source_root = [joint_world((0.0, 0.0, float(i)), rotation) for i, rotation in enumerate(frame_rotation_list)]
+		source_child = [joint_world((10.0, 0.0, 0.0), rotation, parent) for rotation, parent in zip(frame_rotation_list, source_root)]
+
+		target_root = [joint_world((0.0, 0.0, 0.0), (0.0, 0.0, 0.0))] * 3
+		target_child = [joint_world((10.0, 0.0, 0.0), (0.0, 0.0, 0.0), target_root[0])] * 3
+
+		joint_list = [{'constraint_type': 'parent', 'source_world': source_root, 'target_world': target_root, 
+					   'parent_world': [retarget.IDENTITY] * 3, 'parent_index': None},
+					  {'constraint_type': 'orient', 'source_world': source_child, 'target_world': target_child, 
+					   'parent_world': target_root, 'parent_index': 0, 'joint_orient': (0.0, 0.0, 90.0)}]
+		result_list = retarget.solve_transfer(joint_list)
+
+		for i, rotation in enumerate(frame_rotation_list):
+			new_root = joint_world(result_list[0]['translate'][i], result_list[0]['rotate'][i])
+			self.assertMatrixEqual(new_root, source_root[i])
+
+			new_child = joint_world((10.0, 0.0, 0.0), result_list[1]['rotate'][i], new_root, (0.0, 0.0, 90.0))
+			self.assertMatrixEqual(retarget.get_rotation(new_child), retarget.get_rotation(source_child[i]))
+		self.assertIsNone(result_list[1]['translate'])
+
+	def test_point_offset(self):
+		source_world = [joint_world((float(i), 0.0, 0.0), (0.0, 0.0, 0.0)) for i in range(3)]
+		target_world = [joint_world((0.0, 5.0, 0.0), (0.0, 0.0, 0.0))] * 3
+		offset = retarget.get_constraint_offset('point', source_world[0], target_world[0], retarget.IDENTITY)
+
+		result_list = retarget.solve_transfer([{'constraint_type': 'point', 'source_world': source_world, 'target_world': target_world,
+												'parent_world': [retarget.IDENTITY] * 3, 'parent_index': None, 'offset': offset}])
+		self.assertEqual([tuple(round(x, 5) for x in y) for y in result_list[0]['translate']], [(0.0, 5.0, 0.0), (1.0, 5.0, 0.0), (2.0, 5.0, 0.0)])
+		self.assertIsNone(result_list[0]['rotate'])
+
+	def test_orient_offset(self):
+		source_world = [joint_world((0.0, 0.0, 0.0), (0.0, 0.0, 10.0 * i)) for i in range(3)]
+		target_world = [joint_world((0.0, 0.0, 0.0), (0.0, 0.0, 45.0))] * 3
+		offset = retarget.get_constraint_offset('orient', source_world[0], target_world[0], retarget.IDENTITY)
+
+		result_list = retarget.solve_transfer([{'constraint_type': 'orient', 'source_world': source_world, 'target_world': target_world,
+												'parent_world': [retarget.IDENTITY] * 3, 'parent_index': None, 'offset': offset}])
+		self.assertEqual([round(x[2], 5) for x in result_list[0]['rotate']], [45.0, 55.0, 65.0])
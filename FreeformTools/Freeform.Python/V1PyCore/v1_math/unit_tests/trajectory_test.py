@@ -0,0 +1,46 @@
+'''
+Freeform Rigging and Animation Tools
+Copyright (C) 2020  Micah Zahm
+
+Freeform Rigging and Animation Tools is free software: you can redistribute it 
+and/or modify it under the terms of the GNU General Public License as published 
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Freeform Rigging and Animation Tools is distributed in the hope that it will 
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Freeform Rigging and Animation Tools.  
+If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import unittest
+
+import v1_math
+from v1_math import trajectory
+
+
+class TrajectoryTest(unittest.TestCase):
+
+	def test_distance_curve(self):
+		position_list = [(frame * 2.0, 0.0, 0.0) for frame in range(5)]
+		self.assertEqual(trajectory.distance_curve(position_list, position_list[0]), [0.0, 2.0, 4.0, 6.0, 8.0])
+
+	def test_speed_curve(self):
+		position_list = [(0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (3.0, 0.0, 0.0)]
+		self.assertEqual(trajectory.speed_curve(position_list, 30.0), [30.0, 30.0, 60.0])
+		self.assertEqual(trajectory.speed_curve(position_list[:1], 30.0), [0.0])
+
+	def test_angle_curve(self):
+		rotation_list = [(0.0, 0.0, 0.0), (0.0, 45.0, 0.0), (0.0, 90.0, 0.0)]
+		for a, b in zip(trajectory.angle_curve(rotation_list, rotation_list[0]), [0.0, 45.0, 90.0]):
+			self.assertAlmostEqual(a, b)
+
+	def test_is_translating(self):
+		static_list = [(0.0, 0.0, 0.0)] * 3
+		self.assertTrue(trajectory.is_translating([(0.0, 0.0, 0.0), (0.5, 0.0, 0.0), (5.0, 0.0, 0.0)], static_list))
+		self.assertFalse(trajectory.is_translating(static_list, [(0.0, 0.0, 0.0), (0.0, 0.0, 90.0), (0.0, 0.0, 90.0)]))
+		self.assertFalse(trajectory.is_translating(static_list, static_list))
@@ -0,0 +1,200 @@
+'''
+Freeform Rigging and Animation Tools
+Copyright (C) 2020  Micah Zahm
+
+Freeform Rigging and Animation Tools is free software: you can redistribute it
+and/or modify it under the terms of the GNU General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Freeform Rigging and Animation Tools is distributed in the hope that it will
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Freeform Rigging and Animation Tools.
+If not, see <https://www.gnu.org/licenses/>.
+'''
+
+# Pure Python, this module must not import Maya so mesh combines can be planned and tested outside of Maya
+
+import collections
+
+
+CombinePart = collections.namedtuple('CombinePart', ['name', 'influence_list', 'weight_list', 'vertex_count'])
+CombinePart.__doc__ = '''
+Skin weights read from one mesh going into a combine
+
+Attributes:
+    name (str): Name of the mesh
+    influence_list (list<str>): Name of each skin cluster influence, in skin cluster order
+    weight_list (list<float>): Vertex-major weights, vertex_count rows of len(influence_list) weights
+    vertex_count (int): Number of vertices on the mesh
+'''
+
+
+def get_short_name(node_name):
+    '''
+    Strip the DAG path and namespace from a node name, so joints from different imports of the same skeleton match
+
+    Args:
+        node_name (str): Full or partial node name, ie. 'ns:root|ns:pelvis'
+
+    Returns:
+        str. Node name without path or namespace, ie. 'pelvis'
+    '''
+    return node_name.split('|')[-1].split(':')[-1]
+
+def get_ancestor_names(node_name):
+    '''
+    Get every parent in a node's DAG path
+
+    Args:
+        node_name (str): Full DAG path of a node, ie. 'ns:root|ns:pelvis|ns:spine'
+
+    Returns:
+        list<str>. Parent node names nearest first, ie. ['ns:pelvis', 'ns:root'].  Empty if the name has no path
+    '''
+    return [x for x in node_name.split('|')[:-1] if x][::-1]
+
+
+class CombinePlan(object):
+    '''
+    Plans combining many skinned meshes into a single mesh skinned to one skeleton.  Every part's influences and weights
+    are read once up front, the unified influence list is found once for all parts, and all weights are merged into
+    one weight list for the combined mesh so it can be written in a single bulk skin weight set.  Combined vertices are
+    in part order, matching how polyUnite appends meshes
+
+    Influences are matched to the skeleton by name without namespace.  Weight on an influence that isn't on the skeleton
+    moves to its nearest ancestor that is, found from the influence's DAG path, so give full path influence names.
+    Weight on a missing influence with no ancestor on the skeleton is dropped and the vertex re-normalized, and
+    merge_weights() raises ValueError if that leaves any vertex with no weight
+
+    Args:
+        part_list (list<CombinePart>): Every mesh to combine, in combine order
+        skeleton_name_list (list<str>): Names of the joints to bind the combined mesh to, if None the parts' own
+            influences are used
+
+    Attributes:
+        part_list (tuple<CombinePart>): Every mesh to combine, in combine order
+        influence_list (tuple<str>): Skeleton joint names the combined mesh is bound to, only joints with weight on any
+            part are included, in skeleton order
+        missing_influence_list (tuple<str>): Part influences with weight that aren't on the skeleton
+        reassign_dict (dictionary): Skeleton joint name that each missing influence's weight moves to, missing
+            influences without an ancestor on the skeleton aren't included
+        vertex_count (int): Number of vertices on the combined mesh
+    '''
+    def __init__(self, part_list, skeleton_name_list = None):
+        self._part_list = tuple(part_list)
+
+        if skeleton_name_list is None:
+            skeleton_name_list = []
+            for part in self._part_list:
+                skeleton_name_list.extend([x for x in part.influence_list if x not in skeleton_name_list])
+        self._skeleton_dict = {}
+        for joint_name in skeleton_name_list:
+            self._skeleton_dict.setdefault(get_short_name(joint_name), joint_name)
+
+        # Only influences that carry weight are bound, the same result as removing unused influences after binding
+        used_name_set = set()
+        missing_name_list = []
+        self._reassign_dict = {}
+        for part in self._part_list:
+            influence_count = len(part.influence_list)
+            for influence_index, influence_name in enumerate(part.influence_list):
+                if any(part.weight_list[influence_index::influence_count]):
+                    short_name = get_short_name(influence_name)
+                    if short_name in self._skeleton_dict:
+                        used_name_set.add(short_name)
+                    elif influence_name not in missing_name_list:
+                        missing_name_list.append(influence_name)
+                        ancestor_list = [get_short_name(x) for x in get_ancestor_names(influence_name)]
+                        ancestor_name = next((x for x in ancestor_list if x in self._skeleton_dict), None)
+                        if ancestor_name:
+                            self._reassign_dict[influence_name] = self._skeleton_dict[ancestor_name]
+                            used_name_set.add(ancestor_name)
+
+        self._influence_list = tuple(self._skeleton_dict[x] for x in self._skeleton_dict if x in used_name_set)
+        self._missing_influence_list = tuple(missing_name_list)
+        self._vertex_count = sum([x.vertex_count for x in self._part_list])
+
+    @property
+    def part_list(self):
+        return self._part_list
+
+    @property
+    def influence_list(self):
+        return self._influence_list
+
+    @property
+    def missing_influence_list(self):
+        return self._missing_influence_list
+
+    @property
+    def reassign_dict(self):
+        return dict(self._reassign_dict)
+
+    @property
+    def vertex_count(self):
+        return self._vertex_count
+
+    def get_vertex_ranges(self):
+        '''
+        Find where each part's vertices land on the combined mesh
+
+        Returns:
+            list<tuple<int, int>>. (first, last) combined vertex index of each part, in part order
+        '''
+        range_list = []
+        first_vertex = 0
+        for part in self._part_list:
+            range_list.append((first_vertex, first_vertex + part.vertex_count - 1))
+            first_vertex += part.vertex_count
+        return range_list
+
+    def merge_weights(self):
+        '''
+        Merge every part's weights onto the unified influence list
+
+        Returns:
+            list<float>. Vertex-major weights for the combined mesh, vertex_count rows of len(influence_list) weights
+
+        Raises:
+            ValueError. If any weighted vertex is only weighted to missing influences with no ancestor on the skeleton,
+                since skinned with no weight it would collapse to the origin
+        '''
+        influence_count = len(self._influence_list)
+        unified_index_dict = {get_short_name(x): i for i, x in enumerate(self._influence_list)}
+
+        merged_weight_list = [0.0] * (self._vertex_count * influence_count)
+        orphan_list = []
+        row_start = 0
+        for part in self._part_list:
+            part_influence_count = len(part.influence_list)
+            index_map = []
+            for i, influence_name in enumerate(part.influence_list):
+                unified_name = get_short_name(self._reassign_dict.get(influence_name, influence_name))
+                if unified_name in unified_index_dict:
+                    index_map.append((i, unified_index_dict[unified_name]))
+
+            for vertex_index in range(part.vertex_count):
+                part_row = vertex_index * part_influence_count
+                row_total = 0.0
+                for part_index, unified_index in index_map:
+                    weight = part.weight_list[part_row + part_index]
+                    merged_weight_list[row_start + unified_index] += weight
+                    row_total += weight
+
+                if row_total > 0.0 and abs(row_total - 1.0) > 1e-6:
+                    for unified_index in range(row_start, row_start + influence_count):
+                        merged_weight_list[unified_index] /= row_total
+                elif row_total == 0.0 and any(part.weight_list[part_row:part_row + part_influence_count]):
+                    orphan_list.append("{0}.vtx[{1}]".format(part.name, vertex_index))
+                row_start += influence_count
+
+        if orphan_list:
+            raise ValueError("{0} vertices are only weighted to influences that aren't on the skeleton and have no "
+                             "ancestor on it, {1}".format(len(orphan_list), ", ".join(orphan_list[:10])))
+
+        return merged_weight_list
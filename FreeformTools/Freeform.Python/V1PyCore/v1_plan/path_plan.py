@@ -0,0 +1,59 @@
+'''
+Freeform Rigging and Animation Tools
+Copyright (C) 2020  Micah Zahm
+
+Freeform Rigging and Animation Tools is free software: you can redistribute it
+and/or modify it under the terms of the GNU General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Freeform Rigging and Animation Tools is distributed in the hope that it will
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Freeform Rigging and Animation Tools.
+If not, see <https://www.gnu.org/licenses/>.
+'''
+
+# Pure Python, this module must not import Maya so repaths can be planned and tested outside of Maya
+
+
+def get_root_relative_path(file_path, root_folder = "Data"):
+    '''
+    Trim a full file path so it starts at the root folder, ie. 'C:/Project/Data/Textures/a.png' becomes 'Data/Textures/a.png'.
+    The first folder named root_folder is used, and paths that already start with it are left alone
+
+    Args:
+        file_path (string): Full path to a file, with either '/' or '\\' separators
+        root_folder (string): Name of the folder paths should be relative to
+
+    Returns:
+        string. The path starting at root_folder with '/' separators, or None if the path doesn't need to change
+    '''
+    path_list = file_path.replace("\\", "/").split("/")
+    root_index = path_list.index(root_folder) if root_folder in path_list else 0
+    if root_index <= 0:
+        return None
+
+    return "/".join(path_list[root_index:])
+
+def get_root_relative_path_dict(path_list, root_folder = "Data"):
+    '''
+    Find the root relative path for every path that needs to change
+
+    Args:
+        path_list (list<string>): Full paths to files
+        root_folder (string): Name of the folder paths should be relative to
+
+    Returns:
+        dictionary<string, string>. New path keyed by the original path, only for paths that change
+    '''
+    path_dict = {}
+    for file_path in path_list:
+        new_path = get_root_relative_path(file_path, root_folder) if file_path else None
+        if new_path and new_path != file_path:
+            path_dict[file_path] = new_path
+
+    return path_dict
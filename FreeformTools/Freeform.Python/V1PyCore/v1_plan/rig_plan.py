@@ -0,0 +1,215 @@
+'''
+Freeform Rigging and Animation Tools
+Copyright (C) 2020  Micah Zahm
+
+Freeform Rigging and Animation Tools is free software: you can redistribute it
+and/or modify it under the terms of the GNU General Public License as published
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Freeform Rigging and Animation Tools is distributed in the hope that it will
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Freeform Rigging and Animation Tools.
+If not, see <https://www.gnu.org/licenses/>.
+'''
+
+# Pure Python, this module must not import Maya so rig files can be planned and validated outside of Maya
+
+import collections
+import json
+import types
+
+
+ComponentStep = collections.namedtuple('ComponentStep', ['side', 'region', 'type_name', 'data'])
+ComponentStep.__doc__ = '''
+Planned build of one rig component from a rig configuration file
+
+Attributes:
+    side (str): Side of the character the component builds on
+    region (str): Region of the character the component builds on
+    type_name (str): Registered name of the Rig_Component type
+    data (MappingProxyType): Read-only view of the json entry for the component
+'''
+
+AddonStep = collections.namedtuple('AddonStep', ['side', 'region', 'key', 'type_name', 'data', 'dependency_list'])
+AddonStep.__doc__ = '''
+Planned build of one addon component from a rig configuration file
+
+Attributes:
+    side (str): Side of the rig component the addon is applied to
+    region (str): Region of the rig component the addon is applied to
+    key (str): Name of the addon entry in the file
+    type_name (str): Registered name of the Addon_Component type
+    data (MappingProxyType): Read-only view of the json entry for the addon
+    dependency_list (tuple<tuple<str, str>>): Every (side, region) rig component that must be built before the addon
+'''
+
+
+def parse_target_region(target_data):
+    '''
+    Find the rig component region an addon target string points at, matching how rig_base.ControlInfo.parse_string
+    reads the first target.  Skeleton joints and scene objects don't need a rig component built
+
+    Args:
+        target_data (str): Single target entry from an addon 'target_data' string, 'side;region;type;index'
+
+    Returns:
+        tuple<str, str>. (side, region) of the rig component, or None if the target isn't a rig control
+    '''
+    target_info_list = target_data.split(';')
+    if len(target_info_list) != 4:
+        return None
+    return (target_info_list[0], target_info_list[1])
+
+def get_addon_dependencies(side, region, addon_dict):
+    '''
+    Find every rig component an addon needs before it can be built, the component it's applied to and the
+    component of any rig control it uses as an object space
+
+    Args:
+        side (str): Side of the rig component the addon is applied to
+        region (str): Region of the rig component the addon is applied to
+        addon_dict (dictionary): The json dictionary entry for the addon
+
+    Returns:
+        tuple<tuple<str, str>>. Ordered (side, region) of every required rig component
+    '''
+    dependency_list = [(side, region)]
+
+    target_type_list = addon_dict.get('target_type', '').split(',')
+    target_data_list = addon_dict.get('target_data', '').split(',')
+    for target_type, target_data in zip(target_type_list, target_data_list):
+        target_region = parse_target_region(target_data) if target_type == 'ctrl' else None
+        if target_region and target_region not in dependency_list:
+            dependency_list.append(target_region)
+
+    # The first target decides whether load_from_json waits on a rig control, so include it even if the type wasn't saved
+    first_target = parse_target_region(target_data_list[0]) if target_data_list else None
+    if first_target and first_target not in dependency_list:
+        dependency_list.append(first_target)
+
+    return tuple(dependency_list)
+
+
+class RigBuildPlan(object):
+    '''
+    Immutable build plan for a rig configuration file.  Planning parses the whole file up front, filters it by
+    side and region, orders the build and finds the dependencies between addons and the rig components they
+    need, so the file can be checked before anything is built in the scene.  rigging.file_ops.load_from_json
+    executes the plan
+
+    Args:
+        rig_data (dictionary): Parsed rig configuration json file, with 'rigging' and 'addons' entries
+        side_filter (list<str>): If given, only plan components on these sides
+        region_filter (list<str>): If given, only plan components in these regions
+
+    Attributes:
+        component_list (tuple<ComponentStep>): Rig components in build order
+        addon_list (tuple<AddonStep>): Addon components in build order, after all rig components
+        required_regions (frozenset<tuple<str, str>>): Every (side, region) the plan needs on the skeleton
+    '''
+    @classmethod
+    def from_file(cls, file_path, side_filter = None, region_filter = None):
+        '''
+        Plan a rig configuration json file
+
+        Args:
+            file_path (str): Full file path to the rig configuration json file
+            side_filter (list<str>): If given, only plan components on these sides
+            region_filter (list<str>): If given, only plan components in these regions
+
+        Returns:
+            RigBuildPlan. The build plan for the file
+        '''
+        with open(file_path, 'r') as data_file:
+            rig_data = json.load(data_file)
+        return cls(rig_data, side_filter, region_filter)
+
+
+    def __init__(self, rig_data, side_filter = None, region_filter = None):
+        component_list = []
+        for side, region_dict in rig_data.get('rigging', {}).items():
+            if side_filter and side not in side_filter:
+                continue
+            for region, component_dict in region_dict.items():
+                if region_filter and region not in region_filter:
+                    continue
+                component_list.append(ComponentStep(side, region, component_dict['type'], types.MappingProxyType(component_dict)))
+
+        addon_list = []
+        for side, region_dict in rig_data.get('addons', {}).items():
+            if side_filter and side not in side_filter:
+                continue
+            for region, addon_type_dict in region_dict.items():
+                if region_filter and region not in region_filter:
+                    continue
+                for key, addon_dict in addon_type_dict.items():
+                    addon_list.append(AddonStep(side, region, key, addon_dict['type'], types.MappingProxyType(addon_dict),
+                                                get_addon_dependencies(side, region, addon_dict)))
+
+        self._component_list = tuple(component_list)
+        self._addon_list = tuple(addon_list)
+        self._required_regions = frozenset((x.side, x.region) for x in component_list)
+
+    @property
+    def component_list(self):
+        return self._component_list
+
+    @property
+    def addon_list(self):
+        return self._addon_list
+
+    @property
+    def required_regions(self):
+        return self._required_regions
+
+    def get_missing_dependencies(self, addon_step, built_regions = None):
+        '''
+        Find the rig components an addon needs that won't be built
+
+        Args:
+            addon_step (AddonStep): The planned addon to check
+            built_regions (set<tuple<str, str>>): (side, region) of the rig components that were built, if None
+                every rig component in the plan is assumed to build
+
+        Returns:
+            list<tuple<str, str>>. (side, region) of each missing rig component
+        '''
+        built_regions = self._required_regions if built_regions is None else built_regions
+        return [x for x in addon_step.dependency_list if x not in built_regions]
+
+    def validate(self, skeleton_regions = None, component_types = None, addon_types = None):
+        '''
+        Check the plan for anything that would be skipped or fail when it's built.  Each check only runs if
+        the information for it is given
+
+        Args:
+            skeleton_regions (set<tuple<str, str>>): Every (side, region) marked up on the target skeleton
+            component_types (set<str>): Names of every registered Rig_Component type
+            addon_types (set<str>): Names of every registered Addon_Component type
+
+        Returns:
+            list<str>. A message for every problem found, empty if the plan is valid
+        '''
+        error_list = []
+        for step in self._component_list:
+            if skeleton_regions is not None and (step.side, step.region) not in skeleton_regions:
+                error_list.append("{0} {1} - Region not found on skeleton".format(step.side, step.region))
+            if component_types is not None and step.type_name not in component_types:
+                error_list.append("{0} {1} - Unknown component type {2}".format(step.side, step.region, step.type_name))
+
+        built_regions = self._required_regions
+        if skeleton_regions is not None:
+            built_regions = built_regions.intersection(skeleton_regions)
+
+        for step in self._addon_list:
+            if addon_types is not None and step.type_name not in addon_types:
+                error_list.append("{0} {1} {2} - Unknown addon type {3}".format(step.side, step.region, step.key, step.type_name))
+            for side, region in self.get_missing_dependencies(step, built_regions):
+                error_list.append("{0} {1} {2} - Requires {3} {4} which won't be built".format(step.side, step.region, step.key, side, region))
+
+        return error_list
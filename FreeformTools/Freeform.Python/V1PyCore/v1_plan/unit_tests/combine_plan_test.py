@@ -0,0 +1,75 @@
+'''
+Freeform Rigging and Animation Tools
+Copyright (C) 2020  Micah Zahm
+
+Freeform Rigging and Animation Tools is free software: you can redistribute it 
+and/or modify it under the terms of the GNU General Public License as published 
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Freeform Rigging and Animation Tools is distributed in the hope that it will 
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Freeform Rigging and Animation Tools.  
+If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import unittest
+
+from v1_plan import combine_plan
+
+
+SKELETON = ['char:root', 'char:pelvis', 'char:spine', 'char:head', 'char:hand_l']
+
+TORSO = combine_plan.CombinePart('torso', ['a:root|a:pelvis', 'a:spine', 'a:hand_l'], [0.5, 0.5, 0.0,
+																					   0.0, 1.0, 0.0], 2)
+HEAD = combine_plan.CombinePart('head', ['b:head', 'b:spine', 'b:head|b:hat'], [1.0, 0.0, 0.0,
+																	   0.25, 0.25, 0.5,
+																	   0.0, 0.0, 1.0], 3)
+
+
+class CombinePlanTest(unittest.TestCase):
+
+	def test_influences(self):
+		plan = combine_plan.CombinePlan([TORSO, HEAD], SKELETON)
+		# Skeleton order, only joints carrying weight
+		self.assertEqual(plan.influence_list, ('char:pelvis', 'char:spine', 'char:head'))
+		self.assertEqual(plan.missing_influence_list, ('b:head|b:hat',))
+		self.assertEqual(plan.reassign_dict, {'b:head|b:hat': 'char:head'})
+		self.assertEqual(plan.vertex_count, 5)
+
+	def test_vertex_ranges(self):
+		plan = combine_plan.CombinePlan([TORSO, HEAD], SKELETON)
+		self.assertEqual(plan.get_vertex_ranges(), [(0, 1), (2, 4)])
+
+	def test_merge_weights(self):
+		plan = combine_plan.CombinePlan([TORSO, HEAD], SKELETON)
+		weight_list = plan.merge_weights()
+		self.assertEqual(len(weight_list), plan.vertex_count * len(plan.influence_list))
+
+		row_list = [weight_list[i:i+3] for i in range(0, len(weight_list), 3)]
+		self.assertEqual(row_list[0], [0.5, 0.5, 0.0])
+		self.assertEqual(row_list[1], [0.0, 1.0, 0.0])
+		self.assertEqual(row_list[2], [0.0, 0.0, 1.0])
+		# Weight on the missing hat joint moves to its parent head joint
+		self.assertEqual(row_list[3], [0.0, 0.25, 0.75])
+		self.assertEqual(row_list[4], [0.0, 0.0, 1.0])
+
+	def test_orphaned_weights(self):
+		# Missing joints without an ancestor on the skeleton are dropped and the vertex re-normalized
+		part = combine_plan.CombinePart('hat', ['c:head', 'c:hat'], [0.5, 0.5,
+																	 0.0, 1.0], 2)
+		plan = combine_plan.CombinePlan([part], SKELETON)
+		self.assertEqual(plan.reassign_dict, {})
+		# A vertex only weighted to them would be left unweighted
+		with self.assertRaises(ValueError):
+			plan.merge_weights()
+
+	def test_no_skeleton(self):
+		plan = combine_plan.CombinePlan([TORSO, HEAD])
+		self.assertEqual(plan.influence_list, ('a:root|a:pelvis', 'a:spine', 'b:head', 'b:head|b:hat'))
+		self.assertEqual(plan.missing_influence_list, ())
+		self.assertEqual(sum(plan.merge_weights()), 5.0)
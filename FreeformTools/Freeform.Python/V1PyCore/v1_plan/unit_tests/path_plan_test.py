@@ -0,0 +1,37 @@
+'''
+Freeform Rigging and Animation Tools
+Copyright (C) 2020  Micah Zahm
+
+Freeform Rigging and Animation Tools is free software: you can redistribute it 
+and/or modify it under the terms of the GNU General Public License as published 
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Freeform Rigging and Animation Tools is distributed in the hope that it will 
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Freeform Rigging and Animation Tools.  
+If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import unittest
+
+from v1_plan import path_plan
+
+
+class PathPlanTest(unittest.TestCase):
+
+	def test_root_relative_path(self):
+		self.assertEqual(path_plan.get_root_relative_path("C:\\Project\\Data\\Textures\\a.png"), "Data/Textures/a.png")
+		self.assertEqual(path_plan.get_root_relative_path("C:/Project/Data/Characters/Data/b.ma"), "Data/Characters/Data/b.ma")
+
+	def test_root_relative_path_unchanged(self):
+		self.assertIsNone(path_plan.get_root_relative_path("Data/Textures/a.png"))
+		self.assertIsNone(path_plan.get_root_relative_path("C:/Project/Textures/a.png"))
+
+	def test_root_relative_path_dict(self):
+		path_list = ["C:/Project/Data/a.png", "Data/b.png", "", "C:/Project/Data/a.png"]
+		self.assertEqual(path_plan.get_root_relative_path_dict(path_list), {"C:/Project/Data/a.png": "Data/a.png"})
@@ -0,0 +1,66 @@
+'''
+Freeform Rigging and Animation Tools
+Copyright (C) 2020  Micah Zahm
+
+Freeform Rigging and Animation Tools is free software: you can redistribute it 
+and/or modify it under the terms of the GNU General Public License as published 
+by the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+Freeform Rigging and Animation Tools is distributed in the hope that it will 
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Freeform Rigging and Animation Tools.  
+If not, see <https://www.gnu.org/licenses/>.
+'''
+
+import unittest
+
+from v1_plan import rig_plan
+
+
+RIG_DATA = {
+	'rigging': {
+		'left': {'arm': {'type': 'FK'}, 'leg': {'type': 'IK'}},
+		'center': {'spine': {'type': 'FK'}},
+	},
+	'addons': {
+		'left': {'arm': {'Position_Overdriver_0': {'type': 'Position_Overdriver', 'target_type': 'ctrl', 'target_data': 'center;spine;fk;0'}}},
+		'center': {'spine': {'Aim_0': {'type': 'Aim', 'target_type': 'joint', 'target_data': 'left;leg;1'}}},
+	},
+}
+
+
+class RigPlanTest(unittest.TestCase):
+
+	def test_plan_order(self):
+		plan = rig_plan.RigBuildPlan(RIG_DATA)
+		self.assertEqual([(x.side, x.region) for x in plan.component_list], [('left', 'arm'), ('left', 'leg'), ('center', 'spine')])
+		self.assertEqual(plan.required_regions, frozenset([('left', 'arm'), ('left', 'leg'), ('center', 'spine')]))
+
+	def test_plan_filter(self):
+		plan = rig_plan.RigBuildPlan(RIG_DATA, side_filter = ['left'])
+		self.assertEqual([x.region for x in plan.component_list], ['arm', 'leg'])
+		self.assertEqual([x.key for x in plan.addon_list], ['Position_Overdriver_0'])
+
+	def test_addon_dependencies(self):
+		plan = rig_plan.RigBuildPlan(RIG_DATA)
+		addon_dict = {x.key: x for x in plan.addon_list}
+		self.assertEqual(addon_dict['Position_Overdriver_0'].dependency_list, (('left', 'arm'), ('center', 'spine')))
+		# Skeleton joint targets don't need a rig component
+		self.assertEqual(addon_dict['Aim_0'].dependency_list, (('center', 'spine'),))
+
+	def test_validate(self):
+		plan = rig_plan.RigBuildPlan(RIG_DATA, side_filter = ['left'])
+		# The addon targets a control on center spine, which the side filter removed
+		self.assertEqual(len(plan.validate()), 1)
+		# Nothing on the skeleton or registered, both components fail twice and the addon is missing both dependencies
+		self.assertEqual(len(plan.validate(skeleton_regions = set(), component_types = set(), addon_types = set())), 7)
+
+	def test_plan_is_read_only(self):
+		plan = rig_plan.RigBuildPlan(RIG_DATA)
+		with self.assertRaises(TypeError):
+			plan.component_list[0].data['type'] = 'IK'
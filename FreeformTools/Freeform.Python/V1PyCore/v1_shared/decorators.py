@@ -17,6 +17,7 @@ along with Freeform Rigging and Animation Tools.
 If not, see <https://www.gnu.org/licenses/>.
 '''
 
+import logging
 import sys
 import traceback
 from functools import wraps
@@ -29,6 +30,20 @@ import v1_core
 class DecoratorManager(object):
     pre_ui_call_method_list = []
     post_ui_call_method_list = []
+    process_tag = None
+
+    @staticmethod
+    def get_process_tag():
+        '''
+        Get the process name and id to tag UI call logs with, read from the process once
+
+        Returns:
+            str. "<process name> - <process id>"
+        '''
+        if DecoratorManager.process_tag is None:
+            process = System.Diagnostics.Process.GetCurrentProcess()
+            DecoratorManager.process_tag = "{0} - {1}".format(process.ProcessName, process.Id)
+        return DecoratorManager.process_tag
 
 
 def csharp_error_catcher(catch_method):
@@ -48,9 +63,11 @@ def csharp_error_catcher(catch_method):
             for method in DecoratorManager.pre_ui_call_method_list:
                 method()
 
-            print_args = [x for x in args if (not type(x) == dict) and (not type(x) == list)]
-            process = System.Diagnostics.Process.GetCurrentProcess()
-            v1_core.v1_logging.get_logger().debug("{0} - {1} - UI ---> {2}.{3} ~~ Args:{4} Kwargs:{5}".format(process.ProcessName, process.Id, catch_method.__module__, catch_method.__name__, print_args, kwargs))
+            # Only build the message when debug logging is on, arguments are formatted by the logger
+            logger = v1_core.v1_logging.get_logger()
+            if logger.isEnabledFor(logging.DEBUG):
+                print_args = [x for x in args if (not type(x) == dict) and (not type(x) == list)]
+                logger.debug("%s - UI ---> %s.%s ~~ Args:%s Kwargs:%s", DecoratorManager.get_process_tag(), catch_method.__module__, catch_method.__name__, print_args, kwargs)
             catch_method(*args, **kwargs)
         except Exception:
             exception_info = sys.exc_info()
@@ -105,9 +105,8 @@ class ContentBrowser(object):
             self.import_and_combine(vm, event_args)
         else:
             path_list = [x.ItemPath for x in event_args.FilePathList]
-            for file_path in path_list:
-                maya_utils.scene_utils.import_file_safe(file_path, fbx_mode="add", tag_imported=True, 
-                                                        load_properties=event_args.Load, returnNewNodes=True)
+            maya_utils.scene_utils.import_files_safe(path_list, fbx_mode="add", tag_imported=True, 
+                                                     load_properties=event_args.Load, returnNewNodes=True)
 
     @csharp_error_catcher
     def import_and_combine(self, vm, event_args):